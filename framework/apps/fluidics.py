@@ -78,7 +78,7 @@ class Fluidics:
         """
         cls.sim = sim
         return cls(
-            FluidicsCan(sim.can_node),
+            FluidicsCan(sim.can_node, sim.timer_engine),
             FluButtons(sim.hw_board),
             sim.hw_board,
             sim.async_interface,
@@ -11,6 +11,8 @@
 #   - Access to FootSwitchCAN class.
 # - Treadle module (local)
 #   - Access to Treadle class.
+# - PinTransaction module (local)
+#   - Access to PinTransaction class.
 # - FswButtons module (local)
 #   - Access to FswButtons class.
 # - Leds module (local)
@@ -49,6 +51,7 @@ from framework.simulators.footswitch_simulator import FootSwitchSimulator
 from framework.core.boards.fsw.hw_board import HwBoard
 from framework.core.components.leds import Leds
 from framework.core.components.treadle import Treadle
+from framework.core.peripherals.pin_transaction import PinTransaction
 from framework.support.vtime import vtime_manager
 from framework.hardware_interfaces.drivers.common.async_interface_driver import (
     AsyncInterfaceDriver,
@@ -81,27 +84,28 @@ class FootSwitch:
         self.position = position
         self.modem = modem
 
-        self.buttons.left_vertical.release_button()
-        self.buttons.left_horizontal.release_button()
-        self.buttons.right_horizontal.release_button()
-        self.buttons.right_vertical.release_button()
-        self.buttons.left_heel.release_button()
-        self.buttons.right_heel.release_button()
-        self._board.broken_spring.state = False
-        self.treadle.up()
+        with self._pin_transaction():
+            self.buttons.left_vertical.release_button()
+            self.buttons.left_horizontal.release_button()
+            self.buttons.right_horizontal.release_button()
+            self.buttons.right_vertical.release_button()
+            self.buttons.left_heel.release_button()
+            self.buttons.right_heel.release_button()
+            self._board.broken_spring.state = False
+            self.treadle.up()
 
-        self._board.cable_in.state = False
-        self._board.vchgdt.state = False
-        self._board.cable_voltage.voltage = 0.0
+            self._board.cable_in.state = False
+            self._board.vchgdt.state = False
+            self._board.cable_voltage.voltage = 0.0
 
-        self._board.coil_mon.state = False  # no wireless charger
-        self._board.vcoil_pg.state = False  # no wireless charger voltage
-        self._board.vchgdt.state = False  # no cable or wireless charger
-        self._board.bl654_tx.state = False
-        self._board.bl654_ready_n.state = False  # Ready
-        self._board.bl654_busy.state = False  # Ready
-        self._board.pd_shroud_up2.state = True  # TODO: implement shroud detection
-        self._board.pd_shroud_up1.state = True  # TODO: implement shroud detection
+            self._board.coil_mon.state = False  # no wireless charger
+            self._board.vcoil_pg.state = False  # no wireless charger voltage
+            self._board.vchgdt.state = False  # no cable or wireless charger
+            self._board.bl654_tx.state = False
+            self._board.bl654_ready_n.state = False  # Ready
+            self._board.bl654_busy.state = False  # Ready
+            self._board.pd_shroud_up2.state = True  # TODO: implement shroud detection
+            self._board.pd_shroud_up1.state = True  # TODO: implement shroud detection
 
     def connect(self) -> None:
         """
@@ -110,9 +114,10 @@ class FootSwitch:
         This method sets the state of the cable_in and vchgdt attributes of the board to True,
         and sets the cable_voltage to 24.0, indicating that the FootSwitch is connected to the power source.
         """
-        self._board.cable_in.state = True
-        self._board.vchgdt.state = True
-        self._board.cable_voltage.voltage = 24.0
+        with self._pin_transaction():
+            self._board.cable_in.state = True
+            self._board.vchgdt.state = True
+            self._board.cable_voltage.voltage = 24.0
 
     def disconnect(self) -> None:
         """
@@ -121,9 +126,16 @@ class FootSwitch:
         This method sets the state of the cable_in and vchgdt attributes of the board to False,
         and sets the cable_voltage to 0.0, indicating that the FootSwitch is disconnected from the power source.
         """
-        self._board.cable_in.state = False
-        self._board.vchgdt.state = False
-        self._board.cable_voltage.voltage = 0.0
+        with self._pin_transaction():
+            self._board.cable_in.state = False
+            self._board.vchgdt.state = False
+            self._board.cable_voltage.voltage = 0.0
+
+    def _pin_transaction(self) -> PinTransaction:
+        """
+        ! Transaction committing pin and ADC changes of the board as one update.
+        """
+        return PinTransaction(self._board.pins_drv, self._board.adc_driver)
 
     @classmethod
     def create_from_sim(cls, sim: FootSwitchSimulator) -> "FootSwitch":
@@ -135,7 +147,7 @@ class FootSwitch:
         @return FootSwitch  The newly created FootSwitch instance.
         """
         return cls(
-            FootSwitchCAN(sim.can_node),
+            FootSwitchCAN(sim.can_node, sim.timer_engine),
             Treadle(sim.hw_board, sim.encoder, sim.motor_dac),
             FswButtons(sim.hw_board),
             Leds(sim.pins, sim.led_driver_adp8866),
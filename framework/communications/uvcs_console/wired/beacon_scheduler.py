@@ -0,0 +1,164 @@
+import dataclasses
+import itertools
+import threading
+from typing import TYPE_CHECKING, Callable, Sequence
+
+from framework.support.vtime import TimerEngine, idle_worker
+
+if TYPE_CHECKING:
+    from framework.communications.uvcs_console.wired.wiredconn import TxMsg
+
+
+@dataclasses.dataclass(eq=False)
+class _BeaconSet:
+    """
+    Beacons transmitted together with common period.
+    """
+
+    period_us: int
+    beacons: tuple["TxMsg", ...]
+    timer_id: int = 0
+    removed: bool = False
+    transmitter: threading.Thread | None = None
+    idle: threading.Event = dataclasses.field(default_factory=threading.Event)
+
+    def __post_init__(self) -> None:
+        self.idle.set()
+
+
+class BeaconScheduler:
+    """
+    Periodic transmitter of beacon sets driven by the virtual clock.
+
+    Each beacon set has its own period and phase offset. All sets are executed as timers of one
+    `TimerEngine`, so no worker is spawned per set and the virtual clock is advanced directly to the next
+    transmission. Beacons and period of a set can be replaced while it is scheduled, the change is
+    applied from the next transmission. Removing a set waits for its transmission in progress, so no beacon
+    of the set is sent after `remove` returns. The worker of the own engine is stopped by `close`.
+    """
+
+    def __init__(
+        self,
+        send: Callable[["TxMsg"], None],
+        engine: TimerEngine | None = None,
+    ) -> None:
+        """
+        Create the scheduler.
+
+        Args:
+            send (Callable[[TxMsg], None]): Function transmitting one beacon (e.g. `WiredConn.send_config`).
+            engine (TimerEngine, optional): Engine executing the transmissions. Defaults to own engine.
+        """
+        self._send = send
+        self._engine = engine if engine is not None else TimerEngine()
+        self._owns_engine = engine is None
+        self._sets: dict[int, _BeaconSet] = {}
+        self._set_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def add(self, period: float, beacons: Sequence["TxMsg"], phase: float = 0.0) -> int:
+        """
+        Schedule a beacon set.
+
+        Args:
+            period (float): The period in seconds.
+            beacons (Sequence[TxMsg]): The beacons, transmitted in the given order.
+            phase (float, optional): Delay of the first transmission in seconds. Defaults to 0.0
+                (first transmission is immediate).
+
+        Returns:
+            int: ID of the beacon set.
+        """
+        beacon_set = _BeaconSet(period_us=_to_us(period), beacons=tuple(beacons))
+        with self._lock:
+            set_id = next(self._set_ids)
+            self._sets[set_id] = beacon_set
+            beacon_set.timer_id = self._engine.add_timer(
+                lambda: beacon_set.period_us,
+                lambda: self._transmit(beacon_set),
+                delay_us=_to_us(phase),
+            )
+        return set_id
+
+    def update(
+        self,
+        set_id: int,
+        beacons: Sequence["TxMsg"] | None = None,
+        period: float | None = None,
+    ) -> None:
+        """
+        Replace beacons or period of a scheduled set without rescheduling it.
+
+        Args:
+            set_id (int): ID of the beacon set.
+            beacons (Sequence[TxMsg], optional): New beacons. Defaults to None (unchanged).
+            period (float, optional): New period in seconds. Defaults to None (unchanged).
+        """
+        beacon_set = self._sets[set_id]
+        if beacons is not None:
+            beacon_set.beacons = tuple(beacons)
+        if period is not None:
+            beacon_set.period_us = _to_us(period)
+
+    def remove(self, set_id: int) -> None:
+        """
+        Stop transmission of a beacon set.
+
+        Waits for the transmission of the set in progress unless called from the transmission itself.
+
+        Args:
+            set_id (int): ID of the beacon set.
+        """
+        with self._lock:
+            beacon_set = self._sets.pop(set_id, None)
+            if beacon_set is None:
+                return
+            beacon_set.removed = True
+            self._engine.remove_timer(beacon_set.timer_id)
+        if beacon_set.transmitter is not threading.current_thread():
+            with idle_worker():
+                beacon_set.idle.wait()
+
+    def clear(self) -> None:
+        """
+        Stop transmission of all beacon sets.
+        """
+        for set_id in list(self._sets):
+            self.remove(set_id)
+
+    def close(self) -> None:
+        """
+        Stop transmission of all beacon sets and the worker of the own engine.
+        """
+        self.clear()
+        if self._owns_engine:
+            self._engine.stop()
+
+    def get_num_of_sets(self) -> int:
+        """
+        Get number of scheduled beacon sets.
+        """
+        return len(self._sets)
+
+    def _transmit(self, beacon_set: _BeaconSet) -> None:
+        """
+        Transmit all beacons of the set.
+        """
+        with self._lock:
+            if beacon_set.removed:
+                return
+            beacon_set.idle.clear()
+            beacon_set.transmitter = threading.current_thread()
+        try:
+            for beacon in beacon_set.beacons:
+                self._send(beacon)
+        finally:
+            beacon_set.transmitter = None
+            beacon_set.idle.set()
+
+
+def _to_us(seconds: float) -> int:
+    """
+    Convert seconds to microseconds.
+    """
+    return int(round(seconds * 1_000_000))
@@ -0,0 +1,264 @@
+import threading
+import weakref
+from collections import deque
+from typing import Any, Callable, Iterable, NamedTuple
+
+from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
+    CanBus,
+    CanMessage,
+)
+from framework.support.reports import logger
+from framework.support.vtime import TimeEvent, VirtualTimeWorker, vtime_manager
+
+
+class ReceivedFrame(NamedTuple):
+    """
+    Frame received by `CanDemux` with its message decoded by the decoder of its arbitration ID.
+    """
+
+    msg: CanMessage
+    message: Any  # None if no decoder is registered or decoding failed
+
+
+Decoder = Callable[[bytes], Any]
+Subscriber = Callable[[ReceivedFrame], None]
+
+
+class CanDemux:
+    """
+    Receiver demultiplexing frames of one CAN bus into per-arbitration-ID streams.
+
+    Frames are drained from the bus by a background worker running while anyone waits for a frame or
+    is subscribed. Each frame is decoded once by the decoder registered for its arbitration ID and
+    appended to a bounded ring buffer of the ID, so a frame received while another stream is awaited
+    is kept for its own consumer instead of being discarded. Waiters wait (idle in virtual time) only
+    until a frame is routed to one of their streams or their timeout expires. Subscribers are called
+    from the worker with every frame of their arbitration ID.
+
+    Use `CanDemux.for_bus` to get the receiver shared by all connections of a bus.
+    """
+
+    DEFAULT_DEPTH = 64
+    # Receive timeout of the drain worker in seconds, bounds the time the worker lingers without consumers
+    POLL_INTERVAL = 0.1
+
+    _instances: "weakref.WeakKeyDictionary[CanBus, CanDemux]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _instances_lock = threading.Lock()
+
+    def __init__(self, bus: CanBus, depth: int = DEFAULT_DEPTH):
+        """
+        Create the receiver.
+
+        Args:
+            bus (CanBus): The CAN bus.
+            depth (int, optional): Maximum number of frames kept per arbitration ID, the oldest
+                frames are dropped first. Defaults to DEFAULT_DEPTH.
+        """
+        self._bus = bus
+        self._depth = depth
+        self._lock = threading.Lock()
+        self._streams: dict[int, deque[ReceivedFrame]] = {}
+        self._waiters: dict[int, list[TimeEvent]] = {}
+        self._subscribers: dict[int, list[Subscriber]] = {}
+        self._decoders: dict[int, Decoder] = {}
+        self._worker: VirtualTimeWorker | None = None
+
+    @classmethod
+    def for_bus(cls, bus: CanBus) -> "CanDemux":
+        """
+        Get the receiver of the bus, it is created on the first call.
+
+        Args:
+            bus (CanBus): The CAN bus.
+
+        Returns:
+            CanDemux: The receiver shared by all users of the bus.
+        """
+        with cls._instances_lock:
+            demux = cls._instances.get(bus)
+            if demux is None:
+                demux = cls._instances[bus] = cls(bus)
+            return demux
+
+    def register_decoder(self, arbitration_id: int, decoder: Decoder) -> None:
+        """
+        Decode frames of the arbitration ID by the decoder. The first registered decoder is kept.
+
+        Args:
+            arbitration_id (int): The arbitration ID.
+            decoder (Decoder): The function decoding frame data.
+        """
+        with self._lock:
+            self._decoders.setdefault(arbitration_id, decoder)
+
+    def subscribe(self, arbitration_id: int, callback: Subscriber) -> None:
+        """
+        Call the callback with every received frame of the arbitration ID.
+
+        The callback is called from the drain worker, it must not wait for other frames.
+
+        Args:
+            arbitration_id (int): The arbitration ID.
+            callback (Subscriber): The callback.
+        """
+        with self._lock:
+            self._subscribers.setdefault(arbitration_id, []).append(callback)
+            self._start_worker()
+
+    def unsubscribe(self, arbitration_id: int, callback: Subscriber) -> None:
+        """
+        Remove the callback registered by `subscribe`.
+
+        Args:
+            arbitration_id (int): The arbitration ID.
+            callback (Subscriber): The callback.
+        """
+        with self._lock:
+            subscribers = self._subscribers.get(arbitration_id, [])
+            if callback in subscribers:
+                subscribers.remove(callback)
+
+    def pending(self, arbitration_id: int) -> int:
+        """
+        Get number of frames of the arbitration ID waiting in its stream.
+
+        Args:
+            arbitration_id (int): The arbitration ID.
+
+        Returns:
+            int: The number of frames.
+        """
+        with self._lock:
+            return len(self._streams.get(arbitration_id, ()))
+
+    def get(
+        self, arbitration_ids: Iterable[int], timeout: int | float = 0.5
+    ) -> ReceivedFrame | None:
+        """
+        Get the oldest frame of any of the arbitration IDs.
+
+        Args:
+            arbitration_ids (Iterable[int]): The awaited arbitration IDs.
+            timeout (int | float, optional): The timeout in seconds, a pending frame is returned
+                without waiting if it is not positive. Defaults to 0.5.
+
+        Returns:
+            ReceivedFrame | None: The frame or None if no frame was received within the timeout.
+        """
+        ids = tuple(arbitration_ids)
+        end_time_us = vtime_manager.time_us() + int(timeout * 1_000_000)
+        event = TimeEvent()
+        while True:
+            with self._lock:
+                event.clear()
+                frame = self._pop(ids)
+                remaining_us = end_time_us - vtime_manager.time_us()
+                if frame is not None or remaining_us <= 0:
+                    return frame
+                self._add_waiter(ids, event)
+                self._start_worker()
+            try:
+                event.wait(remaining_us / 1_000_000)
+            finally:
+                with self._lock:
+                    self._remove_waiter(ids, event)
+
+    def clear(self) -> None:
+        """
+        Drop all frames kept in the streams.
+        """
+        with self._lock:
+            self._streams.clear()
+
+    def _start_worker(self) -> None:
+        """
+        Start the drain worker if it is not running (the lock has to be held).
+        """
+        if self._worker is None:
+            self._worker = VirtualTimeWorker(
+                target=self._drain, daemon=True, name="CanDemux"
+            )
+            self._worker.start()
+
+    def _has_consumers(self) -> bool:
+        """
+        Check whether anyone waits for a frame or is subscribed (the lock has to be held).
+        """
+        return any(self._waiters.values()) or any(self._subscribers.values())
+
+    def _drain(self) -> None:
+        """
+        Receive frames from the bus and route them to their streams while there are consumers.
+        """
+        while True:
+            with self._lock:
+                if not self._has_consumers():
+                    self._worker = None
+                    return
+            try:
+                msg = self._bus.recv(timeout=self.POLL_INTERVAL)
+            except TimeoutError:
+                continue
+            except Exception as err:  # pylint: disable=broad-except
+                logger.error(f"CAN receive failed, draining stopped ({err!r})")
+                with self._lock:
+                    self._worker = None
+                return
+            if msg is not None:
+                self._route(msg)
+
+    def _route(self, msg: CanMessage) -> None:
+        """
+        Decode the frame, append it to its stream, wake up its waiters and call its subscribers.
+
+        Args:
+            msg (CanMessage): The received frame.
+        """
+        decoder = self._decoders.get(msg.arbitration_id)
+        message = None
+        if decoder is not None:
+            try:
+                message = decoder(msg.data)
+            except Exception as err:  # pylint: disable=broad-except
+                logger.error(
+                    f"Cannot parse message({msg.arbitration_id}) {bytes(msg.data).hex()} ({err!r})."
+                )
+        frame = ReceivedFrame(msg, message)
+        with self._lock:
+            stream = self._streams.get(msg.arbitration_id)
+            if stream is None:
+                stream = self._streams[msg.arbitration_id] = deque(maxlen=self._depth)
+            stream.append(frame)
+            for waiter in self._waiters.get(msg.arbitration_id, ()):
+                waiter.set()
+            subscribers = tuple(self._subscribers.get(msg.arbitration_id, ()))
+        for callback in subscribers:
+            callback(frame)
+
+    def _pop(self, ids: tuple[int, ...]) -> ReceivedFrame | None:
+        """
+        Remove the oldest frame of the first non-empty stream (the lock has to be held).
+        """
+        for arbitration_id in ids:
+            stream = self._streams.get(arbitration_id)
+            if stream:
+                return stream.popleft()
+        return None
+
+    def _add_waiter(self, ids: tuple[int, ...], event: TimeEvent) -> None:
+        """
+        Register the event to be set when a frame of the arbitration IDs arrives (the lock has to be held).
+        """
+        for arbitration_id in ids:
+            self._waiters.setdefault(arbitration_id, []).append(event)
+
+    def _remove_waiter(self, ids: tuple[int, ...], event: TimeEvent) -> None:
+        """
+        Unregister the event registered by `_add_waiter` (the lock has to be held).
+        """
+        for arbitration_id in ids:
+            waiters = self._waiters.get(arbitration_id, [])
+            if event in waiters:
+                waiters.remove(event)
@@ -13,12 +13,19 @@ from framework.communications.uvcs_footswitch.msg_types.real_time_status_msgs im
     StatusMsg211,
     StatusMsg212,
 )
+from framework.communications.uvcs_console.wired.beacon_scheduler import (
+    BeaconScheduler,
+)
+from framework.communications.uvcs_console.wired.can_demux import (
+    CanDemux,
+    ReceivedFrame,
+)
 from framework.support.reports import logger
 from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
     CanBus,
     CanMessage,
 )
-from framework.support.vtime import vtime_manager
+from framework.support.vtime import TimerEngine, vtime_manager
 from framework.communications.uvcs_footswitch.msg_types.level_sensor_controller import (
     BarcodeReaderScanReply,
 )
@@ -62,10 +69,41 @@ class WiredConn:
 
     The protocol defined in `UVCS Console Software Communication
     Specification - Footswitch` section `Controller Area Network (CAN) – Footswitch`
+
+    Received frames are demultiplexed by arbitration ID (see `CanDemux`) and decoded once by the
+    `UNPACKERS`, awaiting a message type only consumes frames of the arbitration IDs mapped to the type.
+    Periodic configuration messages are transmitted by the `beacons` scheduler.
     """
 
-    def __init__(self, bus: CanBus):
+    UNPACKERS: dict[int, Type[Unpackable]] = {
+        0x210: StatusMsg210,
+        0x211: StatusMsg211,
+        0x212: StatusMsg212,
+        0x010: Fault010,
+        0x011: Fault011,
+    }
+
+    def __init__(self, bus: CanBus, engine: TimerEngine | None = None):
+        """
+        Create the connection.
+
+        Args:
+            bus (CanBus): The CAN bus.
+            engine (TimerEngine, optional): Engine executing the beacons (e.g. the simulator's engine, which
+                is stopped with the simulator). Defaults to own engine of the `beacons` scheduler.
+        """
         self._bus = bus
+        self._demux = CanDemux.for_bus(bus)
+        for arbitration_id, message_cls in self.UNPACKERS.items():
+            self._demux.register_decoder(arbitration_id, message_cls.unpack)
+        self.beacons = BeaconScheduler(self.send_config, engine)
+        self._stream_ids: dict[type, tuple[int, ...]] = {}
+
+    def close(self) -> None:
+        """
+        Stop all beacons and the worker of the own beacon engine.
+        """
+        self.beacons.close()
 
     def send_config(self, message: TxMsg) -> None:
         """
@@ -93,43 +131,88 @@ class WiredConn:
         Returns:
             Msg: The message.
         """
-        unpackers: dict[int, Type[Unpackable]] = {
-            0x210: StatusMsg210,
-            0x211: StatusMsg211,
-            0x212: StatusMsg212,
-            0x010: Fault010,
-            0x011: Fault011,
-        }
         try:
-            message_cls = unpackers[arbitration_id]
+            message_cls = self.UNPACKERS[arbitration_id]
             return cast(Msg, message_cls.unpack(data))
         except KeyError as err:
             raise AttributeError(f"Unknown message id: {arbitration_id} ({str(err)})")
 
-    def _get_message(self, timeout: int | float = 0.1) -> Msg:
+    def _frame_message(self, frame: ReceivedFrame) -> Msg | None:
         """
-        Get the message.
+        Get the message of the received frame, decoded by the demultiplexer unless the bus is shared
+        with a connection decoding the arbitration ID to another type.
 
         Args:
-            timeout (int | float, optional): The timeout. Defaults to 0.1.
+            frame (ReceivedFrame): The received frame.
 
         Returns:
-            Msg: The message.
+            Msg | None: The message or None if the frame cannot be parsed.
+        """
+        arbitration_id = frame.msg.arbitration_id
+        if isinstance(frame.message, self.UNPACKERS[arbitration_id]):
+            return cast(Msg, frame.message)
+        try:
+            return self._unpack_message(arbitration_id, frame.msg.data)
+        except Exception as err:  # pylint: disable=broad-except
+            logger.error(f"Cannot parse message({arbitration_id}) ({err!r}).")
+            return None
+
+    def _arbitration_ids(self, msg_type: type) -> tuple[int, ...]:
+        """
+        Get the arbitration IDs of the message type.
+
+        Args:
+            msg_type (type): The message type.
+
+        Returns:
+            tuple[int, ...]: The arbitration IDs of the streams carrying the message type.
+        """
+        ids = self._stream_ids.get(msg_type)
+        if ids is None:
+            ids = self._stream_ids[msg_type] = tuple(
+                arbitration_id
+                for arbitration_id, message_cls in self.UNPACKERS.items()
+                if issubclass(message_cls, msg_type)
+            )
+        return ids
+
+    def subscribe(
+        self, msg_type: Type[MsgT], callback: Callable[[MsgT], None]
+    ) -> Callable[[ReceivedFrame], None]:
+        """
+        Call the callback with every received message of the type.
+
+        The callback is called from the worker draining the bus, it must not wait for other messages.
+
+        Args:
+            msg_type (Type[MsgT]): The message type.
+            callback (Callable[[MsgT], None]): The callback.
+
+        Returns:
+            Callable[[ReceivedFrame], None]: The subscription to be passed to `unsubscribe`.
+        """
+
+        def on_frame(frame: ReceivedFrame) -> None:
+            message = self._frame_message(frame)
+            if message is not None:
+                callback(cast(MsgT, message))
+
+        for arbitration_id in self._arbitration_ids(msg_type):
+            self._demux.subscribe(arbitration_id, on_frame)
+        return on_frame
+
+    def unsubscribe(
+        self, msg_type: Type[MsgT], subscription: Callable[[ReceivedFrame], None]
+    ) -> None:
+        """
+        Remove the subscription created by `subscribe`.
+
+        Args:
+            msg_type (Type[MsgT]): The message type.
+            subscription (Callable[[ReceivedFrame], None]): The subscription.
         """
-        start_time = vtime_manager.time_ms()
-        end_time = start_time + timeout * 1000
-        while vtime_manager.time_ms() < end_time:
-            msg = self._bus.recv(timeout=timeout)
-            if msg:
-                try:
-                    foot_switch_msg = self._unpack_message(msg.arbitration_id, msg.data)
-                    logger.debug(f"Received message: {foot_switch_msg}")
-                    return foot_switch_msg
-                except AttributeError as err:
-                    logger.error(
-                        f"Cannot parse message({msg.arbitration_id}) {msg.data.hex()} ({str(err)})."
-                    )
-        raise RuntimeError("No CAN message received")
+        for arbitration_id in self._arbitration_ids(msg_type):
+            self._demux.unsubscribe(arbitration_id, subscription)
 
     def await_message(
         self,
@@ -148,13 +231,21 @@ class WiredConn:
         Returns:
             MsgT: The message.
         """
-        start_time = vtime_manager.time_ms()
-        end_time = start_time + timeout * 1000
-        while vtime_manager.time_ms() < end_time:
-            message = self._get_message(timeout)
-            if isinstance(message, filter_msg_type):
-                if filter_func is None or filter_func(message):
-                    return message
+        ids = self._arbitration_ids(filter_msg_type)
+        if not ids:
+            raise AttributeError(f"Unknown message type: {filter_msg_type.__name__}")
+        end_time = vtime_manager.time_ms() + timeout * 1000
+        while True:
+            remaining = (end_time - vtime_manager.time_ms()) / 1000
+            frame = self._demux.get(ids, remaining)
+            if frame is None:
+                break
+            message = self._frame_message(frame)
+            if message is None:
+                continue
+            logger.debug("Received message: %s", message)
+            if filter_func is None or filter_func(cast(MsgT, message)):
+                return cast(MsgT, message)
         raise CanMsgTimeoutError("Timeout waiting for CAN message")
 
     def _get_status(
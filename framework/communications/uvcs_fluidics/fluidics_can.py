@@ -1,5 +1,6 @@
-from typing import Type, TypeAlias, cast, Protocol, Callable
+from typing import Type, TypeAlias, Protocol, Callable
 from framework.hardware_interfaces.drivers.common.definitions.interfaces import CanBus
+from framework.support.vtime import TimerEngine
 from framework.communications.uvcs_footswitch.msg_types.level_sensor_controller import (
     BarcodeReaderScanReply as BarcodeReaderScanReply,
 )
@@ -37,26 +38,10 @@ class FluidicsCan(WiredConn):
     Specification - Subsystem` section `Fluidics CAN`
     """
 
-    def __init__(self, bus: CanBus):
-        super().__init__(bus)
+    UNPACKERS: dict[int, Type[Unpackable]] = {0x1C1E0806: BarcodeReaderScanReply}
 
-    def _unpack_message(self, arbitration_id: int, data: bytes) -> Msg:
-        """
-        Unpack the message.
-
-        Args:
-            arbitration_id (int): The arbitration ID.
-            data (bytes): The data.
-
-        Returns:
-            Msg: The message.
-        """
-        unpackers: dict[int, Type[Unpackable]] = {0x1C1E0806: BarcodeReaderScanReply}
-        try:
-            message_cls = unpackers[arbitration_id]
-            return cast(Msg, message_cls.unpack(data))
-        except KeyError as err:
-            raise AttributeError(f"Unknown message id: {arbitration_id} ({str(err)})")
+    def __init__(self, bus: CanBus, engine: TimerEngine | None = None):
+        super().__init__(bus, engine)
 
     def get_barcode_reader_scan_reply(
         self,
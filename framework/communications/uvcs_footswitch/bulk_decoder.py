@@ -0,0 +1,293 @@
+import re
+import struct
+from typing import Any, Iterable, Mapping, Sequence, TypeAlias
+
+import bitstruct
+
+from framework.communications.uvcs_console.wired.wiredconn import WiredConn
+from framework.communications.uvcs_footswitch.msg_types.aux_data_types import (
+    AuxDataErrorFlags,
+    AuxDataType,
+    ErrorFlags,
+    aux_data_classes,
+)
+from framework.communications.uvcs_footswitch.msg_types.real_time_status_msgs import (
+    StatusMsg211,
+)
+from framework.communications.uvcs_footswitch.msg_types.schema import MessageSchema
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, columns are decoded into lists without it
+    np = None
+
+Columns: TypeAlias = Any  # NumPy structured array or dictionary of lists
+
+FRAME_SIZE = 8
+AUX_DATA_OFFSET = 4
+
+_NUMPY_TYPES = {
+    "B": "u1",
+    "b": "i1",
+    "c": "u1",
+    "?": "?",
+    "H": "u2",
+    "h": "i2",
+    "I": "u4",
+    "i": "i4",
+    "Q": "u8",
+    "q": "i8",
+}
+_BIT_FIELD = re.compile(r"[<>]?([a-z])(\d+)")
+
+
+class BulkDecoder:
+    """
+    Decoder of captured footswitch CAN frames into columns per message type.
+
+    Frames are grouped by arbitration ID and all frames of a message type are decoded at once by the
+    compiled layout of the message (`SCHEMA`): `struct.iter_unpack` or bitstruct over the joined
+    payloads, or (when NumPy is available) vectorized slicing and bit operations over a 2D byte array.
+    Aux data of `StatusMsg211` frames are decoded per aux data class described by a schema.
+
+    Decoded values are raw (enums and nested button structures are not constructed, `c` fields are
+    integers). Each message type gets a `timestamp` column, aux data classes an `aux_type` column too.
+    """
+
+    def __init__(
+        self,
+        messages: Mapping[int, type] | None = None,
+        use_numpy: bool | None = None,
+    ) -> None:
+        """
+        Create the decoder.
+
+        Args:
+            messages (Mapping[int, type], optional): Message classes by arbitration ID. Defaults to
+                the footswitch messages received by `WiredConn`.
+            use_numpy (bool, optional): True to return NumPy structured arrays, False to return
+                dictionaries of lists. Defaults to True when NumPy is installed.
+        """
+        if use_numpy and np is None:
+            raise ImportError("NumPy is required for structured array output")
+        self._use_numpy = np is not None if use_numpy is None else use_numpy
+        self._messages = {
+            arbitration_id: message_cls
+            for arbitration_id, message_cls in (messages or WiredConn.UNPACKERS).items()
+            if isinstance(getattr(message_cls, "SCHEMA", None), MessageSchema)
+        }
+        self._aux_types: dict[type, tuple[int, ...]] = {}
+        for aux_type in AuxDataType:
+            aux_cls = (
+                ErrorFlags
+                if aux_type in AuxDataErrorFlags
+                else aux_data_classes[aux_type.name]
+            )
+            if isinstance(getattr(aux_cls, "SCHEMA", None), MessageSchema):
+                self._aux_types[aux_cls] = self._aux_types.get(aux_cls, ()) + (
+                    int(aux_type),
+                )
+        self._bit_codecs: dict[str, Any] = {}
+
+    def decode(
+        self,
+        ids: Iterable[int],
+        timestamps: Iterable[int],
+        payloads: Iterable[bytes],
+    ) -> dict[type, Columns]:
+        """
+        Decode the frames.
+
+        Args:
+            ids (Iterable[int]): Arbitration IDs of the frames.
+            timestamps (Iterable[int]): Timestamps of the frames.
+            payloads (Iterable[bytes]): Payloads of the frames (shorter payloads are padded by zeros).
+
+        Returns:
+            dict[type, Columns]: Columns by message class and aux data class, only types present in
+                the frames are included.
+        """
+        data = b"".join(
+            (
+                payload
+                if len(payload) == FRAME_SIZE
+                else bytes(payload[:FRAME_SIZE]).ljust(FRAME_SIZE, b"\x00")
+            )
+            for payload in payloads
+        )
+        if self._use_numpy:
+            return self._decode_arrays(
+                np.asarray(list(ids)), np.asarray(list(timestamps)), data
+            )
+        return self._decode_lists(list(ids), list(timestamps), data)
+
+    def _decode_arrays(self, ids: Any, timestamps: Any, data: bytes) -> dict:
+        """
+        Decode the frames into NumPy structured arrays.
+        """
+        frames = np.frombuffer(data, dtype=np.uint8).reshape(-1, FRAME_SIZE)
+        result = {}
+        for arbitration_id, message_cls in self._messages.items():
+            selected = ids == arbitration_id
+            if not selected.any():
+                continue
+            rows, times = frames[selected], timestamps[selected]
+            result[message_cls] = self._array_records(message_cls.SCHEMA, times, rows)
+            if message_cls is StatusMsg211:
+                aux_types = rows[:, AUX_DATA_OFFSET - 1]
+                for aux_cls, aux_type_values in self._aux_types.items():
+                    aux_selected = np.isin(aux_types, aux_type_values)
+                    if aux_selected.any():
+                        result[aux_cls] = self._array_records(
+                            aux_cls.SCHEMA,
+                            times[aux_selected],
+                            rows[aux_selected, AUX_DATA_OFFSET:],
+                            aux_types[aux_selected],
+                        )
+        return result
+
+    def _array_records(
+        self, schema: MessageSchema, times: Any, rows: Any, aux_types: Any = None
+    ) -> Any:
+        """
+        Decode rows of payload bytes into a structured array.
+        """
+        columns = {"timestamp": times}
+        if aux_types is not None:
+            columns["aux_type"] = aux_types
+        if schema.byte_aligned:
+            dtype = np.dtype(
+                {
+                    "names": list(schema.field_formats),
+                    "formats": [
+                        _numpy_type(fmt) for fmt, _ in schema.field_formats.values()
+                    ],
+                    "offsets": [offset for _, offset in schema.field_formats.values()],
+                    "itemsize": schema.size,
+                }
+            )
+            records = np.ascontiguousarray(rows[:, : schema.size]).view(dtype)[:, 0]
+            columns.update((name, records[name]) for name in schema.names)
+        else:
+            padded = np.zeros((len(rows), 8), dtype=np.uint8)
+            padded[:, : schema.size] = rows[:, : schema.size]
+            words = padded.view(">u8")[:, 0].astype(np.uint64)
+            columns.update(_bit_columns(schema, words))
+        result = np.empty(
+            len(times), dtype=[(name, column.dtype) for name, column in columns.items()]
+        )
+        for name, column in columns.items():
+            result[name] = column
+        return result
+
+    def _decode_lists(
+        self, ids: Sequence[int], timestamps: Sequence[int], data: bytes
+    ) -> dict:
+        """
+        Decode the frames into dictionaries of lists.
+        """
+        indexes: dict[int, list[int]] = {}
+        for index, arbitration_id in enumerate(ids):
+            indexes.setdefault(arbitration_id, []).append(index)
+        view = memoryview(data)
+        result = {}
+        for arbitration_id, frame_indexes in indexes.items():
+            message_cls = self._messages.get(arbitration_id)
+            if message_cls is None:
+                continue
+            frames = [
+                view[index * FRAME_SIZE : (index + 1) * FRAME_SIZE]
+                for index in frame_indexes
+            ]
+            times = [timestamps[index] for index in frame_indexes]
+            result[message_cls] = self._list_records(message_cls.SCHEMA, times, frames)
+            if message_cls is StatusMsg211:
+                for aux_cls, aux_type_values in self._aux_types.items():
+                    aux_frames = [
+                        (time, frame)
+                        for time, frame in zip(times, frames)
+                        if frame[AUX_DATA_OFFSET - 1] in aux_type_values
+                    ]
+                    if aux_frames:
+                        result[aux_cls] = self._list_records(
+                            aux_cls.SCHEMA,
+                            [time for time, _ in aux_frames],
+                            [frame[AUX_DATA_OFFSET:] for _, frame in aux_frames],
+                            [frame[AUX_DATA_OFFSET - 1] for _, frame in aux_frames],
+                        )
+        return result
+
+    def _list_records(
+        self,
+        schema: MessageSchema,
+        times: list[int],
+        frames: list[memoryview],
+        aux_types: list[int] | None = None,
+    ) -> dict[str, list]:
+        """
+        Decode payloads into columns of lists.
+        """
+        columns: dict[str, list] = {"timestamp": times}
+        if aux_types is not None:
+            columns["aux_type"] = aux_types
+        records: Iterable[tuple]
+        if schema.byte_aligned:
+            records = struct.iter_unpack(
+                schema.format.replace("c", "B"),
+                b"".join(frame[: schema.size] for frame in frames),
+            )
+        else:
+            codec = self._bit_codecs.get(schema.format)
+            if codec is None:
+                codec = self._bit_codecs[schema.format] = bitstruct.compile(
+                    schema.format
+                )
+            records = (codec.unpack(frame) for frame in frames)
+        values = list(zip(*records)) or [()] * len(schema.fields)
+        columns.update(
+            (name, list(column))
+            for name, column in zip(schema.fields, values)
+            if name is not None
+        )
+        return columns
+
+
+def _numpy_type(fmt: str) -> str:
+    """
+    Convert `struct` format of one field to NumPy type.
+    """
+    byte_order = ">" if fmt[0] in "!>" else fmt[0]
+    count, code = fmt[1:-1], fmt[-1]
+    if code == "s":
+        return f"S{count or 1}"
+    return byte_order + _NUMPY_TYPES[code]
+
+
+def _bit_columns(schema: MessageSchema, words: Any) -> dict[str, Any]:
+    """
+    Extract fields of bitstruct layout from payloads read as big endian 64-bit words.
+    """
+    fields = iter(schema.fields)
+    columns = {}
+    position = 0
+    for kind, width_str in _BIT_FIELD.findall(schema.format):
+        width = int(width_str)
+        if kind not in "upbs" or position + width > 64:
+            raise ValueError(f"Format {schema.format!r} cannot be decoded in bulk")
+        if kind != "p":
+            name = next(fields)
+            value = (words >> np.uint64(64 - position - width)) & np.uint64(
+                (1 << width) - 1
+            )
+            if name is not None:
+                if kind == "b":
+                    columns[name] = value.astype(bool)
+                elif kind == "s":
+                    signed = value.astype(np.int64)
+                    columns[name] = np.where(
+                        signed >= 1 << (width - 1), signed - (1 << width), signed
+                    )
+                else:
+                    columns[name] = value
+        position += width
+    return columns
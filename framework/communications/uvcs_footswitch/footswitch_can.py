@@ -15,7 +15,7 @@ from framework.communications.uvcs_footswitch.msg_types.real_time_status_msgs im
     StatusMsg212,
 )
 from framework.hardware_interfaces.drivers.common.definitions.interfaces import CanBus
-from framework.support.vtime import VirtualTimeWorker, get_worker_manager, vtime_manager
+from framework.support.vtime import TimerEngine
 
 Msg: TypeAlias = StatusMsg210 | StatusMsg211 | StatusMsg212 | Fault010 | Fault011
 TxMsg: TypeAlias = ConfigurationMsg310 | ConfigurationMsg311
@@ -27,10 +27,9 @@ class FootSwitchCAN(WiredConn):
     ! FootSwitchCAN communicates with the footswitch over the CAN bus.
     """
 
-    def __init__(self, bus: CanBus) -> None:
-        super().__init__(bus)
-        self._enabling_beacons = False
-        self._beacons_runner: VirtualTimeWorker | None = None
+    def __init__(self, bus: CanBus, engine: TimerEngine | None = None) -> None:
+        super().__init__(bus, engine)
+        self._beacon_set: int | None = None
 
     def get_status_210(
         self,
@@ -102,50 +101,47 @@ class FootSwitchCAN(WiredConn):
         """
         return self._get_status(Fault011, filter_func, timeout)
 
-    def send_beacons(
+    def enable_beacons(
         self,
         period: float,
-        beacons: list[Union[ConfigurationMsg310, ConfigurationMsg311]],
+        beacons: Optional[list[Union[ConfigurationMsg310, ConfigurationMsg311]]],
     ) -> None:
         """
-        ! Send beacons.
+        ! Enable beacons.
 
         @param period The period.
         @param beacons The beacons.
         """
-        if beacons is None:
-            self._enabling_beacons = False
-        while self._enabling_beacons:
-            for beacon in beacons:
-                self.send_config(beacon)
-            vtime_manager.sleep(period)
+        self.disable_beacons()
+        if beacons is not None:
+            self._beacon_set = self.beacons.add(period, beacons)
 
-    def enable_beacons(
+    def update_beacons(
         self,
-        period: float,
-        beacons: Optional[list[Union[ConfigurationMsg310, ConfigurationMsg311]]],
+        beacons: list[Union[ConfigurationMsg310, ConfigurationMsg311]],
+        period: Optional[float] = None,
     ) -> None:
         """
-        ! Enable beacons.
+        ! Replace enabled beacons, the change is applied from the next transmission.
 
-        @param period The period.
         @param beacons The beacons.
+        @param period The period. Defaults to None (unchanged).
         """
-        self.disable_beacons()
-        self._beacons_runner = VirtualTimeWorker(
-            target=self.send_beacons,
-            args=(period, beacons),
-        )
-        self._enabling_beacons = True
-        self._beacons_runner.start()
+        if self._beacon_set is None:
+            raise RuntimeError("Beacons are not enabled")
+        self.beacons.update(self._beacon_set, beacons, period)
 
     def disable_beacons(self) -> None:
         """
         ! Disable beacons.
         """
-        self._enabling_beacons = False
-        if self._beacons_runner is not None:
-            get_worker_manager().go_idle(VirtualTimeWorker.current_worker())
-            self._beacons_runner.join()
-            get_worker_manager().go_active(VirtualTimeWorker.current_worker())
-            self._beacons_runner = None
+        if self._beacon_set is not None:
+            self.beacons.remove(self._beacon_set)
+            self._beacon_set = None
+
+    def close(self) -> None:
+        """
+        ! Disable beacons and stop the worker of the own beacon engine.
+        """
+        self._beacon_set = None
+        super().close()
@@ -1,8 +1,11 @@
 import dataclasses
-import struct
 from enum import IntEnum
 from typing import TypeAlias
-import bitstruct
+
+from framework.communications.uvcs_footswitch.msg_types.schema import (
+    MessageSchema,
+    SchemaMessage,
+)
 
 
 class AuxDataType(IntEnum):
@@ -85,7 +88,7 @@ class FootSwitchId:
 
 
 @dataclasses.dataclass
-class FootSwitchSwVersion:
+class FootSwitchSwVersion(SchemaMessage):
     """
     A class representing the FootSwitch softweare version.
     """
@@ -94,6 +97,10 @@ class FootSwitchSwVersion:
     minor_version: int
     development_version: int
 
+    SCHEMA = MessageSchema.from_bitstruct(
+        "u4u8u8", ("major_version", "minor_version", "development_version")
+    )
+
     @classmethod
     def unpack(cls, data: bytes) -> "FootSwitchSwVersion":
         """
@@ -109,18 +116,11 @@ class FootSwitchSwVersion:
         """
         if len(data) < 3:
             raise ValueError("Data is too short to unpack FootSwitchSwVersion")
-        major_version, minor_version, development_version = bitstruct.unpack(
-            "u4u8u8", data[:3]
-        )
-        return cls(
-            major_version=major_version,
-            minor_version=minor_version,
-            development_version=development_version,
-        )
+        return cls(**cls.SCHEMA.decode(data))
 
 
 @dataclasses.dataclass
-class ErrorFlags:
+class ErrorFlags(SchemaMessage):
     """
     A class representing the FootSwitch Error Flags.
     """
@@ -147,31 +147,33 @@ class ErrorFlags:
     laser_footswitch_center_switch_failure: bool
     laser_footswitch_left_switch_failure: bool
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "ErrorFlags":
-        """
-        Method returning FootSwitch Error Flag from data bytes.
-
-        Args:
-            data (bytes): raw data packet from can communications
-
-        Returns:
-            byte_4 (ErrorFlags): Battery Communication Error
-            byte_5 (ErrorFlags): Battery Failure
-            byte_6 (ErrorFlags): Modem Failure
-        """
-        byte_4 = list(bitstruct.unpack("b1b1b1b1b1b1b1b1", data[0:1]))
-        byte_5 = list(bitstruct.unpack("b1b1b1b1b1b1b1b1", data[1:2]))
-        byte_6 = list(bitstruct.unpack("p3b1b1b1b1b1", data[2:3]))
-
-        # reverse lists as bit 0 as the last one
-        byte_4.reverse()
-        byte_5.reverse()
-        byte_6.reverse()
-
-        all_values = byte_4 + byte_5 + byte_6
-
-        return ErrorFlags(*all_values)
+    # Bit 0 of each byte is the first flag of the byte
+    SCHEMA = MessageSchema.from_bitstruct(
+        "b1b1b1b1b1b1b1b1b1b1b1b1b1b1b1b1p3b1b1b1b1b1",
+        (
+            "wireless_operation_failure",
+            "pairing_data_corrupt",
+            "recovered_from_comm_error",
+            "recovered_from_crit_error",
+            "can_comm_timeout",
+            "modem_failure",
+            "battery_failure",
+            "battery_comm_error",
+            "treadle_homing_failure",
+            "detent_motor_failure",
+            "treadle_excessive_travel",
+            "right_horizontal_switch_failure",
+            "right_vertical_switch_failure",
+            "left_horizontal_switch_failure",
+            "left_vertical_switch_failure",
+            "up_switch_failure",
+            "laser_footswitch_left_switch_failure",
+            "laser_footswitch_center_switch_failure",
+            "laser_footswitch_right_switch_failure",
+            "left_heel_switch_failure",
+            "right_heel_switch_failure",
+        ),
+    )
 
 
 @dataclasses.dataclass
@@ -364,7 +366,7 @@ class SerialNumber3:
 
 
 @dataclasses.dataclass
-class BatteryStatus3:
+class BatteryStatus3(SchemaMessage):
     """
     A class representing the FootSwitch Battery Status 3.
     """
@@ -372,18 +374,7 @@ class BatteryStatus3:
     voltage: int
     average_current: int
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "BatteryStatus3":
-        """
-        Method returning the FootSwitch Battery Status 3.
-
-        Args:
-            data (bytes): raw data packet from can communications
-
-        Returns:
-            BatteryStatus3
-        """
-        return BatteryStatus3(*struct.unpack(">Hh", data))
+    SCHEMA = MessageSchema.from_struct(">Hh", ("voltage", "average_current"))
 
 
 @dataclasses.dataclass
@@ -450,26 +441,18 @@ class Debug:
 
 
 @dataclasses.dataclass
-class AccelerometerStatus:
+class AccelerometerStatus(SchemaMessage):
     """
     A class representing the Accellerometr Status of FootSwitch.
     """
 
     footswitch_orientation: OrientationStatus
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "AccelerometerStatus":
-        """
-        Method returning the Accellerometr Status of FootSwitch.
-
-        Args:
-            data (bytes): raw data packet from can communications
-
-        Returns:
-            footswitch_orientation (OrientationStatus): AccelerometerStatus
-        """
-        orietation = int.from_bytes(data, "little")
-        return AccelerometerStatus(footswitch_orientation=OrientationStatus(orietation))
+    SCHEMA = MessageSchema.from_struct(
+        "<I",
+        ("footswitch_orientation",),
+        decoders={"footswitch_orientation": OrientationStatus},
+    )
 
 
 @dataclasses.dataclass
@@ -536,7 +519,7 @@ class Battery2Version:
 
 
 @dataclasses.dataclass
-class BatteryDebugInfo:
+class BatteryDebugInfo(SchemaMessage):
     """
     A class representing the FootSwitch Battery Debug Info.
     """
@@ -546,18 +529,9 @@ class BatteryDebugInfo:
     battery2_soc: int
     battery2_soh: int
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "BatteryDebugInfo":
-        """
-        Method returning the FootSwitch Battery Debug Info.
-
-        Args:
-            data (bytes): raw data packet from can communications
-
-        Returns:
-            BatteryDebugInfo
-        """
-        return BatteryDebugInfo(*struct.unpack("BBBB", data))
+    SCHEMA = MessageSchema.from_struct(
+        "<BBBB", ("battery1_soc", "battery1_soh", "battery2_soc", "battery2_soh")
+    )
 
 
 @dataclasses.dataclass
@@ -624,7 +598,7 @@ class CompatibilityInfo:
 
 
 @dataclasses.dataclass
-class BatteryStatus1:
+class BatteryStatus1(SchemaMessage):
     """
     A class representing the Battery Status 1.
     """
@@ -640,53 +614,23 @@ class BatteryStatus1:
     battery_temperature: int
     battery_soh: int
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "BatteryStatus1":
-        """
-        Method returning the the Battery Status 1.
-
-        Args:
-            data (bytes): raw data packet from can communications
-
-        Returns:
-            level (Bool): Battery Battery Level
-            charging (Unsigned): Charging
-            status_unknown (Bool): Status Unknown
-            battery_low (Bool): Battery Low
-            battery_crit_low (Bool): Battery Critically Low
-            battery_depleted (Bool): Battery Depleted
-            soh_status_unknown (Bool): SoH Status Unknown
-            battery_over_temperature (Bool): Battery Over Temperature
-            battery_temperature (Signed): Battery Temperature
-            battery_soh (Unsigned): Battery SoH
-        """
+    SCHEMA = MessageSchema.from_bitstruct(
+        "b1u7b1b1b1b1b1b1b1b1u8u8",
         (
-            charging,
-            level,
-            status_unknown,
-            battery_low,
-            battery_crit_low,
-            battery_depleted,
-            soh_status_unknown,
-            battery_over_temperature,
-            _,
-            _,
-            battery_temperature,
-            battery_soh,
-        ) = bitstruct.unpack("b1u7b1b1b1b1b1b1b1b1u8u8", data)
-
-        return BatteryStatus1(
-            level=level,
-            charging=charging,
-            status_unknown=status_unknown,
-            battery_low=battery_low,
-            battery_crit_low=battery_crit_low,
-            battery_depleted=battery_depleted,
-            soh_status_unknown=soh_status_unknown,
-            battery_over_temperature=battery_over_temperature,
-            battery_temperature=battery_temperature,
-            battery_soh=battery_soh,
-        )
+            "charging",
+            "level",
+            "status_unknown",
+            "battery_low",
+            "battery_crit_low",
+            "battery_depleted",
+            "soh_status_unknown",
+            "battery_over_temperature",
+            None,
+            None,
+            "battery_temperature",
+            "battery_soh",
+        ),
+    )
 
 
 AuxDataFlags = tuple(
@@ -1,11 +1,27 @@
 import dataclasses
-import struct
 
-import bitstruct
+from framework.communications.uvcs_footswitch.msg_types.schema import (
+    MessageSchema,
+    SchemaMessage,
+)
+
+
+def _to_little_endian_s16(value: int) -> int:
+    """
+    Returns big endian bit pattern of signed 16-bit value stored in little endian.
+    """
+    return int.from_bytes(value.to_bytes(2, "little", signed=True), "big")
+
+
+def _from_little_endian_s16(value: int) -> int:
+    """
+    Returns signed 16-bit value from its little endian bit pattern.
+    """
+    return int.from_bytes(value.to_bytes(2, "big"), "little", signed=True)
 
 
 @dataclasses.dataclass
-class ConfigurationMsg310:
+class ConfigurationMsg310(SchemaMessage):
     """
     Footswitch Configuration – CAN ID 310h.
     """
@@ -19,39 +35,26 @@ class ConfigurationMsg310:
     console_type: int = 1
     modem_tx_power_level: int = 1
 
-    def pack(self) -> bytes:
-        """
-        Method returning the Configuration Info.
-
-        Args:
-            self: raw data packet from can communications
-
-        Returns:
-            Newest Supported Protocol Version
-            Oldest Supported Protocol Version
-            Network Channel Number
-            Modem Transmit Power Attenuation
-            Console Network ID
-            Pairing Information Valid
-            Console Type
-            Modem Transmit Power Level
-        """
-        byte6 = bitstruct.pack(">p5u2b1", self.console_type, self.pairing_info_valid)
-
-        return struct.pack(
-            "BBBBhsB",
-            self.newest_supported_proto_version,
-            self.oldest_supported_proto_version,
-            self.channel_number,
-            self.modem_tx_power_attenuation,
-            self.console_network_id,
-            byte6,
-            self.modem_tx_power_level,
-        )
+    # Byte 4-5 (console network ID) is little endian, byte 6 holds console type and pairing flag
+    SCHEMA = MessageSchema.from_bitstruct(
+        "u8u8u8u8u16p5u2b1u8",
+        (
+            "newest_supported_proto_version",
+            "oldest_supported_proto_version",
+            "channel_number",
+            "modem_tx_power_attenuation",
+            "console_network_id",
+            "console_type",
+            "pairing_info_valid",
+            "modem_tx_power_level",
+        ),
+        decoders={"console_network_id": _from_little_endian_s16},
+        encoders={"console_network_id": _to_little_endian_s16},
+    )
 
 
 @dataclasses.dataclass
-class ConfigurationMsg311:
+class ConfigurationMsg311(SchemaMessage):
     """
     Footswitch Configuration – CAN ID 311h.
     """
@@ -62,27 +65,14 @@ class ConfigurationMsg311:
     vibrate_on_down_enable: bool = True
     detent_strength: int = 0
 
-    def pack(self) -> bytes:
-        """
-        Method returning the Configuration Info.
-
-        Args:
-            self: raw data packet from can communications
-
-        Returns:
-            Detent Position 2
-            Battery Charging Disable
-            Detent Position 1
-            Vibrate On Down Enable
-            Detent Strength
-        """
-        byte0: bytes = bitstruct.pack(
-            ">b1u7", self.battery_charging_disable, self.detent_position_2
-        )
-        byte1: bytes = bitstruct.pack(
-            ">b1u7", self.vibrate_on_down_enable, self.detent_position_1
-        )
-        byte2: bytes = struct.pack("B", self.detent_strength)
-        byte3_7: bytes = b"\x00" * 5  # Unused bytes, set to zero
-
-        return byte0 + byte1 + byte2 + byte3_7
+    # Bytes 3-7 are unused
+    SCHEMA = MessageSchema.from_bitstruct(
+        "b1u7b1u7u8p40",
+        (
+            "battery_charging_disable",
+            "detent_position_2",
+            "vibrate_on_down_enable",
+            "detent_position_1",
+            "detent_strength",
+        ),
+    )
@@ -1,11 +1,13 @@
 import dataclasses
 from enum import IntEnum
 
-import bitstruct
-
 from framework.communications.uvcs_footswitch.msg_types.msg_data_structures import (
     FootSwitchType,
 )
+from framework.communications.uvcs_footswitch.msg_types.schema import (
+    MessageSchema,
+    SchemaMessage,
+)
 
 
 class FootSwitchPowerState(IntEnum):
@@ -39,7 +41,7 @@ class FaultType(IntEnum):
 
 
 @dataclasses.dataclass
-class Fault010:
+class Fault010(SchemaMessage):
     """
     Fault 010.
     """
@@ -52,40 +54,28 @@ class Fault010:
     file_line_no: int
     foot_switch_id: int
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "Fault010":
-        """
-        Unpack data.
-
-        Args:
-            data: Data to unpack.
-
-        Returns:
-            Fault010: Unpacked data.
-        """
+    SCHEMA = MessageSchema.from_bitstruct(
+        "u5u3u4u4u8u8u16u16",
         (
-            format_version,
-            foot_switch_type_int,
-            reserved,
-            foot_switch_power_state_int,
-            file_id,
-            fault_type,
-            file_line_no,
-            foot_switch_id,
-        ) = tuple(bitstruct.unpack("u5u3u4u4u8u8u16u16", data))
-        return Fault010(
-            foot_switch_type=FootSwitchType(foot_switch_type_int),
-            format_version=format_version,
-            foot_switch_power_state=FootSwitchPowerState(foot_switch_power_state_int),
-            file_id=file_id,
-            fault_type=FaultType(fault_type),
-            file_line_no=file_line_no,
-            foot_switch_id=foot_switch_id,
-        )
+            "format_version",
+            "foot_switch_type",
+            None,
+            "foot_switch_power_state",
+            "file_id",
+            "fault_type",
+            "file_line_no",
+            "foot_switch_id",
+        ),
+        decoders={
+            "foot_switch_type": FootSwitchType,
+            "foot_switch_power_state": FootSwitchPowerState,
+            "fault_type": FaultType,
+        },
+    )
 
 
 @dataclasses.dataclass
-class Fault011:
+class Fault011(SchemaMessage):
     """
     Fault 011.
     """
@@ -95,27 +85,13 @@ class Fault011:
     foot_switch_software_dev_version: int
     fault_detail: int
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "Fault011":
-        """
-        Unpack data.
-
-        Args:
-            data: Data to unpack.
-
-        Returns:
-            Fault011: Unpacked data.
-        """
+    SCHEMA = MessageSchema.from_bitstruct(
+        "u4u4u8u8u16",
         (
-            foot_switch_software_major_version,
-            reserved,
-            foot_switch_software_minor_version,
-            foot_switch_software_dev_version,
-            fault_detail,
-        ) = tuple(bitstruct.unpack("u4u4u8u8u16", data))
-        return Fault011(
-            foot_switch_software_major_version=foot_switch_software_major_version,
-            foot_switch_software_minor_version=foot_switch_software_minor_version,
-            foot_switch_software_dev_version=foot_switch_software_dev_version,
-            fault_detail=fault_detail,
-        )
+            "foot_switch_software_major_version",
+            None,
+            "foot_switch_software_minor_version",
+            "foot_switch_software_dev_version",
+            "fault_detail",
+        ),
+    )
@@ -1,7 +1,115 @@
 import dataclasses
+import struct
 from enum import IntEnum
+from typing import Any, ClassVar
 
-import bitstruct
+from framework.communications.uvcs_footswitch.msg_types.schema import (
+    MessageSchema,
+    SchemaMessage,
+)
+
+
+class LazyField:
+    """
+    Field of a `LazyMessage` decoded from the payload by the message schema on the first access.
+
+    The decoded value is cached in the instance `__dict__`, which takes precedence over this (non-data)
+    descriptor on further accesses.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        value = instance.SCHEMA.decode_field(instance.payload, self.name)
+        instance.__dict__[self.name] = value
+        return value
+
+
+class LazyMessage:
+    """
+    Base of received messages decoded lazily from their payload.
+
+    The message keeps a `memoryview` of the payload and each field is decoded on the first access only.
+    Fields in `FIELDS` are generated as `LazyField`, unless the subclass defines the attribute itself.
+    `unpack` checks the payload size and decodes the `VALIDATED` fields (e.g. enums) right away, so invalid
+    frames are rejected when received. Messages can also be created from field values (positionally in
+    `FIELDS` order or by keyword), such messages have no payload.
+    """
+
+    FIELDS: ClassVar[tuple[str, ...]] = ()
+    VALIDATED: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name in cls.FIELDS:
+            if name not in cls.__dict__:
+                setattr(cls, name, LazyField(name))
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        name = self.__class__.__name__
+        if len(args) > len(self.FIELDS):
+            raise TypeError(
+                f"{name}() takes {len(self.FIELDS)} positional arguments but {len(args)} were given"
+            )
+        values = dict(zip(self.FIELDS, args))
+        for field, value in kwargs.items():
+            if field not in self.FIELDS:
+                raise TypeError(
+                    f"{name}() got an unexpected keyword argument '{field}'"
+                )
+            if field in values:
+                raise TypeError(f"{name}() got multiple values for argument '{field}'")
+            values[field] = value
+        missing = [field for field in self.FIELDS if field not in values]
+        if missing:
+            raise TypeError(f"{name}() missing arguments: {', '.join(missing)}")
+        self._payload: memoryview | None = None
+        self.__dict__.update(values)
+
+    @classmethod
+    def unpack(cls, data: bytes | memoryview) -> Any:
+        """
+        Creates the message over the payload, the payload size and the `VALIDATED` fields are checked.
+
+        Raises:
+            struct.error: If the payload size doesn't match the schema.
+            ValueError: If a validated field has an invalid value.
+        """
+        schema = getattr(cls, "SCHEMA")
+        if len(data) != schema.size:
+            raise struct.error(f"unpack requires a buffer of {schema.size} bytes")
+        message = cls.view(data)
+        for name in cls.VALIDATED:
+            getattr(message, name)
+        return message
+
+    @classmethod
+    def view(cls, data: bytes | memoryview) -> Any:
+        """
+        Creates the message over the payload without decoding any field.
+        """
+        message = cls.__new__(cls)
+        message._payload = memoryview(data)
+        return message
+
+    @property
+    def payload(self) -> memoryview:
+        """
+        Payload of the message (empty for messages created from field values).
+        """
+        return self._payload if self._payload is not None else memoryview(b"")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{self.__class__.__name__}({fields})"
 
 
 class FootSwitchType(IntEnum):
@@ -27,7 +135,7 @@ class FootSwitchState(IntEnum):
 
 
 @dataclasses.dataclass
-class Buttons:
+class Buttons(SchemaMessage):
     """
     Foot switch buttons.
     """
@@ -41,16 +149,23 @@ class Buttons:
     right_heel: bool
     left_heel: bool
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "Buttons":
-        """
-        Unpacks the data into a Buttons object.
-        """
-        return Buttons(*tuple(reversed(bitstruct.unpack("<b1b1b1b1b1b1b1b1", data))))
+    SCHEMA = MessageSchema.from_bitstruct(
+        "<b1b1b1b1b1b1b1b1",
+        (
+            "left_heel",
+            "right_heel",
+            "recovered_from_timeout",
+            "left_vertical",
+            "left_horizontal",
+            "right_vertical",
+            "right_horizontal",
+            "calibrated",
+        ),
+    )
 
 
 @dataclasses.dataclass
-class LaserButtons:
+class LaserButtons(SchemaMessage):
     """
     Laser foot switch buttons.
     """
@@ -61,9 +176,7 @@ class LaserButtons:
     left: bool
     shroud_up_detected: bool
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "LaserButtons":
-        """
-        Unpacks the data into a LaserButtons object.
-        """
-        return LaserButtons(*tuple(reversed(bitstruct.unpack("p3b1b1b1b1b1", data))))
+    SCHEMA = MessageSchema.from_bitstruct(
+        "p3b1b1b1b1b1",
+        ("shroud_up_detected", "left", "center", "right", "connected"),
+    )
@@ -1,5 +1,4 @@
-import dataclasses
-import struct
+import functools
 
 from typing import Optional, cast
 
@@ -16,12 +15,16 @@ from framework.communications.uvcs_footswitch.msg_types.msg_data_structures impo
     FootSwitchState,
     Buttons,
     LaserButtons,
+    LazyMessage,
+)
+from framework.communications.uvcs_footswitch.msg_types.schema import (
+    MessageSchema,
+    SchemaMessage,
 )
 from framework.support.reports import logger
 
 
-@dataclasses.dataclass
-class StatusMsg210:
+class StatusMsg210(LazyMessage, SchemaMessage):
     foot_switch_type: FootSwitchType
     foot_switch_state: FootSwitchState
     tx_counter: int
@@ -29,70 +32,74 @@ class StatusMsg210:
     treadle_count: int
     laser_buttons: LaserButtons
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "StatusMsg210":
+    SCHEMA = MessageSchema.from_struct(
+        ">BBBcHcB",
         (
-            foot_switch_type_int,
-            foot_switch_state_int,
-            tx_counter,
-            buttons,
-            count,
-            buttons2,
-            _,
-        ) = struct.unpack(">BBBcHcB", data)
-
-        return StatusMsg210(
-            foot_switch_type=FootSwitchType(foot_switch_type_int),
-            foot_switch_state=FootSwitchState(foot_switch_state_int),
-            tx_counter=tx_counter,
-            buttons=Buttons.unpack(buttons),
-            treadle_count=count,
-            laser_buttons=LaserButtons.unpack(buttons2),
-        )
+            "foot_switch_type",
+            "foot_switch_state",
+            "tx_counter",
+            "buttons",
+            "treadle_count",
+            "laser_buttons",
+            None,
+        ),
+        decoders={
+            "foot_switch_type": FootSwitchType,
+            "foot_switch_state": FootSwitchState,
+            "buttons": Buttons.unpack,
+            "laser_buttons": LaserButtons.unpack,
+        },
+        encoders={"buttons": Buttons.pack, "laser_buttons": LaserButtons.pack},
+    )
+    FIELDS = SCHEMA.names
+    VALIDATED = ("foot_switch_type", "foot_switch_state")
 
 
-@dataclasses.dataclass
-class StatusMsg211:
+class StatusMsg211(LazyMessage, SchemaMessage):
     aux_type: AuxDataType
-    data: Optional[AuxData]
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "StatusMsg211":
-        aux_type = AuxDataType(data[3])
+    # Aux data are packed by the aux data class (only classes described by a schema can be packed)
+    SCHEMA = MessageSchema.from_struct(
+        ">3xB4s",
+        ("aux_type", "data"),
+        decoders={"aux_type": AuxDataType},
+        encoders={"data": lambda data: data.pack() if data is not None else b""},
+    )
+    FIELDS = SCHEMA.names
+    VALIDATED = ("aux_type",)
+
+    @functools.cached_property
+    def data(self) -> Optional[AuxData]:
         aux_data: Optional[AuxData] = None
-        match aux_type:
+        match self.aux_type:
             case flag if flag in AuxDataErrorFlags:
-                aux_data = ErrorFlags.unpack(data[4:])
+                aux_data = ErrorFlags.unpack(self.payload[4:])
             case flag if flag in AuxDataFlags:
                 dtype = cast(AuxData, aux_data_classes[flag.name])
-                aux_data = dtype.unpack(data[4:])
+                aux_data = dtype.unpack(self.payload[4:])
             case _:
-                logger.error(f"Unknown AuxType: {data[3]}")
-        return StatusMsg211(aux_type, aux_data)
+                logger.error(f"Unknown AuxType: {self.payload[3]}")
+        return aux_data
 
 
-@dataclasses.dataclass
-class StatusMsg212:
+class StatusMsg212(LazyMessage, SchemaMessage):
     newest_supported_proto_version: int
     oldest_supported_proto_version: int
     foot_switch_type: FootSwitchType
     session_id: int
 
-    @classmethod
-    def unpack(cls, data: bytes) -> "StatusMsg212":
+    SCHEMA = MessageSchema.from_struct(
+        "<BBBHBBB",
         (
-            newest_supported_proto_version,
-            oldest_supported_proto_version,
-            foot_switch_type_int,
-            session_id,
-            _,
-            _,
-            _,
-        ) = struct.unpack("<BBBHBBB", data)
-
-        return StatusMsg212(
-            newest_supported_proto_version=newest_supported_proto_version,
-            oldest_supported_proto_version=oldest_supported_proto_version,
-            foot_switch_type=FootSwitchType(foot_switch_type_int),
-            session_id=session_id,
-        )
+            "newest_supported_proto_version",
+            "oldest_supported_proto_version",
+            "foot_switch_type",
+            "session_id",
+            None,
+            None,
+            None,
+        ),
+        decoders={"foot_switch_type": FootSwitchType},
+    )
+    FIELDS = SCHEMA.names
+    VALIDATED = ("foot_switch_type",)
@@ -0,0 +1,183 @@
+import re
+import struct
+from typing import Any, Callable, ClassVar, Mapping, Optional, Sequence
+
+import bitstruct
+
+Converter = Callable[[Any], Any]
+
+_STRUCT_ITEM = re.compile(r"(\d*)([xcbB?hHiIlLqQefdsp])")
+
+
+class MessageSchema:
+    """
+    Layout of a message compiled once into a `struct.Struct` or `bitstruct` codec.
+
+    Fields are listed in layout order, `None` marks a reserved value (decoded and dropped, packed as 0).
+    Decoded values are passed through `decoders` (e.g. enum classes), packed values through `encoders`.
+    Byte-aligned layouts (`MessageSchema.from_struct`) additionally get a codec per field, so a single field
+    can be decoded without unpacking the whole message.
+    """
+
+    def __init__(
+        self,
+        fmt: str,
+        codec: Any,
+        fields: Sequence[Optional[str]],
+        decoders: Optional[Mapping[str, Converter]] = None,
+        encoders: Optional[Mapping[str, Converter]] = None,
+    ) -> None:
+        self.format = fmt
+        self._codec = codec
+        self.fields = tuple(fields)
+        self.names = tuple(name for name in self.fields if name is not None)
+        self._decoders = dict(decoders or {})
+        self._encoders = dict(encoders or {})
+        self._field_codecs: dict[str, tuple[struct.Struct, int]] = {}
+
+    @classmethod
+    def from_struct(
+        cls,
+        fmt: str,
+        fields: Sequence[Optional[str]],
+        decoders: Optional[Mapping[str, Converter]] = None,
+        encoders: Optional[Mapping[str, Converter]] = None,
+    ) -> "MessageSchema":
+        """
+        Compiles byte-aligned layout given by `struct` format with explicit byte order.
+        """
+        schema = cls(fmt, struct.Struct(fmt), fields, decoders, encoders)
+        byte_order, items = fmt[0], _STRUCT_ITEM.findall(fmt[1:])
+        value_items = [(count, code) for count, code in items if code != "x"]
+        if (
+            byte_order not in "<>!="
+            or len(value_items) != len(schema.fields)
+            or any(count and code not in "sp" for count, code in value_items)
+        ):
+            raise ValueError(f"Format {fmt!r} does not match fields {fields}")
+        names = iter(schema.fields)
+        offset = 0
+        for count, code in items:
+            item_codec = struct.Struct(byte_order + count + code)
+            if code != "x":
+                name = next(names)
+                if name is not None:
+                    schema._field_codecs[name] = (item_codec, offset)
+            offset += item_codec.size
+        return schema
+
+    @classmethod
+    def from_bitstruct(
+        cls,
+        fmt: str,
+        fields: Sequence[Optional[str]],
+        decoders: Optional[Mapping[str, Converter]] = None,
+        encoders: Optional[Mapping[str, Converter]] = None,
+    ) -> "MessageSchema":
+        """
+        Compiles bit-level layout given by `bitstruct` format.
+        """
+        return cls(fmt, bitstruct.compile(fmt), fields, decoders, encoders)
+
+    @property
+    def byte_aligned(self) -> bool:
+        """
+        True if the layout is given by `struct` format.
+        """
+        return isinstance(self._codec, struct.Struct)
+
+    @property
+    def field_formats(self) -> dict[str, tuple[str, int]]:
+        """
+        `struct` format and byte offset of each named field (byte-aligned layouts only).
+        """
+        return {
+            name: (codec.format, offset)
+            for name, (codec, offset) in self._field_codecs.items()
+        }
+
+    @property
+    def size(self) -> int:
+        """
+        Size of the packed message in bytes.
+        """
+        if self.byte_aligned:
+            return int(self._codec.size)
+        return int((self._codec.calcsize() + 7) // 8)
+
+    def decode(self, data: bytes | memoryview) -> dict[str, Any]:
+        """
+        Decodes all fields of the message.
+
+        Args:
+            data: Packed message.
+
+        Returns:
+            Decoded values by field name (reserved values are dropped).
+        """
+        values = {}
+        for name, value in zip(self.fields, self._codec.unpack(data)):
+            if name is not None:
+                decoder = self._decoders.get(name)
+                values[name] = value if decoder is None else decoder(value)
+        return values
+
+    def decode_field(self, data: bytes | memoryview, name: str) -> Any:
+        """
+        Decodes one field of the message.
+
+        Args:
+            data: Packed message.
+            name: Name of the field.
+
+        Returns:
+            Decoded value of the field.
+        """
+        field_codec = self._field_codecs.get(name)
+        if field_codec is None:
+            return self.decode(data)[name]
+        codec, offset = field_codec
+        value = codec.unpack_from(data, offset)[0]
+        decoder = self._decoders.get(name)
+        return value if decoder is None else decoder(value)
+
+    def encode(self, message: Any) -> bytes:
+        """
+        Packs the message.
+
+        Args:
+            message: Object with attributes named by the fields.
+
+        Returns:
+            Packed message.
+        """
+        values = []
+        for name in self.fields:
+            if name is None:
+                values.append(0)
+                continue
+            value = getattr(message, name)
+            encoder = self._encoders.get(name)
+            values.append(value if encoder is None else encoder(value))
+        return bytes(self._codec.pack(*values))
+
+
+class SchemaMessage:
+    """
+    Mixin generating `unpack` and `pack` of a message class from its `SCHEMA`.
+    """
+
+    SCHEMA: ClassVar[MessageSchema]
+
+    @classmethod
+    def unpack(cls, data: bytes) -> Any:
+        """
+        Unpacks the data into the message.
+        """
+        return cls(**cls.SCHEMA.decode(data))
+
+    def pack(self) -> bytes:
+        """
+        Packs the message into bytes.
+        """
+        return self.SCHEMA.encode(self)
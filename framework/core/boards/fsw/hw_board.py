@@ -10,6 +10,9 @@ class HwBoard:
     """Represents the hardware board of the footswitch."""
 
     def __init__(self, adc_driver: AdcDriver, pins_drv: Pins) -> None:
+        self.adc_driver = adc_driver
+        self.pins_drv = pins_drv
+
         self.board_id = adc_driver.get_channel(1, 6)
         self.board_id.multiplier = 1.0
         self.board_id.voltage = 1.13  # FTSW CAT board ID
@@ -1,6 +1,6 @@
 from collections import deque
 from enum import Enum
-from typing import Deque
+from typing import Deque, Dict, Tuple
 
 from framework.core.control.encoder import Encoder
 from framework.core.boards.fsw.hw_board import HwBoard
@@ -112,10 +112,24 @@ class Treadle:
         if strength > 5 or strength < 0:
             raise AttributeError("Strength shall be in range 0-5")
 
-        for switch in self._switches[: strength + 1]:
-            switch.state = value
-        for switch in self._switches[strength:]:
-            switch.state = not value
+        states = [(index < strength) == value for index in range(len(self._switches))]
+        set_many = getattr(self._switches[0].pins_drv, "set_many", None)
+        if set_many is None:
+            for switch, state in zip(self._switches, states):
+                switch.state = state
+            return
+
+        # All switches are changed by one port update (one interrupt per port)
+        ports: Dict[int, Tuple[int, int]] = {}
+        for switch, state in zip(self._switches, states):
+            mask, values = ports.get(switch.port, (0, 0))
+            pin_value = state != switch.active_low
+            ports[switch.port] = (
+                mask | 1 << switch.pin,
+                values | int(pin_value) << switch.pin,
+            )
+        for port, (mask, values) in ports.items():
+            set_many(port, mask, values)
 
     def up(self, strength: int = 5) -> None:
         """
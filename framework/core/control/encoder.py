@@ -1,7 +1,10 @@
+from typing import Optional
+
 from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
     TInterruptCallback,
 )
 from framework.core.control.ftm_channel import FtmChannel
+from framework.support.vtime import TimerEngine
 
 
 class Encoder:
@@ -14,7 +17,11 @@ class Encoder:
         channel: An instance of the FtmChannel class.
     """
 
-    def __init__(self, raise_interrupt_func: TInterruptCallback) -> None:
+    def __init__(
+        self,
+        raise_interrupt_func: TInterruptCallback,
+        timer_engine: Optional[TimerEngine] = None,
+    ) -> None:
         self.min_value = 1
         self.max_value = 3046
         self.channel = FtmChannel(
@@ -23,6 +30,7 @@ class Encoder:
             irq_id=0,
             value=self.min_value,
             interrupt_callback=raise_interrupt_func,
+            timer_engine=timer_engine,
         )
         self.channel.period_us = 3050  # PWM Freq - 328 Hz (3050 us)
 
@@ -1,4 +1,5 @@
 import struct
+from typing import Optional
 
 from framework.support.reports import logger
 from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
@@ -6,6 +7,7 @@ from framework.hardware_interfaces.drivers.common.definitions.interfaces import
     TInterruptCallback,
 )
 from framework.core.control.lpit import Timer
+from framework.support.vtime import TimerEngine
 
 
 class FtmChannel(Timer, FtmChannelABC):
@@ -20,9 +22,10 @@ class FtmChannel(Timer, FtmChannelABC):
         irq_id: int,
         value: int,
         interrupt_callback: TInterruptCallback,
+        timer_engine: Optional[TimerEngine] = None,
     ):
         # Timer ID for internal use have an offset 16
-        super().__init__(channel + 16, irq_id, interrupt_callback)
+        super().__init__(channel + 16, irq_id, interrupt_callback, timer_engine)
         self.instance = instance
         self.channel = channel
         self.value = value
@@ -32,14 +35,16 @@ class FtmChannel(Timer, FtmChannelABC):
         """Internal method to run the timer logic."""
         while True:
             if not self._stop_event.wait(self.period_us / 1_000_000.0):
-                flags = int.from_bytes(
-                    struct.pack(">BBH", self.instance, self.channel, self.value),
-                    byteorder="big",
-                )
-                self.interrupt_callback(self.irq_id, flags)
-                logger.debug(
-                    f"FTM CH {self.channel} timeout, interrupt flags: {flags}."
-                )
+                self._on_timeout()
             else:
                 logger.info(f"FTM CH {self.channel} stopped.")
                 break
+
+    def _on_timeout(self) -> None:
+        """Generate interrupt with instance, channel and value encoded in flags."""
+        flags = int.from_bytes(
+            struct.pack(">BBH", self.instance, self.channel, self.value),
+            byteorder="big",
+        )
+        self.interrupt_callback(self.irq_id, flags)
+        logger.debug(f"FTM CH {self.channel} timeout, interrupt flags: {flags}.")
@@ -6,14 +6,22 @@ from framework.hardware_interfaces.drivers.common.definitions.interfaces import
     TInterruptCallback,
     TimerManagerABC,
 )
-from framework.support.vtime import VirtualTimeWorker, TimeEvent
+from framework.support.vtime import VirtualTimeWorker, TimeEvent, TimerEngine
 
 
 class Timer:
-    """A simple timer class that simulates hardware timer behavior with callbacks on timeouts."""
+    """A simple timer class that simulates hardware timer behavior with callbacks on timeouts.
+
+    By default, the timer runs in its own virtual time worker. When `timer_engine` is provided,
+    the timeouts are executed as callbacks of the shared `TimerEngine` instead.
+    """
 
     def __init__(
-        self, timer_id: int, irq_id: int, interrupt_callback: TInterruptCallback
+        self,
+        timer_id: int,
+        irq_id: int,
+        interrupt_callback: TInterruptCallback,
+        timer_engine: Optional[TimerEngine] = None,
     ):
         self.timer_id = timer_id
         self.irq_id = irq_id
@@ -21,22 +29,35 @@ class Timer:
         self.interrupt_callback = interrupt_callback
         self._timer_thread: Optional[threading.Thread] = None
         self._stop_event = TimeEvent()
+        self._timer_engine = timer_engine
+        self._engine_timer_id: Optional[int] = None
 
     def start(self) -> None:
         """Start the timer."""
-        if self._timer_thread is not None:
+        if self._timer_thread is not None or self._engine_timer_id is not None:
             # If timer is already running - restart it
             logger.info(f"Timer {self.timer_id} is already running, restarting.")
             self.stop()
-        self._stop_event.clear()
-        self._timer_thread = VirtualTimeWorker(target=self._run, daemon=True)
-        self._timer_thread.start()
+        if self._timer_engine is not None:
+            self._engine_timer_id = self._timer_engine.add_timer(
+                lambda: self.period_us, self._on_timeout
+            )
+        else:
+            self._stop_event.clear()
+            self._timer_thread = VirtualTimeWorker(target=self._run, daemon=True)
+            self._timer_thread.start()
         logger.info(
             f"Timer {self.timer_id} started with period {self.period_us} microseconds."
         )
 
     def stop(self) -> None:
         """Stop the timer."""
+        if self._timer_engine is not None and self._engine_timer_id is not None:
+            logger.debug(f"Timer {self.timer_id} stop called.")
+            self._timer_engine.remove_timer(self._engine_timer_id)
+            self._engine_timer_id = None
+            logger.info(f"Timer {self.timer_id} stopped.")
+            return
         if self._timer_thread is None:
             # Stop API could be called multiple times in a row by the emulator
             logger.debug(f"Timer {self.timer_id} is not running.")
@@ -50,19 +71,27 @@ class Timer:
         """Internal method to run the timer logic."""
         while True:
             if not self._stop_event.wait(self.period_us / 1_000_000.0):
-                self.interrupt_callback(self.irq_id)
-                logger.debug(f"Timer {self.timer_id} timeout, interrupt generated.")
+                self._on_timeout()
             else:
                 logger.info(f"Timer {self.timer_id} stopped.")
                 break
 
+    def _on_timeout(self) -> None:
+        """Generate interrupt when the timer period elapses."""
+        self.interrupt_callback(self.irq_id)
+        logger.debug(f"Timer {self.timer_id} timeout, interrupt generated.")
+
 
 class TimerManager(TimerManagerABC):
-    """Manages multiple independent timers."""
+    """Manages multiple independent timers.
+
+    If `timer_engine` is provided, all created timers are driven by it instead of running in own workers.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, timer_engine: Optional[TimerEngine] = None) -> None:
         self.timers: Dict[int, Timer] = {}
         self.lock = threading.Lock()
+        self.timer_engine = timer_engine
 
     def create_timer(
         self, timer_id: int, irq_id: int, callback: TInterruptCallback
@@ -72,7 +101,9 @@ class TimerManager(TimerManagerABC):
             if timer_id in self.timers:
                 logger.error(f"Timer with ID {timer_id} already exists.")
                 return
-            self.timers[timer_id] = Timer(timer_id, irq_id, callback)
+            self.timers[timer_id] = Timer(
+                timer_id, irq_id, callback, self.timer_engine
+            )
             logger.info(f"Timer with ID {timer_id} created with IRQ ID {irq_id}.")
 
     def start_timer(self, timer_id: int) -> None:
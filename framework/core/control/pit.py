@@ -14,8 +14,7 @@
 #   - Access to PITChannelManagerABC class.
 #   - Access to TInterruptCallback class.
 # - vtime module (local)
-#   - Access to VirtualTimeWorker class.
-#   - Access to TimeEvent class.
+#   - Access to TimerEngine class.
 #
 # @section notes_pit Notes
 # - None.
@@ -32,7 +31,7 @@
 # Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved.
 
 import threading
-from typing import Dict
+from typing import Dict, Optional
 
 from framework.hardware_interfaces.drivers.common.definitions.channel import Channel
 from framework.support.reports import logger
@@ -40,14 +39,19 @@ from framework.hardware_interfaces.drivers.common.definitions.interfaces import
     TInterruptCallback,
     PITChannelManagerABC,
 )
+from framework.support.vtime import TimerEngine
 
 
 class PITChannelManager(PITChannelManagerABC):
-    """! Manages multiple independent timers."""
+    """! Manages multiple independent timers.
 
-    def __init__(self) -> None:
+    If `timer_engine` is provided, all created channels are driven by it instead of running in own workers.
+    """
+
+    def __init__(self, timer_engine: Optional[TimerEngine] = None) -> None:
         self.channels: Dict[int, Channel] = {}
         self.lock = threading.Lock()
+        self.timer_engine = timer_engine
 
     def create_channel(self, channel_id: int) -> None:
         """! Create a channel with a given ID."""
@@ -55,7 +59,9 @@ class PITChannelManager(PITChannelManagerABC):
             if channel_id in self.channels:
                 logger.error(f"Channel with ID {channel_id} already exists.")
                 return
-            self.channels[channel_id] = Channel(channel_id)
+            self.channels[channel_id] = Channel(
+                channel_id, timer_engine=self.timer_engine
+            )
             logger.info(f"Channel with ID {channel_id}.")
 
     def start_channel(self, channel_id: int) -> None:
@@ -3,18 +3,30 @@ from typing import Optional, Callable
 
 from framework.support.reports import logger
 
-from framework.support.vtime import VirtualTimeWorker, TimeEvent
+from framework.support.vtime import VirtualTimeWorker, TimeEvent, TimerEngine
+
+RTC_PERIOD_US = 1_000_000
 
 
 class RTC_Timer:
-    """A simple timer class that simulates RTC behavior with interrupts every second."""
+    """A simple timer class that simulates RTC behavior with interrupts every second.
+
+    When `timer_engine` is provided, the seconds are counted by the shared TimerEngine instead of own worker.
+    """
 
-    def __init__(self, irq_id: int, raise_interrupt_func: Callable[[int, int], None]):
+    def __init__(
+        self,
+        irq_id: int,
+        raise_interrupt_func: Callable[[int, int], None],
+        timer_engine: Optional[TimerEngine] = None,
+    ):
         with threading.Lock():
             self.irq_id = irq_id
             self._timer_thread: Optional[threading.Thread] = None
             self._stop_event = TimeEvent()
             self._raise_interrupt = raise_interrupt_func
+            self._timer_engine = timer_engine
+            self._engine_timer_id: Optional[int] = None
 
             self._time_seconds: int = 1704067200  # 00:00:00 UTC on 1 January 2024
 
@@ -42,17 +54,28 @@ class RTC_Timer:
 
     def start(self) -> None:
         """Start the clock."""
-        if self._timer_thread is not None:
+        if self._timer_thread is not None or self._engine_timer_id is not None:
             # If timer is already running - restart it
             logger.info("RTC is already running, restarting.")
             self.stop()
-        self._stop_event.clear()
-        self._timer_thread = VirtualTimeWorker(target=self._run, daemon=True)
-        self._timer_thread.start()
+        if self._timer_engine is not None:
+            self._engine_timer_id = self._timer_engine.add_timer(
+                lambda: RTC_PERIOD_US, self._on_timeout
+            )
+        else:
+            self._stop_event.clear()
+            self._timer_thread = VirtualTimeWorker(target=self._run, daemon=True)
+            self._timer_thread.start()
         logger.info("RTC started.")
 
     def stop(self) -> None:
         """Stop the clock."""
+        if self._timer_engine is not None and self._engine_timer_id is not None:
+            logger.debug("RTC stop called.")
+            self._timer_engine.remove_timer(self._engine_timer_id)
+            self._engine_timer_id = None
+            logger.info("RTC stopped.")
+            return
         if self._timer_thread is None:
             # Stop API could be called multiple times in a row by the emulator
             logger.debug("RTC is not running.")
@@ -69,10 +92,14 @@ class RTC_Timer:
         This method is called in a separate thread.
         """
         while True:
-            if not self._stop_event.wait(1):
-                self._add_second()
-                self._raise_interrupt(self.irq_id, self._get_seconds())
-                logger.debug("RTC timeout, interrupt generated.")
+            if not self._stop_event.wait(RTC_PERIOD_US / 1_000_000.0):
+                self._on_timeout()
             else:
                 logger.info("RTC stopped.")
                 break
+
+    def _on_timeout(self) -> None:
+        """Increment the time and raise the seconds interrupt."""
+        self._add_second()
+        self._raise_interrupt(self.irq_id, self._get_seconds())
+        logger.debug("RTC timeout, interrupt generated.")
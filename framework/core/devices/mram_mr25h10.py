@@ -1,7 +1,14 @@
+import mmap
+import os
+from enum import IntEnum
+from typing import BinaryIO
+
 from framework.hardware_interfaces.drivers.s32k148.s32k148_sif_driver import (
     SynchronousIfDevice,
 )
-from enum import IntEnum
+
+MRAM_SIZE = 128 * 1024
+ERASED_BYTE = 0xFF
 
 
 class Commands(IntEnum):
@@ -19,18 +26,50 @@ class MramMr25h10(SynchronousIfDevice):
     """
     A class to represent the MR25H10 MRAM.
 
+    The memory is a `bytearray`, or a shared `mmap` of an image file when `mmap_image` is set (writes of the
+    firmware then go directly to the file). Data are copied by slices and can be read without copying through
+    `read_memory`.
+
     Attributes:
         _cmd (Commands): The command for the MRAM.
         _addr (int): The address for the MRAM.
-        _sim_data (list[int]): The simulated data for the MRAM.
+        _sim_data (bytearray | mmap.mmap): The simulated data for the MRAM.
+        _image (BinaryIO | None): The image file mapped to the memory.
         _write_en (bool): A flag to indicate whether the MRAM is in write mode.
     """
 
-    def __init__(self, instance_id: int, address: int) -> None:
+    def __init__(
+        self,
+        instance_id: int,
+        address: int,
+        image_path: str | os.PathLike | None = None,
+        mmap_image: bool = False,
+    ) -> None:
+        """
+        Initialize the MRAM.
+
+        Args:
+            instance_id (int): The instance ID of the synchronous interface.
+            address (int): The address of the device.
+            image_path (str | os.PathLike, optional): The image preloaded to the memory. Defaults to None (erased
+                memory).
+            mmap_image (bool, optional): True to map the image file to the memory instead of preloading it. The file
+                is created (erased) or extended to the MRAM size if needed. Defaults to False.
+        """
         super().__init__(instance_id, address)
         self._cmd = Commands.READ
         self._addr = 0
-        self._sim_data: list[int] = [0xFF] * (128 * 1024)
+        self._image: BinaryIO | None = None
+        self._sim_data: bytearray | mmap.mmap
+        if mmap_image:
+            if image_path is None:
+                raise ValueError("Image path is required to map the MRAM image")
+            self._image = _open_image(image_path)
+            self._sim_data = mmap.mmap(self._image.fileno(), MRAM_SIZE)
+        else:
+            self._sim_data = bytearray([ERASED_BYTE]) * MRAM_SIZE
+            if image_path is not None:
+                self.load(image_path)
         self._write_en = False
 
     def write_to_memory(self, addr: int, data: bytes) -> None:
@@ -41,8 +80,57 @@ class MramMr25h10(SynchronousIfDevice):
             addr (int): The address to write the data to.
             data (bytes): The data to write to the memory.
         """
-        for i in range(0, len(data)):
-            self._sim_data[addr + i] = int(data[i])
+        if addr < 0 or addr + len(data) > MRAM_SIZE:
+            raise IndexError(
+                f"MRAM write of {len(data)} bytes at 0x{addr:05X} is out of range"
+            )
+        self._sim_data[addr : addr + len(data)] = data
+
+    def read_memory(self, addr: int, size: int) -> memoryview:
+        """
+        Read data from the memory without copying.
+
+        Args:
+            addr (int): The address to read the data from.
+            size (int): The size of the data to read.
+
+        Returns:
+            memoryview: The view of the memory, valid until the memory is closed.
+        """
+        return memoryview(self._sim_data)[addr : addr + size]
+
+    def load(self, path: str | os.PathLike) -> None:
+        """
+        Load the memory from an image file. Image shorter than the memory is loaded from address 0, the rest of
+        the memory is kept.
+
+        Args:
+            path (str | os.PathLike): The path of the image.
+        """
+        with open(path, "rb") as image:
+            image.readinto(memoryview(self._sim_data))
+
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Save the memory to an image file.
+
+        Args:
+            path (str | os.PathLike): The path of the image.
+        """
+        with open(path, "wb") as image:
+            image.write(self._sim_data)
+
+    def close(self) -> None:
+        """
+        Flush and unmap the mapped image. The memory can't be used afterwards.
+        """
+        if self._image is None:
+            return
+        assert isinstance(self._sim_data, mmap.mmap)
+        self._sim_data.flush()
+        self._sim_data.close()
+        self._image.close()
+        self._image = None
 
     def read(self, size: int) -> bytes:
         """
@@ -55,9 +143,7 @@ class MramMr25h10(SynchronousIfDevice):
             bytes: The data read from the memory.
         """
         if self._cmd == Commands.READ:
-            return bytes([0x00] * 4) + bytes(
-                self._sim_data[self._addr : (self._addr + size - 4)]
-            )
+            return bytes(4) + self._sim_data[self._addr : (self._addr + size - 4)]
         else:
             return bytes([0xFF] * size)
 
@@ -73,9 +159,26 @@ class MramMr25h10(SynchronousIfDevice):
             self._addr = (data[1] << 16) | (data[2] << 8) | data[3]
         if self._cmd == Commands.WRITE:
             if self._write_en:
-                for i in range(0, len(data) - 4):
-                    self._sim_data[self._addr + i] = data[i + 4]
+                self.write_to_memory(self._addr, memoryview(data)[4:])
         elif self._cmd == Commands.WRITE_EN:
             self._write_en = True
         elif self._cmd == Commands.WRITE_DIS:
             self._write_en = False
+
+
+def _open_image(path: str | os.PathLike) -> BinaryIO:
+    """
+    Open the image file for mapping, the file is created or extended to the MRAM size by erased bytes.
+
+    Args:
+        path (str | os.PathLike): The path of the image.
+
+    Returns:
+        BinaryIO: The image file opened for reading and writing.
+    """
+    image = open(path, "a+b")
+    size = image.seek(0, os.SEEK_END)
+    if size < MRAM_SIZE:
+        image.write(bytes([ERASED_BYTE]) * (MRAM_SIZE - size))
+        image.flush()
+    return image
@@ -0,0 +1,47 @@
+from types import TracebackType
+from typing import Any, List, Optional, Type
+
+from framework.hardware_interfaces.drivers.common.definitions.interrupt_batch import (
+    InterruptBatch,
+)
+
+
+class PinTransaction:
+    """
+    ! Atomic change of pins and ADC channels.
+
+    Within the transaction the values are changed immediately, but update interrupts of the given drivers
+    (S32K148 and MPC5777C pin drivers, ADC driver) are held back. On exit one coalesced interrupt per port (per pin
+    for MPC5777C pins, per channel for ADC) is raised with the final values, all at the same virtual time, so the
+    firmware sees the whole change at once.
+
+    Example:
+        with PinTransaction(board.pins_drv, board.adc_driver):
+            board.cable_in.state = True
+            board.cable_voltage.voltage = 24.0
+    """
+
+    def __init__(self, *drivers: Any) -> None:
+        """
+        ! Create the transaction.
+
+        @param drivers  Drivers with `interrupt_batch` whose interrupts are coalesced.
+        """
+        self._batches: List[InterruptBatch] = [
+            driver.interrupt_batch for driver in drivers
+        ]
+
+    def __enter__(self) -> "PinTransaction":
+        for batch in self._batches:
+            batch.hold()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        # Values already changed are committed even if the transaction body failed
+        for batch in self._batches:
+            batch.release()
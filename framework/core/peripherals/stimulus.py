@@ -0,0 +1,307 @@
+import abc
+import dataclasses
+import itertools
+import threading
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from framework.support.reports import logger
+from framework.support.vtime import TimeEvent, TimerEngine
+
+
+class Waveform(abc.ABC):
+    """
+    ! Declarative waveform applied to a stimulus target.
+
+    The waveform is a sequence of value changes, each given by offset from the waveform start in microseconds.
+    Values are written to attribute `attribute` of the target (`state` of `DigitalInput`/`Button`, `voltage` of
+    `AdcChannel`).
+    """
+
+    attribute = "state"
+
+    @abc.abstractmethod
+    def changes(self) -> Iterator[Tuple[int, Any]]:
+        """
+        ! Generate value changes of the waveform.
+
+        @return Iterator of (offset in microseconds, value) pairs with non-decreasing offsets.
+        """
+
+
+@dataclasses.dataclass
+class PiecewiseLinear(Waveform):
+    """
+    ! Piecewise-linear voltage waveform, e.g. charging voltage ramp of an ADC channel.
+
+    @param points  (time in seconds, voltage) breakpoints with increasing times, the first one is usually at 0.
+    @param step  Sampling interval of the ramps in seconds. Samples not changing the voltage are skipped.
+    """
+
+    points: Sequence[Tuple[float, float]]
+    step: float = 0.001
+
+    attribute = "voltage"
+
+    def changes(self) -> Iterator[Tuple[int, Any]]:
+        step_us = max(_to_us(self.step), 1)
+        last_voltage: Optional[float] = None
+        for (start, start_voltage), (end, end_voltage) in zip(
+            self.points, self.points[1:]
+        ):
+            start_us, end_us = _to_us(start), _to_us(end)
+            for offset_us in range(start_us, end_us, step_us):
+                voltage = start_voltage + (end_voltage - start_voltage) * (
+                    offset_us - start_us
+                ) / (end_us - start_us)
+                if voltage != last_voltage:
+                    last_voltage = voltage
+                    yield offset_us, voltage
+        if self.points and self.points[-1][1] != last_voltage:
+            yield _to_us(self.points[-1][0]), self.points[-1][1]
+
+
+@dataclasses.dataclass
+class Pwm(Waveform):
+    """
+    ! PWM-like pin toggling.
+
+    @param period  Period in seconds.
+    @param duty  Part of the period the pin is active (0.0 - 1.0).
+    @param cycles  Number of periods. The pin is left inactive after the last one.
+    """
+
+    period: float
+    duty: float = 0.5
+    cycles: int = 1
+
+    def changes(self) -> Iterator[Tuple[int, Any]]:
+        period_us = _to_us(self.period)
+        active_us = _to_us(self.period * self.duty)
+        for cycle in range(self.cycles):
+            if active_us > 0:
+                yield cycle * period_us, True
+            if active_us < period_us:
+                yield cycle * period_us + active_us, False
+
+
+@dataclasses.dataclass
+class Bounce(Waveform):
+    """
+    ! Contact bounce of a switch settling to the given state.
+
+    The pin toggles at the given intervals, starting with the final state, and ends in the final state.
+    E.g. `Bounce(True, [0.001, 0.0005, 0.002])` presses, releases after 1 ms, presses after 0.5 ms, releases after
+    2 ms and settles pressed after another interval of the last length.
+
+    @param state  Final state of the switch.
+    @param intervals  Intervals between the bounces in seconds.
+    @param hold  Time the final state is held in seconds, followed by the opposite state (None - kept).
+    """
+
+    state: bool
+    intervals: Sequence[float]
+    hold: Optional[float] = None
+
+    def changes(self) -> Iterator[Tuple[int, Any]]:
+        offset_us = 0
+        value = self.state
+        for interval in self.intervals:
+            yield offset_us, value
+            offset_us += _to_us(interval)
+            value = not value
+        if value != self.state:
+            # Odd number of intervals - one more bounce to end in the final state
+            yield offset_us, value
+            offset_us += _to_us(self.intervals[-1])
+        yield offset_us, self.state
+        if self.hold is not None:
+            yield offset_us + _to_us(self.hold), not self.state
+
+
+@dataclasses.dataclass(eq=False)
+class _Stimulus:
+    """
+    ! Waveform being played on a target.
+    """
+
+    target: Any
+    attribute: str
+    changes: Iterator[Tuple[int, Any]]
+    value: Any
+    offset_us: int
+    next_change: Optional[Tuple[int, Any]]
+    done: TimeEvent = dataclasses.field(default_factory=TimeEvent)
+    timer_id: int = 0
+
+
+class StimulusEngine:
+    """
+    ! Player of declarative waveforms on pins and ADC channels.
+
+    Value changes of all played waveforms are executed as timer callbacks of one `TimerEngine` worker, so a waveform
+    is one call of the test and its edges cost no test thread round trips through virtual time. Changes are
+    generated lazily, long ramps are not expanded in advance.
+
+    Example:
+        stimulus = StimulusEngine()
+        stimulus.play(board.cable_voltage, PiecewiseLinear([(0, 0.0), (10, 24.0)], step=0.01))
+        stimulus.play(buttons.left_heel, Bounce(True, [0.001, 0.0005, 0.002], hold=0.5))
+        stimulus.wait_all()
+    """
+
+    def __init__(self, engine: Optional[TimerEngine] = None) -> None:
+        """
+        ! Create the engine.
+
+        @param engine  Timer engine executing the value changes (None - own engine).
+        """
+        self._engine = engine if engine is not None else TimerEngine()
+        self._stimuli: Dict[int, _Stimulus] = {}
+        self._stimulus_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def play(self, target: Any, waveform: Waveform, delay: float = 0.0) -> int:
+        """
+        ! Start playing the waveform on the target.
+
+        @param target  `DigitalInput`, `Button` or `AdcChannel` (any object with attribute `waveform.attribute`).
+        @param waveform  The waveform.
+        @param delay  Delay of the waveform start in seconds.
+        @return ID of the stimulus.
+        """
+        changes = waveform.changes()
+        first_change = next(changes, None)
+        if first_change is None:
+            logger.debug(f"Empty waveform {waveform} is not played.")
+            return 0
+        offset_us, value = first_change
+        stimulus = _Stimulus(
+            target=target,
+            attribute=waveform.attribute,
+            changes=changes,
+            value=value,
+            offset_us=offset_us,
+            next_change=next(changes, None),
+        )
+        self._collapse(stimulus)
+        with self._lock:
+            stimulus_id = next(self._stimulus_ids)
+            self._stimuli[stimulus_id] = stimulus
+            stimulus.timer_id = self._engine.add_timer(
+                lambda: self._time_to_next_change(stimulus),
+                lambda: self._apply(stimulus_id, stimulus),
+                delay_us=_to_us(delay) + offset_us,
+            )
+        return stimulus_id
+
+    def stop(self, stimulus_id: int) -> None:
+        """
+        ! Stop playing the stimulus, the target keeps its current value.
+
+        @param stimulus_id  ID of the stimulus returned by `play`.
+        """
+        self._finish(stimulus_id)
+
+    def stop_all(self) -> None:
+        """
+        ! Stop playing all stimuli.
+        """
+        for stimulus_id in list(self._stimuli):
+            self._finish(stimulus_id)
+
+    def is_playing(self, stimulus_id: int) -> bool:
+        """
+        ! Check whether the stimulus is still played.
+
+        @param stimulus_id  ID of the stimulus returned by `play`.
+        """
+        return stimulus_id in self._stimuli
+
+    def wait(self, stimulus_id: int, timeout: Optional[float] = None) -> bool:
+        """
+        ! Wait in virtual time until the last change of the stimulus is applied.
+
+        @param stimulus_id  ID of the stimulus returned by `play`.
+        @param timeout  Timeout in seconds (None - no timeout).
+        @return True if the stimulus finished, False on timeout.
+        """
+        stimulus = self._stimuli.get(stimulus_id)
+        return stimulus is None or stimulus.done.wait(timeout)
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """
+        ! Wait in virtual time until all stimuli finish.
+
+        @param timeout  Timeout in seconds for each stimulus (None - no timeout).
+        @return True if all stimuli finished, False on timeout.
+        """
+        return all(
+            self.wait(stimulus_id, timeout) for stimulus_id in list(self._stimuli)
+        )
+
+    def _apply(self, stimulus_id: int, stimulus: _Stimulus) -> None:
+        """
+        ! Apply the current value of the stimulus and move to its next change.
+
+        A stimulus whose value can't be applied or whose next change can't be generated is logged and finished, so
+        its waiters are released.
+        """
+        try:
+            setattr(stimulus.target, stimulus.attribute, stimulus.value)
+            if stimulus.next_change is not None:
+                stimulus.offset_us, stimulus.value = stimulus.next_change
+                stimulus.next_change = next(stimulus.changes, None)
+                self._collapse(stimulus)
+                return
+        except Exception:
+            logger.exception(
+                f"Stimulus {stimulus_id} failed on {stimulus.target}.{stimulus.attribute}, stopping it."
+            )
+        self._finish(stimulus_id)
+
+    @staticmethod
+    def _collapse(stimulus: _Stimulus) -> None:
+        """
+        ! Collapse changes at the time of the current change to the last one.
+
+        The next change is then always later than the current one, so the time to it is known before the current
+        change is applied.
+        """
+        while (
+            stimulus.next_change is not None
+            and stimulus.next_change[0] <= stimulus.offset_us
+        ):
+            stimulus.value = stimulus.next_change[1]
+            stimulus.next_change = next(stimulus.changes, None)
+
+    @staticmethod
+    def _time_to_next_change(stimulus: _Stimulus) -> int:
+        """
+        ! Get time between the current and the next change of the stimulus.
+
+        The engine evaluates it when the current change expires, before the change is applied.
+        """
+        if stimulus.next_change is None:
+            return 1
+        return stimulus.next_change[0] - stimulus.offset_us
+
+    def _finish(self, stimulus_id: int) -> None:
+        """
+        ! Remove the stimulus from the engine and signal its end.
+
+        The engine is not stopped, its worker finishes by itself when the last timer is removed and a stimulus played
+        meanwhile starts it again.
+        """
+        with self._lock:
+            stimulus = self._stimuli.pop(stimulus_id, None)
+            if stimulus is not None:
+                self._engine.remove_timer(stimulus.timer_id)
+        if stimulus is not None:
+            stimulus.done.set()
+
+
+def _to_us(seconds: float) -> int:
+    """
+    ! Convert seconds to microseconds.
+    """
+    return int(round(seconds * 1_000_000))
@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Optional
 
 from framework.hardware_interfaces.drivers.common.connect import Connect
 from framework.hardware_interfaces.drivers.common.flexcan_driver import FlexCanDriver
@@ -47,6 +47,7 @@ from framework.hardware_interfaces.drivers.s32k148.s32k148_sif_driver import (
 from framework.hardware_interfaces.drivers.s32k148.s32k148_pins_driver import (
     PinDriver as S32k148PinDriver,
 )
+from framework.support.vtime import TimerEngine
 
 
 def get_etpu_i2c_drv(raise_interrupt_func: Callable[[int, int], None]) -> EtpuI2cDriver:
@@ -65,11 +66,14 @@ def get_emios_qdec_drv(
     return EmiosQdecDriver(raise_interrupt_func)
 
 
-def get_emios_mc_drv(raise_interrupt_func: TInterruptCallback | None) -> EmiosMcDriver:
+def get_emios_mc_drv(
+    raise_interrupt_func: TInterruptCallback | None,
+    timer_engine: Optional[TimerEngine] = None,
+) -> EmiosMcDriver:
     """
     ! Get the EMIOS driver for MC.
     """
-    return EmiosMcDriver(raise_interrupt_func)
+    return EmiosMcDriver(raise_interrupt_func, timer_engine)
 
 
 def get_emios_common_drv(
@@ -83,11 +87,12 @@ def get_emios_common_drv(
 
 def get_can_bus_drv(
     raise_interrupt_func: Callable[[int, int], None],
+    pipelined_tx: bool = False,
 ) -> FlexCanDriver:
     """
     ! Get the CAN bus driver.
     """
-    return FlexCanDriver(raise_interrupt_func)
+    return FlexCanDriver(raise_interrupt_func, pipelined_tx)
 
 
 def get_mcan_drv(
@@ -155,11 +160,14 @@ def get_pwm_drv() -> PwmDriver:
     return PwmDriver()
 
 
-def get_rtc_drv(raise_interrupt_func: TInterruptCallback) -> RtcDriver:
+def get_rtc_drv(
+    raise_interrupt_func: TInterruptCallback,
+    timer_engine: Optional[TimerEngine] = None,
+) -> RtcDriver:
     """
     ! Get the RTC driver.
     """
-    return RtcDriver(raise_interrupt_func)
+    return RtcDriver(raise_interrupt_func, timer_engine)
 
 
 def get_rpc_connect() -> Connect:
@@ -0,0 +1,189 @@
+"""! @Brief Array-backed bank of simulated ADC channels."""
+
+#
+# @file adc_bank.py
+#
+# @brief Array-backed bank of simulated ADC channels.
+#
+# @section description_adc_bank Description
+# This module represents the AdcBank class keeping parameters of ADC channels in arrays and converting
+# voltages of all channels to counts in one step.
+#
+# @section libraries_adc_bank Libraries/Modules
+# - random standard library
+# - threading standard library
+# - typing standard library
+# - numpy (optional, https://numpy.org/)
+#
+# @section notes_adc_bank Notes
+# - Without NumPy the arrays are kept as lists and counts are computed channel by channel.
+#
+# @section todo_adc_bank TODO
+# - None.
+#
+# Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved.
+import random
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, channel arrays are kept as lists without it
+    np = None
+
+FIELDS = ("voltage", "multiplier", "gain", "offset", "noise", "vref_mv", "max_counts")
+
+
+class AdcBank:
+    """
+    ! Parameters of ADC channels kept in arrays, one slot per channel.
+
+    Counts of a channel are computed as
+
+        counts = trunc(voltage * multiplier * 1000 / vref_mv * max_counts * gain + offset + noise)
+
+    clipped to 0 - max_counts, where noise is an integer drawn uniformly from -noise - +noise. With the default
+    gain (1.0), offset (0.0) and noise (0) the counts are the plain conversion of the voltage. Counts of any set of
+    channels are computed in one vectorized step when NumPy is available. Channels with no reference voltage
+    (not initialized) read 0 counts.
+    """
+
+    def __init__(
+        self,
+        vref_mv: int = 0,
+        max_counts: int = 0,
+        seed: Optional[int] = None,
+        use_numpy: Optional[bool] = None,
+    ) -> None:
+        """
+        ! Create an empty bank.
+
+        @param vref_mv  Default reference voltage of added channels in millivolts (0 - not initialized).
+        @param max_counts  Default maximum counts of added channels.
+        @param seed  Seed of the noise generator (None - random).
+        @param use_numpy  True to keep the channels in NumPy arrays, False in lists (None - NumPy if installed).
+        """
+        if use_numpy and np is None:
+            raise ImportError("NumPy is required for array-backed ADC bank")
+        self._use_numpy = np is not None if use_numpy is None else use_numpy
+        self._defaults: Dict[str, float] = {
+            "voltage": 0.0,
+            "multiplier": 1.0,
+            "gain": 1.0,
+            "offset": 0.0,
+            "noise": 0,
+            "vref_mv": vref_mv,
+            "max_counts": max_counts,
+        }
+        self._fields: Dict[str, Any] = {
+            name: np.zeros(0, dtype=float) if self._use_numpy else [] for name in FIELDS
+        }
+        self._rng: Any = (
+            np.random.default_rng(seed) if self._use_numpy else random.Random(seed)
+        )
+        self._lock = threading.Lock()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add_channel(self, **values: float) -> int:
+        """
+        ! Add a channel slot.
+
+        @param values  Initial values of the fields (see `FIELDS`), other fields get the defaults.
+        @return Index of the channel in the bank.
+        """
+        unknown = set(values) - set(FIELDS)
+        if unknown:
+            raise KeyError(f"Unknown ADC bank fields: {sorted(unknown)}")
+        with self._lock:
+            for name in FIELDS:
+                value = values.get(name, self._defaults[name])
+                if self._use_numpy:
+                    self._fields[name] = np.append(self._fields[name], value)
+                else:
+                    self._fields[name].append(value)
+            self._size += 1
+            return self._size - 1
+
+    def get(self, name: str, index: int) -> float:
+        """
+        ! Get a field of one channel.
+
+        @param name  Name of the field (see `FIELDS`).
+        @param index  Index of the channel.
+        @return Value of the field.
+        """
+        value = self._fields[name][index]
+        return value.item() if self._use_numpy else value
+
+    def set(self, name: str, indices: int | Sequence[int], values: Any) -> None:
+        """
+        ! Set a field of one or more channels in one step.
+
+        @param name  Name of the field (see `FIELDS`).
+        @param indices  Index of the channel or sequence of indices.
+        @param values  Value for all the channels or sequence of values, one per index.
+        """
+        field = self._fields[name]
+        if self._use_numpy:
+            field[indices] = values
+            return
+        if isinstance(indices, int):
+            field[indices] = values
+            return
+        if isinstance(values, (int, float)):
+            values = [values] * len(indices)
+        for index, value in zip(indices, values):
+            field[index] = value
+
+    def counts(self, indices: Optional[Sequence[int]] = None) -> List[int]:
+        """
+        ! Convert voltages of the channels to counts.
+
+        @param indices  Indices of the channels (None - all channels).
+        @return Counts of the channels, in order of the indices.
+        """
+        if self._use_numpy:
+            return self._counts_numpy(indices)
+        return [
+            self._counts_of(index)
+            for index in (range(self._size) if indices is None else indices)
+        ]
+
+    def _counts_numpy(self, indices: Optional[Sequence[int]]) -> List[int]:
+        """
+        ! Compute counts of the channels by vectorized operations.
+        """
+        selection: Any = (
+            slice(None) if indices is None else np.asarray(indices, dtype=np.intp)
+        )
+        fields = {name: self._fields[name][selection] for name in FIELDS}
+        vref_mv = fields["vref_mv"]
+        ratio = np.divide(
+            fields["voltage"] * fields["multiplier"] * 1000,
+            vref_mv,
+            out=np.zeros_like(vref_mv),
+            where=vref_mv != 0,
+        )
+        raw = ratio * fields["max_counts"] * fields["gain"] + fields["offset"]
+        noise = fields["noise"].astype(np.int64)
+        if noise.any():
+            raw = raw + self._rng.integers(-noise, noise, endpoint=True)
+        return np.clip(np.trunc(raw), 0, fields["max_counts"]).astype(np.int64).tolist()
+
+    def _counts_of(self, index: int) -> int:
+        """
+        ! Compute counts of one channel kept in lists.
+        """
+        fields = {name: self._fields[name][index] for name in FIELDS}
+        if not fields["vref_mv"]:
+            return 0
+        raw = (
+            fields["voltage"] * fields["multiplier"] * 1000 / fields["vref_mv"]
+        ) * fields["max_counts"] * fields["gain"] + fields["offset"]
+        noise = int(fields["noise"])
+        if noise:
+            raw += self._rng.randint(-noise, noise)
+        return min(max(int(raw), 0), int(fields["max_counts"]))
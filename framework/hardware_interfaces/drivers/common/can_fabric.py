@@ -0,0 +1,481 @@
+"""! @Brief In-process CAN bus fabric connecting simulated CAN nodes."""
+
+#
+# @file can_fabric.py
+#
+# @brief In-process CAN bus fabric connecting simulated CAN nodes.
+#
+# @section description_can_fabric Description
+# This module represents the CanFabric class and its nodes: CanFabricPort (CAN driver instance attached
+# to the fabric) and CanFabricEndpoint (test-side CanBus attached to the fabric).
+#
+# @section libraries_can_fabric Libraries/Modules
+# - heapq standard library
+# - itertools standard library
+# - threading standard library
+# - queue standard library
+# - typing standard library
+# - vtime module (local)
+# - reports module (local)
+# - hardware_interfaces module (local)
+#   - Access to CanBus class.
+#   - Access to CanMessage class.
+#
+# @section notes_can_fabric Notes
+# - Frame durations are computed without bit stuffing.
+#
+# @section todo_can_fabric TODO
+# - None.
+#
+# Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved.
+import heapq
+import itertools
+import threading
+from queue import Empty, Full
+from typing import Any, List, Optional, Protocol, Tuple
+
+from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
+    CanBus,
+    CanMessage,
+)
+from framework.support.reports import logger
+from framework.support.vtime import (
+    OverflowPolicy,
+    Queue,
+    TimeEvent,
+    VirtualTimeWorker,
+    join_worker,
+    vtime_manager,
+)
+
+# SOF, 11-bit ID, RTR, IDE, r0, DLC, CRC, CRC delimiter, ACK, ACK delimiter, EOF, intermission
+STANDARD_FRAME_OVERHEAD_BITS = 47
+# SOF, 11-bit ID, SRR, IDE, 18-bit ID, RTR, r1, r0, DLC, CRC, delimiters, ACK, EOF, intermission
+EXTENDED_FRAME_OVERHEAD_BITS = 67
+
+
+def frame_bits(msg: CanMessage) -> int:
+    """
+    ! Number of bits the frame occupies on the bus (without bit stuffing).
+    """
+    overhead = (
+        EXTENDED_FRAME_OVERHEAD_BITS
+        if msg.is_extended_id
+        else STANDARD_FRAME_OVERHEAD_BITS
+    )
+    return overhead + (0 if msg.is_remote_frame else 8 * msg.dlc)
+
+
+def arbitration_key(msg: CanMessage) -> Tuple[int, bool, int]:
+    """
+    ! Priority of the frame in bus arbitration, lower wins.
+
+    The 11-bit base ID is compared first; on equal base ID a standard frame wins over an extended one
+    (dominant IDE bit), extended frames are then ordered by the 18-bit ID extension.
+    """
+    if msg.is_extended_id:
+        return msg.arbitration_id >> 18, True, msg.arbitration_id
+    return msg.arbitration_id, False, msg.arbitration_id
+
+
+class _FabricNode(Protocol):
+    """
+    ! Node attached to the fabric.
+    """
+
+    name: str
+
+    def accepts(self, msg: CanMessage) -> bool:
+        """
+        ! True if the frame passes the acceptance filter of the node.
+        """
+
+    def deliver(self, msg: CanMessage) -> None:
+        """
+        ! Hand the frame over to the node, shall not block.
+        """
+
+    def close(self) -> None:
+        """
+        ! Detach the node from the fabric.
+        """
+
+
+class CanFabric:
+    """! Shared in-process CAN bus connecting several simulated nodes.
+
+    Driver instances (`FlexCanDriver`, `MCANDriver`) are attached by `attach`, test-side buses by `endpoint`.
+    A frame transmitted by a node is delivered once to every other node whose acceptance filter passes it
+    (driver nodes use the receive mailbox configuration of the firmware), so no node keeps a copy of traffic it
+    does not receive.
+
+    All pending frames are arbitrated by one dispatcher worker: the frame with the highest priority (lowest
+    arbitration ID, see `arbitration_key`) is transmitted first. In timed mode the dispatcher occupies the bus
+    for the duration of each frame at `bitrate` in virtual time, so frames queued meanwhile take part in the
+    next arbitration. The number of transmitted bits is accounted against the virtual clock to get the bus
+    load.
+    """
+
+    def __init__(self, bitrate: int = 500_000, timed: bool = False) -> None:
+        """
+        ! Create the fabric.
+
+        @param bitrate  Nominal bitrate of the bus in bits/s.
+        @param timed  True to delay frames by their duration on the bus in virtual time.
+        """
+        self.bitrate = bitrate
+        self.timed = timed
+        self._nodes: List[_FabricNode] = []
+        self._pending: List[Tuple[Tuple[int, bool, int], int, CanMessage, Any]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._pending_changed = TimeEvent()
+        self._worker: Optional[threading.Thread] = None
+        self._stopped = False
+        self._bits = 0
+        self._frames = 0
+        self._start_us = vtime_manager.time_us()
+
+    def __enter__(self) -> "CanFabric":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def attach(
+        self,
+        driver: Any,
+        instance_id: int = 0,
+        name: Optional[str] = None,
+        delivery_timeout: Optional[float] = None,
+    ) -> "CanFabricPort":
+        """
+        ! Connect instance of a CAN driver to the fabric.
+
+        Frames sent by the firmware (`*_DRV_Send`) are transmitted on the fabric instead of being queued for
+        `recv` of the driver; frames of other nodes are sent to the firmware by `send` of the driver.
+
+        @param driver  The CAN driver (`FlexCanDriver` or `MCANDriver`).
+        @param instance_id  The CAN instance of the driver.
+        @param name  Name of the node used in logs.
+        @param delivery_timeout  Timeout in seconds of virtual time for the firmware to read each frame
+            (None - `CanFabricPort.DELIVERY_TIMEOUT`).
+
+        @return  The port of the driver instance.
+        """
+        port = CanFabricPort(
+            self,
+            driver,
+            instance_id,
+            name or f"{driver.__class__.__name__}[{instance_id}]",
+            delivery_timeout,
+        )
+        driver.fabric_ports[instance_id] = port
+        self._add_node(port)
+        return port
+
+    def endpoint(
+        self,
+        name: Optional[str] = None,
+        can_filters: Optional[Any] = None,
+        rx_queue_size: Optional[int] = None,
+    ) -> "CanFabricEndpoint":
+        """
+        ! Create test-side bus connected to the fabric.
+
+        @param name  Name of the node used in logs.
+        @param can_filters  Acceptance filters in python-can format (None - accept all frames).
+        @param rx_queue_size  Number of frames kept for `recv` (None - `CanFabricEndpoint.RX_QUEUE_SIZE`).
+
+        @return  The bus.
+        """
+        endpoint = CanFabricEndpoint(
+            self, name or f"endpoint{len(self._nodes)}", can_filters, rx_queue_size
+        )
+        self._add_node(endpoint)
+        return endpoint
+
+    def detach(self, node: _FabricNode) -> None:
+        """
+        ! Disconnect the node from the fabric.
+        """
+        with self._lock:
+            if node in self._nodes:
+                self._nodes.remove(node)
+
+    def transmit(self, msg: CanMessage, source: Optional[_FabricNode] = None) -> None:
+        """
+        ! Queue the frame for arbitration, does not wait for its delivery.
+
+        @param msg  The frame.
+        @param source  The transmitting node, it does not receive its own frame.
+        """
+        with self._lock:
+            if self._stopped:
+                logger.debug(f"CAN fabric stopped, frame {msg} dropped")
+                return
+            heapq.heappush(
+                self._pending,
+                (arbitration_key(msg), next(self._sequence), msg, source),
+            )
+            if self._worker is None:
+                self._worker = VirtualTimeWorker(
+                    target=self._run, daemon=True, name="CanFabric"
+                )
+                self._worker.start()
+        self._pending_changed.set()
+
+    @property
+    def transmitted_bits(self) -> int:
+        """
+        ! Number of bits transmitted since creation or `reset_statistics`.
+        """
+        return self._bits
+
+    @property
+    def transmitted_frames(self) -> int:
+        """
+        ! Number of frames transmitted since creation or `reset_statistics`.
+        """
+        return self._frames
+
+    def bits_per_second(self) -> float:
+        """
+        ! Average bus traffic in bits/s of virtual time since creation or `reset_statistics`.
+        """
+        elapsed_us = vtime_manager.time_us() - self._start_us
+        if elapsed_us <= 0:
+            return 0.0
+        return self._bits * 1_000_000 / elapsed_us
+
+    def bus_load(self) -> float:
+        """
+        ! Average bus load as fraction of the bitrate.
+        """
+        return self.bits_per_second() / self.bitrate
+
+    def reset_statistics(self) -> None:
+        """
+        ! Restart bus load accounting from the current virtual time.
+        """
+        with self._lock:
+            self._bits = 0
+            self._frames = 0
+            self._start_us = vtime_manager.time_us()
+
+    def stop(self) -> None:
+        """
+        ! Drop pending frames, close all nodes and wait for the dispatcher to finish.
+        """
+        with self._lock:
+            self._stopped = True
+            self._pending.clear()
+            nodes = list(self._nodes)
+            self._nodes.clear()
+            worker = self._worker
+        self._pending_changed.set()
+        if worker is not None and worker is not threading.current_thread():
+            join_worker(worker)
+        for node in nodes:
+            node.close()
+
+    def _add_node(self, node: _FabricNode) -> None:
+        """
+        ! Register the node.
+        """
+        with self._lock:
+            self._nodes.append(node)
+        logger.info(f"CAN node {node.name} attached to fabric")
+
+    def _run(self) -> None:
+        """
+        ! Arbitrate pending frames and deliver them until the fabric is stopped.
+        """
+        while True:
+            with self._lock:
+                if self._stopped:
+                    self._worker = None
+                    return
+                if not self._pending:
+                    self._pending_changed.clear()
+                    entry = None
+                else:
+                    entry = heapq.heappop(self._pending)
+            if entry is None:
+                self._pending_changed.wait()
+                continue
+            _, _, msg, source = entry
+            bits = frame_bits(msg)
+            if self.timed:
+                vtime_manager.sleep(bits / self.bitrate)
+            with self._lock:
+                self._bits += bits
+                self._frames += 1
+                receivers = [
+                    node
+                    for node in self._nodes
+                    if node is not source and node.accepts(msg)
+                ]
+            for node in receivers:
+                node.deliver(msg)
+
+
+class CanFabricPort:
+    """! Instance of a CAN driver attached to `CanFabric`.
+
+    Frames are sent to the firmware by a worker of the port, so a firmware not reading its mailboxes delays
+    only its own node. Each frame waits at most `delivery_timeout` for the firmware to request read of the
+    mailbox (a driver in pipelined transmit mode only queues it), so the worker never blocks indefinitely.
+    """
+
+    # Default time in seconds of virtual time the firmware has to read a frame
+    DELIVERY_TIMEOUT = 1.0
+
+    def __init__(
+        self,
+        fabric: CanFabric,
+        driver: Any,
+        instance_id: int,
+        name: str,
+        delivery_timeout: Optional[float] = None,
+    ) -> None:
+        self.fabric = fabric
+        self.driver = driver
+        self.instance_id = instance_id
+        self.name = name
+        self.delivery_timeout = (
+            self.DELIVERY_TIMEOUT if delivery_timeout is None else delivery_timeout
+        )
+        self._closed = False
+        self._rx: Queue[Optional[CanMessage]] = Queue()
+        self._worker = VirtualTimeWorker(
+            target=self._run, daemon=True, name=f"CanFabricPort {name}"
+        )
+        self._worker.start()
+
+    def transmit(self, msg: CanMessage) -> None:
+        """
+        ! Transmit the frame sent by the firmware on the fabric.
+        """
+        self.fabric.transmit(msg, self)
+
+    def accepts(self, msg: CanMessage) -> bool:
+        """
+        ! True if a receive mailbox of the instance accepts the frame.
+        """
+        instance = self.driver.instances.get(self.instance_id)
+        return instance is not None and bool(
+            instance.rx_filter.match(msg.arbitration_id)
+        )
+
+    def deliver(self, msg: CanMessage) -> None:
+        """
+        ! Queue the frame for the firmware.
+        """
+        self._rx.put(msg)
+
+    def close(self) -> None:
+        """
+        ! Detach the driver instance, frames not yet sent to the firmware are dropped.
+
+        The worker is not joined: it finishes once the frame being sent is read by the firmware or its delivery
+        times out.
+        """
+        self.fabric.detach(self)
+        if self.driver.fabric_ports.get(self.instance_id) is self:
+            del self.driver.fabric_ports[self.instance_id]
+        self._closed = True
+        self._rx.put(None)
+
+    def _run(self) -> None:
+        """
+        ! Send queued frames to the firmware one by one.
+        """
+        while True:
+            msg = self._rx.get()
+            if msg is None or self._closed:
+                return
+            try:
+                self.driver.send(
+                    msg, timeout=self.delivery_timeout, instance_id=self.instance_id
+                )
+            except (ValueError, Full) as err:
+                logger.warning(f"CAN node {self.name} dropped frame {msg}: {err}")
+
+
+class CanFabricEndpoint(CanBus):
+    """! Test-side CAN bus attached to `CanFabric` (e.g. console stand-in).
+
+    Only frames passing `can_filters` are queued for `recv`. The queue keeps at most `rx_queue_size` frames, on
+    overflow the oldest frame is dropped (like an overrun receive FIFO) and counted in `overruns`.
+    """
+
+    # Default number of frames kept for `recv`
+    RX_QUEUE_SIZE = 1024
+
+    def __init__(
+        self,
+        fabric: CanFabric,
+        name: str,
+        can_filters: Optional[Any] = None,
+        rx_queue_size: Optional[int] = None,
+    ) -> None:
+        super().__init__(channel=name, can_filters=can_filters)
+        self.fabric = fabric
+        self.name = name
+        self.channel_info = f"CAN fabric endpoint {name}"
+        self._rx: Queue[CanMessage] = Queue(
+            self.RX_QUEUE_SIZE if rx_queue_size is None else rx_queue_size,
+            OverflowPolicy.DROP_OLDEST,
+        )
+
+    @property
+    def overruns(self) -> int:
+        """
+        ! Number of received frames dropped because `recv` didn't keep up.
+        """
+        return self._rx.overruns
+
+    def send(self, msg: CanMessage, timeout: Optional[float] = None) -> None:
+        """
+        ! Transmit the frame on the fabric, does not wait for its delivery.
+        """
+        self.fabric.transmit(msg, self)
+
+    def recv(self, timeout: Optional[float] = None) -> Optional[CanMessage]:
+        """
+        ! Receive a frame from the fabric.
+
+        @param timeout  Timeout in seconds of virtual time (None - wait forever).
+
+        @return  The frame or None on timeout.
+        """
+        try:
+            return self._rx.get(timeout=timeout)
+        except Empty:
+            return None
+
+    def accepts(self, msg: CanMessage) -> bool:
+        """
+        ! True if the frame passes the filters of the bus.
+        """
+        return self._matches_filters(msg)
+
+    def deliver(self, msg: CanMessage) -> None:
+        """
+        ! Queue the frame for `recv`.
+        """
+        self._rx.put(msg)
+
+    def close(self) -> None:
+        """
+        ! Detach the bus from the fabric.
+        """
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        ! Detach the bus from the fabric.
+        """
+        self.fabric.detach(self)
+        super().shutdown()
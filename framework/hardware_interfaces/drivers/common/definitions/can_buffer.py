@@ -8,9 +8,14 @@
 # This module represents the CanBuffer class.
 #
 # @section libraries_can_buffer Libraries/Modules
+# - collections standard library
+# - threading standard library
+# - typing standard library
+# - OverflowPolicy class from vtime module
 # - Queue class from vtime module
 # - TimeEvent class from vtime module
 # - CanMessage class from framework/hardware_interfaces/drivers/common/definitions/interfaces module
+# - accepts function from framework/hardware_interfaces/drivers/common/definitions/can_filter module
 #
 # @section notes_can_buffer Notes
 # - None.
@@ -23,24 +28,42 @@
 #   - Ihor Pryyma ihor.pryyma@globallogic.com on 29/10/2024.
 #
 # Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved
+import threading
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
 
+from framework.hardware_interfaces.drivers.common.definitions.can_filter import (
+    accepts,
+)
 from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
     CanMessage,
 )
-from framework.support.vtime import Queue, TimeEvent
+from framework.support.vtime import OverflowPolicy, Queue, TimeEvent
 
 
 class CanBuffer(Queue[CanMessage]):
     """
     A buffer for CAN messages. It can be configured to filter messages based on.
+
+    A bounded buffer (`maxsize` > 0) discards the oldest message on overflow by default, like an overrun
+    receive mailbox; discarded messages are counted in `overruns`.
     """
 
-    def __init__(self, mbx_id: int, maxsize: int = 0) -> None:
-        super().__init__(maxsize)
+    def __init__(
+        self,
+        mbx_id: int,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        super().__init__(maxsize, overflow)
         self.mbx_id = mbx_id
         self._mask: int | None = None
         self._msg_id: int | None = None
         self.read_request = TimeEvent()
+        self.tx_drained = TimeEvent()
+        self.tx_drained.set()
+        self._tx_pending: Deque[Tuple[CanMessage, Callable[[], None]]] = deque()
+        self._tx_lock = threading.Lock()
 
     def set_mask(self, mask: int) -> None:
         """
@@ -54,13 +77,56 @@ class CanBuffer(Queue[CanMessage]):
         """
         self._msg_id = msg_id
 
+    @property
+    def mask(self) -> int | None:
+        """
+        ! Individual mask of buffer.
+        """
+        return self._mask
+
+    @property
+    def msg_id(self) -> int | None:
+        """
+        ! Message ID filter of buffer.
+        """
+        return self._msg_id
+
     def check_filter(self, item: CanMessage) -> bool:
         """
-        ! Check filter for buffer.
+        ! Check filter (message ID and individual mask) for buffer.
+        """
+        return accepts(self._msg_id, self._mask, item.arbitration_id)
+
+    def queue_tx(self, item: CanMessage, on_delivered: Callable[[], None]) -> None:
+        """
+        ! Queue CAN message waiting for read request of the firmware (pipelined transmit).
+
+        @param item  CAN message.
+        @param on_delivered  Called once the message is put in buffer and the interrupt is raised.
+        """
+        with self._tx_lock:
+            self._tx_pending.append((item, on_delivered))
+            self.tx_drained.clear()
+
+    def take_tx(self) -> Optional[Tuple[CanMessage, Callable[[], None]]]:
+        """
+        ! Take the oldest queued CAN message if the firmware requested read, the read request is consumed.
+
+        @return  CAN message with its delivery callback or None if nothing can be delivered.
+        """
+        with self._tx_lock:
+            if not self._tx_pending or not self.read_request.is_set():
+                return None
+            self.read_request.clear()
+            return self._tx_pending.popleft()
+
+    def finish_tx(self) -> None:
+        """
+        ! Notify that the taken CAN message was delivered.
         """
-        if self._msg_id and item.arbitration_id != self._msg_id:
-            return False
-        return True
+        with self._tx_lock:
+            if not self._tx_pending:
+                self.tx_drained.set()
 
     def put_can_msg(
         self, item: CanMessage, block: bool = True, timeout: float | None = None
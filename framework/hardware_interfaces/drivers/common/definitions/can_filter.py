@@ -0,0 +1,118 @@
+"""! @Brief Acceptance filter routing CAN messages to receive buffers."""
+#
+# @file can_filter.py
+#
+# @brief Acceptance filter routing CAN messages to receive buffers.
+#
+# @section description_can_filter Description
+# This module represents the CanAcceptanceFilter class.
+#
+# @section libraries_can_filter Libraries/Modules
+# - typing standard library
+#
+# @section notes_can_filter Notes
+# - Filter ID 0 (not configured) accepts all messages and mask 0 (not configured) requires exact ID match,
+#   which keeps behavior of buffers configured without `SetRxIndividualMask`/`ConfigRxMb`.
+#
+# @section todo_can_filter TODO
+# - None.
+#
+# Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved
+from typing import Dict, List, Optional, Tuple
+
+
+def accepts(filter_id: Optional[int], mask: Optional[int], msg_id: int) -> bool:
+    """! Check whether message ID passes the acceptance filter.
+
+    @param filter_id  ID configured for the buffer (None or 0 - all messages are accepted).
+    @param mask  Individual mask of the buffer, bit set to 1 has to match (None or 0 - exact match).
+    @param msg_id  Arbitration ID of the message.
+
+    @return  True if the message is accepted.
+    """
+    if not filter_id:
+        return True
+    if not mask:
+        return msg_id == filter_id
+    return (msg_id ^ filter_id) & mask == 0
+
+
+class CanAcceptanceFilter:
+    """! Index of receive buffer filters of one CAN instance.
+
+    Buffers with exact ID filter are kept in a hash map keyed by the ID, buffers with individual mask in a table
+    evaluated with bit operations and buffers without filter in a separate list. Resolved routes are cached
+    per arbitration ID, the cache is invalidated whenever a filter is (re)configured.
+    """
+
+    MAX_CACHED_ROUTES = 4096
+
+    def __init__(self) -> None:
+        self._filters: Dict[int, Tuple[int, int]] = {}
+        self._exact: Dict[int, List[int]] = {}
+        self._masked: Dict[int, Tuple[int, int]] = {}
+        self._accept_all: List[int] = []
+        self._routes: Dict[int, Tuple[int, ...]] = {}
+
+    def configure(
+        self, mb_idx: int, filter_id: Optional[int], mask: Optional[int]
+    ) -> None:
+        """! Set (or replace) the filter of receive buffer.
+
+        @param mb_idx  Index of the buffer.
+        @param filter_id  ID configured for the buffer (None or 0 - all messages are accepted).
+        @param mask  Individual mask of the buffer (None or 0 - exact match).
+        """
+        self.remove(mb_idx)
+        self._routes.clear()
+        filter_id = filter_id or 0
+        mask = mask or 0
+        self._filters[mb_idx] = (filter_id, mask)
+        if not filter_id:
+            self._accept_all.append(mb_idx)
+        elif not mask:
+            self._exact.setdefault(filter_id, []).append(mb_idx)
+        else:
+            self._masked[mb_idx] = (filter_id & mask, mask)
+
+    def remove(self, mb_idx: int) -> None:
+        """! Remove the filter of receive buffer.
+
+        @param mb_idx  Index of the buffer.
+        """
+        configured = self._filters.pop(mb_idx, None)
+        if configured is None:
+            return
+        self._routes.clear()
+        filter_id, mask = configured
+        if not filter_id:
+            self._accept_all.remove(mb_idx)
+        elif not mask:
+            buffers = self._exact[filter_id]
+            buffers.remove(mb_idx)
+            if not buffers:
+                del self._exact[filter_id]
+        else:
+            del self._masked[mb_idx]
+
+    def match(self, msg_id: int) -> Tuple[int, ...]:
+        """! Get receive buffers accepting the message.
+
+        @param msg_id  Arbitration ID of the message.
+
+        @return  Indexes of the accepting buffers in ascending order.
+        """
+        route = self._routes.get(msg_id)
+        if route is None:
+            buffers = list(self._exact.get(msg_id, ()))
+            buffers.extend(
+                mb_idx
+                for mb_idx, (filter_id, mask) in self._masked.items()
+                if msg_id & mask == filter_id
+            )
+            buffers.extend(self._accept_all)
+            route = tuple(sorted(buffers))
+            if len(self._routes) >= self.MAX_CACHED_ROUTES:
+                self._routes.clear()
+            self._routes[msg_id] = route
+        return route
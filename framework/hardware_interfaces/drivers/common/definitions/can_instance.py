@@ -14,7 +14,10 @@
 # - Dict class from typing module
 # - Any class from typing module
 # - CanBuffer class from framework/hardware_interfaces/drivers/common/definitions/can_buffer module
+# - CanAcceptanceFilter class from framework/hardware_interfaces/drivers/common/definitions/can_filter module
 # - CanMessage class from framework/hardware_interfaces/drivers/common/definitions/interfaces module
+# - OverflowPolicy class from framework/support/vtime module
+# - Queue class from framework/support/vtime module
 # - MCMode class from framework/hardware_interfaces/protoc/mpc5777c/mpc5777c_mcan_driver_pb2 module
 #
 # @section notes_can_instance Notes
@@ -34,6 +37,9 @@ from typing import Dict, Any, Union
 from framework.hardware_interfaces.drivers.common.definitions.can_buffer import (
     CanBuffer,
 )
+from framework.hardware_interfaces.drivers.common.definitions.can_filter import (
+    CanAcceptanceFilter,
+)
 from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
     CanMessage,
 )
@@ -41,13 +47,22 @@ from framework.hardware_interfaces.protoc.mpc5777c.mpc5777c_mcan_driver_pb2 impo
     MCMode,
 )
 
-from framework.support.vtime import Queue
+from framework.support.vtime import OverflowPolicy, Queue
+
+# Default number of frames kept in `CANInstance.in_msgs` (frames sent by the firmware)
+DEFAULT_RX_DEPTH = 1024
+# Default number of frames kept in each receive mailbox (`CanBuffer`)
+DEFAULT_MAILBOX_DEPTH = 64
 
 
 @dataclasses.dataclass
 class CANInstance:
     """
     ! CAN instance.
+
+    Mailboxes created by `new_buffer` are bounded by `mailbox_depth` and handle overflow by `overflow`
+    policy (0 - unbounded). Overruns of `in_msgs` and of each mailbox are exposed by `rx_overruns` and
+    `mailbox_overruns`.
     """
 
     in_msgs: Queue[CanMessage]
@@ -55,3 +70,34 @@ class CANInstance:
     freeze_mode: Union[MCMode, bool]
     irq_id: int
     read_request_pending: Dict[int, Any]
+    rx_filter: CanAcceptanceFilter = dataclasses.field(
+        default_factory=CanAcceptanceFilter
+    )
+    mailbox_depth: int = DEFAULT_MAILBOX_DEPTH
+    overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+
+    def new_buffer(self, mb_idx: int) -> CanBuffer:
+        """
+        ! Create receive mailbox with depth and overflow policy of the instance.
+        """
+        return CanBuffer(mb_idx, self.mailbox_depth, self.overflow)
+
+    @property
+    def rx_overruns(self) -> int:
+        """
+        ! Number of frames sent by the firmware and lost on overflow of `in_msgs`.
+        """
+        return self.in_msgs.overruns
+
+    @property
+    def mailbox_overruns(self) -> Dict[int, int]:
+        """
+        ! Number of frames lost on overflow of each receive mailbox.
+        """
+        return {mb_idx: buffer.overruns for mb_idx, buffer in self.out_buffers.items()}
+
+    def update_rx_filter(self, buffer: CanBuffer) -> None:
+        """
+        ! Apply filter of receive buffer to the acceptance filter index.
+        """
+        self.rx_filter.configure(buffer.mbx_id, buffer.msg_id, buffer.mask)
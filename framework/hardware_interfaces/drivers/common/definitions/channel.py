@@ -28,13 +28,21 @@ from framework.hardware_interfaces.drivers.common.definitions.interfaces import
     TInterruptCallback,
 )
 from framework.support.reports import logger
-from framework.support.vtime import VirtualTimeWorker, TimeEvent
+from framework.support.vtime import VirtualTimeWorker, TimeEvent, TimerEngine
 
 
 class Channel:
-    """! A simple timer class that simulates hardware timer behavior with callbacks on timeouts."""
+    """! A simple timer class that simulates hardware timer behavior with callbacks on timeouts.
 
-    def __init__(self, channel_id: int, group_id: int = 0):
+    When `timer_engine` is provided, the timeouts are executed by the shared TimerEngine instead of own worker.
+    """
+
+    def __init__(
+        self,
+        channel_id: int,
+        group_id: int = 0,
+        timer_engine: Optional[TimerEngine] = None,
+    ):
         self.channel_id = channel_id
         self.group_id: int = group_id
         self.irq_id: int = 0
@@ -43,21 +51,34 @@ class Channel:
         self.interrupt_callback: Optional[TInterruptCallback] = None
         self._timer_thread: Optional[threading.Thread] = None
         self._stop_event = TimeEvent()
+        self._timer_engine = timer_engine
+        self._engine_timer_id: Optional[int] = None
 
     def start(self) -> None:
         """! Start the timer."""
-        if self._timer_thread is not None:
+        if self._timer_thread is not None or self._engine_timer_id is not None:
             logger.info(f"Timer {self.channel_id} is already running, restarting.")
             self.stop()
-        self._stop_event.clear()
-        self._timer_thread = VirtualTimeWorker(target=self._run, daemon=True)
-        self._timer_thread.start()
+        if self._timer_engine is not None:
+            self._engine_timer_id = self._timer_engine.add_timer(
+                lambda: self.period_us, self._on_timeout
+            )
+        else:
+            self._stop_event.clear()
+            self._timer_thread = VirtualTimeWorker(target=self._run, daemon=True)
+            self._timer_thread.start()
         logger.info(
             f"Timer {self.channel_id} started with period {self.period_us} microseconds."
         )
 
     def stop(self) -> None:
         """! Stop the timer."""
+        if self._timer_engine is not None and self._engine_timer_id is not None:
+            logger.debug(f"Timer {self.channel_id} stop called.")
+            self._timer_engine.remove_timer(self._engine_timer_id)
+            self._engine_timer_id = None
+            logger.info(f"Timer {self.channel_id} stopped.")
+            return
         if self._timer_thread is None:
             # Stop API could be called multiple times in a row by the emulator
             logger.debug(f"Timer {self.channel_id} is not running.")
@@ -69,21 +90,25 @@ class Channel:
 
     def is_running(self) -> bool:
         """! Check if the timer is running."""
+        if self._engine_timer_id is not None:
+            return True
         return self._timer_thread is not None and self._timer_thread.is_alive()
 
     def _run(self) -> None:
         """! Internal method to run the timer logic."""
         while True:
             if not self._stop_event.wait(self.period_us / 1_000_000.0):
-                if self.irq_enable and self.interrupt_callback is not None:
-                    self.interrupt_callback(self.irq_id)
-                    logger.debug(
-                        f"Timer {self.channel_id} timeout, interrupt generated."
-                    )
-                else:
-                    logger.debug(
-                        f"Timer {self.channel_id} timeout, interrupt not generated (disabled)."
-                    )
+                self._on_timeout()
             else:
                 logger.info(f"Timer {self.channel_id} stopped.")
                 break
+
+    def _on_timeout(self) -> None:
+        """! Generate interrupt (if enabled) when the channel period elapses."""
+        if self.irq_enable and self.interrupt_callback is not None:
+            self.interrupt_callback(self.irq_id)
+            logger.debug(f"Timer {self.channel_id} timeout, interrupt generated.")
+        else:
+            logger.debug(
+                f"Timer {self.channel_id} timeout, interrupt not generated (disabled)."
+            )
@@ -24,21 +24,26 @@
 #
 # Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved
 import threading
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
     TInterruptCallback,
 )
 from framework.hardware_interfaces.drivers.common.definitions.channel import Channel
 from framework.support.reports import logger
+from framework.support.vtime import TimerEngine
 
 
 class EMIOSChannelManager:
-    """! Manages multiple independent timers."""
+    """! Manages multiple independent timers.
 
-    def __init__(self) -> None:
+    If `timer_engine` is provided, all created channels are driven by it instead of running in own workers.
+    """
+
+    def __init__(self, timer_engine: Optional[TimerEngine] = None) -> None:
         self.channels: Dict[Tuple[int, int], Channel] = {}
         self.lock = threading.Lock()
+        self.timer_engine = timer_engine
 
     def create_channel(self, group_id: int, channel_id: int) -> None:
         """! Create a channel with a given ID."""
@@ -46,7 +51,9 @@ class EMIOSChannelManager:
             if (group_id, channel_id) in self.channels:
                 logger.error(f"Channel with ID {channel_id} already exists.")
                 return
-            self.channels[(group_id, channel_id)] = Channel(channel_id, group_id)
+            self.channels[(group_id, channel_id)] = Channel(
+                channel_id, group_id, self.timer_engine
+            )
             logger.debug(f"Channel with ID {channel_id}.")
 
     def start_channel(self, group_id: int, channel_id: int) -> None:
@@ -0,0 +1,91 @@
+"""! @Brief Coalescing of interrupts raised by a driver."""
+
+#
+# @file interrupt_batch.py
+#
+# @brief Coalescing of interrupts raised by a driver.
+#
+# @section description_interrupt_batch Description
+# This module represents the InterruptBatch class.
+#
+# @section libraries_interrupt_batch Libraries/Modules
+# - threading standard library
+# - typing standard library
+#
+# @section notes_interrupt_batch Notes
+# - None.
+#
+# @section todo_interrupt_batch TODO
+# - None.
+#
+# Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved
+import threading
+from typing import Callable, Dict, Hashable, Tuple
+
+
+class InterruptBatch:
+    """
+    ! Interrupt raising function of a driver which can hold interrupts back and coalesce them.
+
+    While held, interrupts are not raised. Interrupts with the same key (e.g. the same port) replace each other, so
+    only the last one of each key is raised on release, in order of their last change. Holds can be nested, the
+    interrupts are raised when the outermost hold is released.
+    """
+
+    def __init__(
+        self,
+        raise_interrupt_func: Callable[[int, int], None],
+        key: Callable[[int, int], Hashable] = lambda irq_id, flags: irq_id,
+    ) -> None:
+        """
+        ! Create the batch.
+
+        @param raise_interrupt_func  Function raising the interrupt.
+        @param key  Function returning key of the interrupt from IRQ ID and flags (default - IRQ ID).
+        """
+        self._raise_interrupt = raise_interrupt_func
+        self._key = key
+        self._lock = threading.Lock()
+        self._depth = 0
+        self._pending: Dict[Hashable, Tuple[int, int]] = {}
+
+    def __call__(self, irq_id: int, flags: int) -> None:
+        """
+        ! Raise the interrupt, or keep it pending while held.
+        """
+        with self._lock:
+            if self._depth:
+                key = self._key(irq_id, flags)
+                self._pending.pop(key, None)
+                self._pending[key] = (irq_id, flags)
+                return
+        self._raise_interrupt(irq_id, flags)
+
+    @property
+    def held(self) -> bool:
+        """
+        ! True if interrupts are held back.
+        """
+        return self._depth > 0
+
+    def hold(self) -> None:
+        """
+        ! Start holding interrupts back.
+        """
+        with self._lock:
+            self._depth += 1
+
+    def release(self) -> None:
+        """
+        ! End the hold, pending interrupts are raised when the outermost hold ends.
+        """
+        with self._lock:
+            if self._depth == 0:
+                raise RuntimeError("Interrupts are not held")
+            self._depth -= 1
+            if self._depth:
+                return
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for irq_id, flags in pending:
+            self._raise_interrupt(irq_id, flags)
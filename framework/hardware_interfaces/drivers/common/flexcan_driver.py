@@ -10,6 +10,8 @@
 #
 # @section libraries_flexcan_driver Libraries/Modules
 # - typing standard library (https://docs.python.org/3/library/typing.html)
+# - concurrent.futures standard library
+# - threading standard library
 # - queue standard library
 # - enum standard library
 # - dataclasses standard library
@@ -17,7 +19,6 @@
 # - hardware_interfaces module (local)
 #   - Access to CanBus class.
 #   - Access to CanMessage class.
-#   - Access to CanBuffer class.
 #   - Access to FlexCanDriverServicer class.
 #   - Access to Status class.
 #   - Access to StatusEnum class.
@@ -44,13 +45,14 @@
 #   - Ihor Pryyma ihor.pryyma@globallogic.com on 02/10/2024.
 #
 # Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved.
+import threading
+from concurrent.futures import Future
 from queue import Empty
-from typing import Any, Callable, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
-from framework.hardware_interfaces.drivers.common.definitions.can_buffer import (
-    CanBuffer,
-)
 from framework.hardware_interfaces.drivers.common.definitions.can_instance import (
+    DEFAULT_MAILBOX_DEPTH,
+    DEFAULT_RX_DEPTH,
     CANInstance,
 )
 from framework.hardware_interfaces.drivers.common.definitions.interrupt_mapper import (
@@ -78,26 +80,64 @@ from framework.hardware_interfaces.protoc.common.flexcan_driver_pb2 import (
     FCGetReceivedDataReturn,
     FCIrqFlags,
 )
-from framework.support.vtime import TimeEvent
+from framework.support.vtime import OverflowPolicy, TimeEvent
+
+if TYPE_CHECKING:
+    from framework.hardware_interfaces.drivers.common.can_fabric import CanFabricPort
+    from framework.support.can_log import CanRecorder
 
 
 class FlexCanDriver(CanBus, FlexCanDriverServicer):
-    """! Support for CAN bus access + stub for FootSwitch CAN driver."""
+    """! Support for CAN bus access + stub for FootSwitch CAN driver.
+
+    By default `send` blocks until the firmware requests read of each accepting mailbox. In pipelined transmit
+    mode (`pipelined_tx`) frames are queued in per-mailbox FIFOs instead and delivered one by one as the firmware
+    issues `FLEXCAN_DRV_ReceiveReq`; see `send_nowait` and `flush_tx`. Blocking and pipelined transmit shall not
+    be mixed on the same mailbox. Simulators enable the pipelined mode by `pipelined_can_tx` (pytest option
+    `--pipelined-can-tx`).
+    """
+
+    def __init__(
+        self,
+        raise_interrupt_func: Callable[[int, int], None],
+        pipelined_tx: bool = False,
+        rx_depth: int = DEFAULT_RX_DEPTH,
+        mailbox_depth: int = DEFAULT_MAILBOX_DEPTH,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        """
+        ! Create the driver.
 
-    def __init__(self, raise_interrupt_func: Callable[[int, int], None]) -> None:
+        @param raise_interrupt_func  Function raising interrupt in the firmware.
+        @param pipelined_tx  True to queue frames sent to the firmware (see `send_nowait`).
+        @param rx_depth  Number of frames sent by the firmware kept for `recv` per instance (0 - unbounded).
+        @param mailbox_depth  Number of frames kept in each receive mailbox (0 - unbounded).
+        @param overflow  Handling of frames put into a full queue, see `CANInstance.rx_overruns` and
+            `CANInstance.mailbox_overruns` for the number of lost frames.
+        """
         self.raise_interrupt = raise_interrupt_func
         self.instances: Dict[int, CANInstance] = {}
         self._ready = TimeEvent()
+        self.pipelined_tx = pipelined_tx
+        self.rx_depth = rx_depth
+        self.mailbox_depth = mailbox_depth
+        self.overflow = overflow
+        # Optional recorder of all frames passing the driver
+        self.recorder: Optional["CanRecorder"] = None
+        # Instances attached to a shared CAN bus (see `CanFabric.attach`)
+        self.fabric_ports: Dict[int, "CanFabricPort"] = {}
 
     def _initialize_instance(self, instance_id: int, irq_id: int) -> None:
         """! Helper function to initialize a new instance."""
         if instance_id not in self.instances:
             self.instances[instance_id] = CANInstance(
-                in_msgs=Queue(),
+                in_msgs=Queue(self.rx_depth, self.overflow),
                 out_buffers={},
                 freeze_mode=False,
                 irq_id=irq_id,
                 read_request_pending={},
+                mailbox_depth=self.mailbox_depth,
+                overflow=self.overflow,
             )
             logger.info(
                 f"New FlexCAN instance {instance_id} created with IRQ {irq_mapper(irq_id)}"
@@ -114,16 +154,100 @@ class FlexCanDriver(CanBus, FlexCanDriverServicer):
     ) -> None:
         """
         Send a message on the bus.
+
+        In pipelined transmit mode the message is only queued (see `send_nowait`) and `timeout` is not used.
+        """
+        if self.pipelined_tx:
+            self.send_nowait(msg, instance_id)
+            return
+        if self.recorder is not None:
+            self.recorder.record_rx(msg, instance_id)
+        instance = self.get_instance(instance_id)
+        for mb_idx in instance.rx_filter.match(msg.arbitration_id):
+            buffer = instance.out_buffers[mb_idx]
+            buffer.put(msg, timeout=timeout)
+            buffer.read_request.wait(timeout)
+            self.raise_interrupt(
+                instance.irq_id,
+                (mb_idx << 16) | FCIrqFlags.FCIrqFlags_RX_COMPLETE,
+            )
+            buffer.read_request.clear()
+
+    def send_nowait(
+        self,
+        msg: CanMessage,
+        instance_id: int = 0,
+        callback: Optional[Callable[[], None]] = None,
+    ) -> Future[None]:
+        """
+        ! Queue a message for all accepting mailboxes without waiting for the firmware.
+
+        The message is delivered to each mailbox (and RX interrupt raised) once the firmware requests read
+        of the mailbox, immediately if the request is already pending.
+
+        @param msg  The message.
+        @param instance_id  The FlexCAN instance.
+        @param callback  Called when the message was delivered to all accepting mailboxes.
+
+        @return  Future completed when the message was delivered to all accepting mailboxes.
         """
+        if self.recorder is not None:
+            self.recorder.record_rx(msg, instance_id)
         instance = self.get_instance(instance_id)
-        for mb_idx, buffer in instance.out_buffers.items():
-            if buffer.put_can_msg(msg, timeout=timeout):
-                buffer.read_request.wait(timeout)
-                self.raise_interrupt(
-                    instance.irq_id,
-                    (mb_idx << 16) | FCIrqFlags.FCIrqFlags_RX_COMPLETE,
-                )
-                buffer.read_request.clear()
+        mailboxes = instance.rx_filter.match(msg.arbitration_id)
+        future: Future[None] = Future()
+        if callback is not None:
+            future.add_done_callback(lambda _: callback())
+        if not mailboxes:
+            future.set_result(None)
+            return future
+
+        remaining = [len(mailboxes)]
+        lock = threading.Lock()
+
+        def _on_delivered() -> None:
+            with lock:
+                remaining[0] -= 1
+                done = remaining[0] == 0
+            if done:
+                future.set_result(None)
+
+        for mb_idx in mailboxes:
+            instance.out_buffers[mb_idx].queue_tx(msg, _on_delivered)
+            self._pump_tx(instance, mb_idx)
+        return future
+
+    def flush_tx(self, instance_id: int = 0, timeout: float | None = None) -> bool:
+        """
+        ! Wait until all messages queued by `send_nowait` are delivered to the firmware.
+
+        @param instance_id  The FlexCAN instance.
+        @param timeout  Timeout in seconds for each mailbox (None - wait forever).
+
+        @return  True if all messages were delivered, False on timeout.
+        """
+        instance = self.get_instance(instance_id)
+        return all(
+            buffer.tx_drained.wait(timeout)
+            for buffer in list(instance.out_buffers.values())
+        )
+
+    def _pump_tx(self, instance: CANInstance, mb_idx: int) -> None:
+        """
+        ! Deliver the oldest queued message of the mailbox if the firmware requested read.
+        """
+        buffer = instance.out_buffers[mb_idx]
+        pending = buffer.take_tx()
+        if pending is None:
+            return
+        msg, on_delivered = pending
+        buffer.put(msg)
+        self.raise_interrupt(
+            instance.irq_id,
+            (mb_idx << 16) | FCIrqFlags.FCIrqFlags_RX_COMPLETE,
+        )
+        buffer.finish_tx()
+        on_delivered()
 
     def recv(
         self, timeout: float | None = None, instance_id: int = 0
@@ -193,7 +317,13 @@ class FlexCanDriver(CanBus, FlexCanDriverServicer):
         )
 
         instance = self.get_instance(request.instance_id)
-        instance.in_msgs.put(msg)
+        if self.recorder is not None:
+            self.recorder.record_tx(msg, request.instance_id)
+        port = self.fabric_ports.get(request.instance_id)
+        if port is not None:
+            port.transmit(msg)
+        else:
+            instance.in_msgs.put(msg)
         return Status(status=StatusEnum.STATUS_SUCCESS)
 
     @rpc_call
@@ -205,9 +335,10 @@ class FlexCanDriver(CanBus, FlexCanDriverServicer):
         """
         instance = self.get_instance(request.instance_id)
         if request.mb_idx not in instance.out_buffers:
-            instance.out_buffers[request.mb_idx] = CanBuffer(request.mb_idx)
+            instance.out_buffers[request.mb_idx] = instance.new_buffer(request.mb_idx)
 
         instance.out_buffers[request.mb_idx].set_mask(request.mask)
+        instance.update_rx_filter(instance.out_buffers[request.mb_idx])
         return Status(status=StatusEnum.STATUS_SUCCESS)
 
     @rpc_call
@@ -219,6 +350,7 @@ class FlexCanDriver(CanBus, FlexCanDriverServicer):
         """
         instance = self.get_instance(request.instance_id)
         instance.out_buffers[request.mb_idx].set_filter(request.msg_id)
+        instance.update_rx_filter(instance.out_buffers[request.mb_idx])
         return Status(status=StatusEnum.STATUS_SUCCESS)
 
     @rpc_call
@@ -230,6 +362,7 @@ class FlexCanDriver(CanBus, FlexCanDriverServicer):
         """
         instance = self.get_instance(request.instance_id)
         instance.out_buffers[request.mb_idx].read_request.set()
+        self._pump_tx(instance, request.mb_idx)
         return Status(status=StatusEnum.STATUS_SUCCESS)
 
     @rpc_call
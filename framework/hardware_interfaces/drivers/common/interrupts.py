@@ -38,9 +38,9 @@ import dataclasses
 
 from enum import IntEnum
 from queue import Empty
-from typing import Any
+from typing import Any, Iterator, List
 
-from framework.support.reports import logger, rpc_call
+from framework.support.reports import logger, rpc_call, rpc_stats
 from framework.support.reports.log import measure_duration
 from framework.support.vtime.queue import Queue
 from framework.support.vtime import vtime_manager
@@ -136,6 +136,31 @@ class Interrupts(InterruptsServicer):
             ## `_clock_updated` method which add SysTick interrupt in queue
             return self._interrupts.get()
 
+    @VirtualTimeWorker.set_worker_id  # type: ignore
+    @measure_duration
+    def wait_for_interrupts(self, max_count: int = 0) -> List[Interrupt]:
+        """! Waiting for all interrupts due at current virtual time.
+
+        Waits for the first interrupt the same way as `wait_for_interrupt`. All other interrupts already
+        scheduled in queue are then drained in one locked operation.
+
+        @param max_count  Maximum number of returned interrupts (0 - no limit).
+
+        @return  Interrupts scheduled in queue (first in - first out).
+        """
+        try:
+            logger.debug("Waiting for interrupts")
+            start_time = vtime_manager.time_ms()
+            irqs = self._interrupts.get_batch(max_count)
+            if vtime_manager.time_ms() > (start_time + 1):
+                logger.fatal(
+                    f"Virtual vtime step more than 1 millisecond ({start_time} -> {vtime_manager.time_ms()}) (for unit tests this can be ok)"
+                )
+            logger.debug(f"{len(irqs)} interrupt(s) raised")
+            return irqs
+        except Empty:
+            return self._interrupts.get_batch(max_count)
+
     @rpc_call
     def WaitForInterrupt(
         self, request: IdleContext, context: Any
@@ -147,25 +172,71 @@ class Interrupts(InterruptsServicer):
 
         @return  The interrupt context queue.
         """
+        return self._collect_interrupts(request)
+
+    def InterruptStream(
+        self, request_iterator: Iterator[IdleContext], context: Any
+    ) -> Iterator[InterruptContextQueue]:
+        """! Stream interrupts to the emulator.
+
+        Streaming alternative of `WaitForInterrupt`. The emulator reports each idle cycle by sending
+        an idle context on the stream and the interrupts collected for that cycle are pushed back.
+        While waiting for the next idle context the emulator is considered active.
+
+        The stream occupies one server thread for the whole session, so the simulator has to be configured
+        with more than one gRPC server worker (see `GrpcServerConfig.max_workers`) to handle driver RPCs.
+
+        @param request_iterator  Stream of idle contexts.
+        @param context  The context.
+
+        @return  Stream of interrupt context queues.
+        """
+        logger.debug("[gRPC]: InterruptStream opened")
+        for request in request_iterator:
+            logger.debug(
+                f"[gRPC]: InterruptStream: idle_cycles={request.idle_cycles}, max_batch_size={request.max_batch_size}"
+            )
+            yield self._collect_interrupts(request)
+        logger.debug("[gRPC]: InterruptStream closed")
+
+    def _collect_interrupts(self, request: IdleContext) -> InterruptContextQueue:
+        """! Collect interrupts for one idle cycle of the emulator.
+
+        Interrupts are collected in batches - all interrupts due at the current virtual time are drained
+        from the queue at once. The emulator can limit the number of returned interrupts by
+        `max_batch_size` (0 - no limit), remaining interrupts are returned by the next call.
+
+        @param request  The idle context.
+
+        @return  The interrupt context queue.
+        """
+        if rpc_stats.enabled:
+            rpc_stats.record_queue_depth("Interrupts", self.getsize())
         interrupt_context_queue = InterruptContextQueue()
         systick_irq_skip_count = request.idle_cycles
+        max_batch_size = request.max_batch_size
         non_systick_irq_happened = False
 
         while True:
-            interrupt = self.wait_for_interrupt()
-            interrupt_context = InterruptContext(
-                irq_id=interrupt.irq_id,
-                irq_flags=interrupt.flags,
-                time=vtime_manager.time_us(),
+            remaining = max_batch_size - len(interrupt_context_queue.queue)
+            interrupts = self.wait_for_interrupts(remaining if max_batch_size else 0)
+            time_us = vtime_manager.time_us()
+            interrupt_context_queue.queue.extend(
+                InterruptContext(
+                    irq_id=interrupt.irq_id, irq_flags=interrupt.flags, time=time_us
+                )
+                for interrupt in interrupts
             )
-            interrupt_context_queue.queue.append(interrupt_context)
-            if (
-                interrupt.irq_id == IrqId.SysTick_IRQn
-                or interrupt.irq_id == IrqId.PIT_RTI0_IRQn
-            ):
-                systick_irq_skip_count -= 1
-            else:
-                non_systick_irq_happened = True
+            for interrupt in interrupts:
+                if (
+                    interrupt.irq_id == IrqId.SysTick_IRQn
+                    or interrupt.irq_id == IrqId.PIT_RTI0_IRQn
+                ):
+                    systick_irq_skip_count -= 1
+                else:
+                    non_systick_irq_happened = True
+            if max_batch_size and len(interrupt_context_queue.queue) >= max_batch_size:
+                break
             ##   Collecting interrupts until all SysTick interrupts that
             ## emulator can skip happened and interrupt queue is empty,
             ## or non systick interrupt happened and queue is empty.
@@ -49,6 +49,7 @@ from framework.hardware_interfaces.protoc.mpc5777c.emios_mc_driver_pb2_grpc impo
 )
 
 from framework.support.reports import rpc_call, logger
+from framework.support.vtime import TimerEngine
 
 
 class BaseEmiosMcDevice:
@@ -56,7 +57,12 @@ class BaseEmiosMcDevice:
     ! Emios MC device implementation to simulate initialization and data interaction.
     """
 
-    def __init__(self, emios_group: int, channel: int) -> None:
+    def __init__(
+        self,
+        emios_group: int,
+        channel: int,
+        timer_engine: Optional[TimerEngine] = None,
+    ) -> None:
         self.emios_group = emios_group
         self.channel = channel
         self.mode: Optional[EmiosMcMode] = None
@@ -68,7 +74,7 @@ class BaseEmiosMcDevice:
         self.trigger_mode: Optional[EmiosEdgeTriggerMode] = None
         self.irq_id: int | None = None
         self.initialized = False
-        self.time_manager = EMIOSChannelManager()
+        self.time_manager = EMIOSChannelManager(timer_engine)
 
     def _start_channel(
         self, _raise_interrupt_callback: TInterruptCallback | None
@@ -132,9 +138,14 @@ class EmiosMcDriver(EmiosMcDriverServicer, EmiosCommonDriver):
     ! Emios MC driver implementation for initializing and setting period values.
     """
 
-    def __init__(self, raise_interrupt_func: TInterruptCallback | None) -> None:
+    def __init__(
+        self,
+        raise_interrupt_func: TInterruptCallback | None,
+        timer_engine: Optional[TimerEngine] = None,
+    ) -> None:
         super().__init__(raise_interrupt_func)
         self.emios_devices: Dict[Tuple[int, int], BaseEmiosMcDevice] = {}
+        self._timer_engine = timer_engine
 
     def register_device(self, device: BaseEmiosMcDevice) -> None:
         """
@@ -187,7 +198,7 @@ class EmiosMcDriver(EmiosMcDriverServicer, EmiosCommonDriver):
         )
 
         if key not in self.emios_devices:
-            device = BaseEmiosMcDevice(emios_group, channel)
+            device = BaseEmiosMcDevice(emios_group, channel, self._timer_engine)
             self.register_device(device)
         else:
             device = self.get_device(*key)
@@ -10,9 +10,14 @@
 # - grpc standard library (https://grpc.io/docs/languages/python/)
 # - EqAdcDriverServicer module (local)
 #   - Access to EqAdcDriverServicer class.
+# - adc_bank module (local)
+#   - Access to AdcBank class.
+# - interrupt_batch module (local)
+#   - Access to InterruptBatch class.
 #
 # @section notes_mpc5777c_eqadc_driver Notes
-# - None.
+# - Sample interrupt flags carry 8 bits of the sample, so samples are converted to 0 - 255 counts.
+# - Channels with no configured voltage return samples spread over the whole range (mid-scale with noise).
 #
 # @section todo_mpc5777c_eqadc_driver TODO
 # - None.
@@ -22,10 +27,14 @@
 #   - Ihor Pryyma ihor.pryyma@globallogic.com on 31/10/2024.
 #
 # Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved.
-from typing import Any
+from typing import Any, Iterable, List
+from framework.hardware_interfaces.drivers.common.adc_bank import AdcBank
 from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
     TInterruptCallback,
 )
+from framework.hardware_interfaces.drivers.common.definitions.interrupt_batch import (
+    InterruptBatch,
+)
 from framework.hardware_interfaces.drivers.common.definitions.interrupt_mapper import (
     irq_mapper,
 )
@@ -42,12 +51,16 @@ from framework.hardware_interfaces.protoc.mpc5777c.mpc5777c_eqadc_driver_pb2_grp
 )
 from framework.support.reports import logger
 from framework.support.vtime import TimeEvent
-from random import randint
+
+EQADC_VREF_MV = 5000
+EQADC_SAMPLE_MAX = 0xFF
 
 
 class BaseEqAdcDevice:
     """
     ! Base class for EQADC device driver.
+
+    Channels of the device are kept in an `AdcBank`, samples of all requested channels are converted in one step.
     """
 
     def __init__(self, instance_id: int) -> None:
@@ -58,6 +71,9 @@ class BaseEqAdcDevice:
         self.irq_id: int = 0
         self.calibrated = False
         self.initialized = False
+        self.bank = AdcBank(EQADC_VREF_MV, EQADC_SAMPLE_MAX)
+        self.channels: dict[int, int] = {}
+        self.last_samples: dict[int, int] = {}
 
     def initialize(self, params: EqAdcInitParams) -> None:
         """
@@ -88,6 +104,48 @@ class BaseEqAdcDevice:
             f"EQADC device {self.instance_id} calibrated with gain {gain} and offset {offset}"
         )
 
+    def get_channel_index(self, channel_id: int) -> int:
+        """
+        ! Get index of the channel in the bank, the channel is added on first use.
+
+        Added channel reads mid-scale voltage with noise over the whole sample range.
+
+        @param channel_id  The channel ID.
+        @return Index of the channel in the bank.
+        """
+        if channel_id not in self.channels:
+            self.channels[channel_id] = self.bank.add_channel(
+                voltage=EQADC_VREF_MV / 2000, noise=(EQADC_SAMPLE_MAX + 1) // 2
+            )
+        return self.channels[channel_id]
+
+    def set_channel(self, channel_id: int, **values: float) -> None:
+        """
+        ! Set parameters of the channel (voltage, multiplier, gain, offset or noise, see `AdcBank`).
+
+        E.g. `set_channel(3, voltage=1.2, noise=0)` makes channel 3 return a steady sample.
+
+        @param channel_id  The channel ID.
+        @param values  Values of the parameters.
+        """
+        index = self.get_channel_index(channel_id)
+        for name, value in values.items():
+            self.bank.set(name, index, value)
+
+    def sample(self, channel_ids: Iterable[int]) -> List[int]:
+        """
+        ! Sample the channels in one step.
+
+        @param channel_ids  The channel IDs.
+        @return Samples of the channels in counts, in order of the channel IDs.
+        """
+        channel_ids = list(channel_ids)
+        samples = self.bank.counts(
+            [self.get_channel_index(channel_id) for channel_id in channel_ids]
+        )
+        self.last_samples.update(zip(channel_ids, samples))
+        return samples
+
 
 class EqAdcDriver(EqAdcDriverServicer):
     """
@@ -95,7 +153,13 @@ class EqAdcDriver(EqAdcDriverServicer):
     """
 
     def __init__(self, raise_interrupt_func: TInterruptCallback) -> None:
-        self.raise_interrupt = raise_interrupt_func
+        # Interrupts carry the sample of one channel, held interrupts are coalesced per channel
+        self.interrupt_batch = InterruptBatch(
+            raise_interrupt_func, lambda irq_id, flags: (irq_id, flags >> 16)
+        )
+        self.raise_interrupt = self.interrupt_batch
+        # Completions of requested samples are never held or coalesced
+        self._raise_sample_completion = raise_interrupt_func
         self.devices: dict[int, BaseEqAdcDevice] = {}
         self._ready = TimeEvent()
 
@@ -157,17 +221,24 @@ class EqAdcDriver(EqAdcDriverServicer):
     ) -> Status:
         """
         ! Request samples.
+
+        Samples of all requested channels are converted in one step and their completion interrupts are raised
+        once all samples are ready, one per requested channel in order of the request (also for a repeated
+        channel). They bypass `interrupt_batch`, which coalesces only pin changes of a `PinTransaction`.
         """
-        for channel in request.channel_id:
-            logger.debug(
-                f"Requesting samples for EQADC device {request.instance_id}, channel {channel}"
-            )
-            self.raise_interrupt(
-                self.devices[request.instance_id].irq_id,
+        device = self.get_device(request.instance_id)
+        channel_ids = list(request.channel_id)
+        logger.debug(
+            f"Requesting samples for EQADC device {request.instance_id}, channels {channel_ids}"
+        )
+        samples = device.sample(channel_ids)
+        for channel, sample in zip(channel_ids, samples):
+            self._raise_sample_completion(
+                device.irq_id,
                 request.instance_id
                 | channel << 2
                 | request.instance_id << 24
                 | channel << 16
-                | randint(0, 255) << 8,
+                | sample << 8,
             )
         return Status(status=StatusEnum.STATUS_SUCCESS)
@@ -15,7 +15,6 @@
 # - Any class from typing module
 # - Callable class from typing module
 # - Dict class from typing module
-# - CanBuffer class from framework/hardware_interfaces/drivers/common/definitions/can_buffer module
 # - irq_mapper function from framework/hardware_interfaces/drivers/common/definitions/interrupt_mapper module
 # - rpc_call function from framework/support/reports module
 # - logger function from framework/support/reports module
@@ -46,12 +45,11 @@
 # Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved
 
 from queue import Empty
-from typing import Any, Callable, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
-from framework.hardware_interfaces.drivers.common.definitions.can_buffer import (
-    CanBuffer,
-)
 from framework.hardware_interfaces.drivers.common.definitions.can_instance import (
+    DEFAULT_MAILBOX_DEPTH,
+    DEFAULT_RX_DEPTH,
     CANInstance,
 )
 from framework.hardware_interfaces.drivers.common.definitions.interrupt_mapper import (
@@ -65,7 +63,7 @@ from framework.hardware_interfaces.drivers.common.definitions.interfaces import
 from framework.support.vtime.queue import Queue
 from framework.hardware_interfaces.protoc.common.common_pb2 import Status, StatusEnum
 
-from framework.support.vtime import TimeEvent
+from framework.support.vtime import OverflowPolicy, TimeEvent
 from framework.hardware_interfaces.protoc.mpc5777c.mpc5777c_mcan_driver_pb2_grpc import (
     MCanDriverServicer,
 )
@@ -81,14 +79,40 @@ from framework.hardware_interfaces.protoc.mpc5777c.mpc5777c_mcan_driver_pb2 impo
     MCMode,
 )
 
+if TYPE_CHECKING:
+    from framework.hardware_interfaces.drivers.common.can_fabric import CanFabricPort
+    from framework.support.can_log import CanRecorder
+
 
 class MCANDriver(CanBus, MCanDriverServicer):
     """! Support for CAN bus access + stub for MCAN driver."""
 
-    def __init__(self, raise_interrupt_func: Callable[[int, int], None]) -> None:
+    def __init__(
+        self,
+        raise_interrupt_func: Callable[[int, int], None],
+        rx_depth: int = DEFAULT_RX_DEPTH,
+        mailbox_depth: int = DEFAULT_MAILBOX_DEPTH,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        """
+        ! Create the driver.
+
+        @param raise_interrupt_func  Function raising interrupt in the firmware.
+        @param rx_depth  Number of frames sent by the firmware kept for `recv` per instance (0 - unbounded).
+        @param mailbox_depth  Number of frames kept in each receive buffer and FIFO (0 - unbounded).
+        @param overflow  Handling of frames put into a full queue, see `CANInstance.rx_overruns` and
+            `CANInstance.mailbox_overruns` for the number of lost frames.
+        """
         self.raise_interrupt = raise_interrupt_func
         self.instances: Dict[int, CANInstance] = {}
         self._ready = TimeEvent()
+        self.rx_depth = rx_depth
+        self.mailbox_depth = mailbox_depth
+        self.overflow = overflow
+        # Optional recorder of all frames passing the driver
+        self.recorder: Optional["CanRecorder"] = None
+        # Instances attached to a shared CAN bus (see `CanFabric.attach`)
+        self.fabric_ports: Dict[int, "CanFabricPort"] = {}
 
     def _initialize_instance(self, instance_id: int, irq_id: int) -> None:
         """
@@ -96,11 +120,13 @@ class MCANDriver(CanBus, MCanDriverServicer):
         """
         if instance_id not in self.instances:
             self.instances[instance_id] = CANInstance(
-                in_msgs=Queue(),
+                in_msgs=Queue(self.rx_depth, self.overflow),
                 out_buffers={},
                 freeze_mode=MCMode.MC_NORMAL_MODE,
                 irq_id=irq_id,
                 read_request_pending={},
+                mailbox_depth=self.mailbox_depth,
+                overflow=self.overflow,
             )
             logger.info(
                 f"New MCAN instance {instance_id} created with IRQ {irq_mapper(irq_id)}"
@@ -120,14 +146,17 @@ class MCANDriver(CanBus, MCanDriverServicer):
         """
         ! Send a message on the bus.
         """
+        if self.recorder is not None:
+            self.recorder.record_rx(msg, instance_id)
         instance = self.get_instance(instance_id)
-        for mb_idx, buffer in instance.out_buffers.items():
-            if buffer.put_can_msg(msg, timeout=timeout):
-                buffer.read_request.wait(timeout)
-                self.raise_interrupt(
-                    instance.irq_id, MCIrqFlags.MCIrqFlags_RX0FIFO_COMPLETE << 8
-                )
-                buffer.read_request.clear()
+        for mb_idx in instance.rx_filter.match(msg.arbitration_id):
+            buffer = instance.out_buffers[mb_idx]
+            buffer.put(msg, timeout=timeout)
+            buffer.read_request.wait(timeout)
+            self.raise_interrupt(
+                instance.irq_id, MCIrqFlags.MCIrqFlags_RX0FIFO_COMPLETE << 8
+            )
+            buffer.read_request.clear()
 
     def recv(
         self, timeout: float | None = None, instance_id: int = 0
@@ -174,7 +203,13 @@ class MCANDriver(CanBus, MCanDriverServicer):
         )
 
         instance = self.get_instance(request.instance_id)
-        instance.in_msgs.put(msg)
+        if self.recorder is not None:
+            self.recorder.record_tx(msg, request.instance_id)
+        port = self.fabric_ports.get(request.instance_id)
+        if port is not None:
+            port.transmit(msg)
+        else:
+            instance.in_msgs.put(msg)
         logger.info(
             f"Message sent on instance {request.instance_id}: ID={request.msg_id}"
         )
@@ -189,9 +224,11 @@ class MCANDriver(CanBus, MCanDriverServicer):
         """
         instance = self.get_instance(request.instance_id)
         if request.fl_idx not in instance.out_buffers:
-            instance.out_buffers[request.fl_idx] = CanBuffer(request.fl_idx)
+            instance.out_buffers[request.fl_idx] = instance.new_buffer(request.fl_idx)
 
+        # The FIFO accepts all messages, the mask is kept only for the buffer (no filter ID is configured)
         instance.out_buffers[request.fl_idx].set_mask(request.mask)
+        instance.update_rx_filter(instance.out_buffers[request.fl_idx])
         logger.info(
             f"Set RX FIFO filter mask for instance {request.instance_id}, filter={request.fl_idx}"
         )
@@ -203,7 +240,8 @@ class MCANDriver(CanBus, MCanDriverServicer):
         ! Receive request.
         """
         instance = self.get_instance(request.instance_id)
-        instance.out_buffers[request.vmb_idx] = CanBuffer(request.vmb_idx)
+        instance.out_buffers[request.vmb_idx] = instance.new_buffer(request.vmb_idx)
+        instance.update_rx_filter(instance.out_buffers[request.vmb_idx])
         instance.out_buffers[request.vmb_idx].read_request.set()
         logger.info(
             f"Receive request set for instance {request.instance_id}, buffer={request.vmb_idx}"
@@ -35,6 +35,9 @@ from framework.hardware_interfaces.drivers.common.definitions.interfaces import
     BasePinDriver,
 )
 from framework.hardware_interfaces.protoc.common.common_pb2 import Status, StatusEnum
+from framework.hardware_interfaces.drivers.common.definitions.interrupt_batch import (
+    InterruptBatch,
+)
 from framework.hardware_interfaces.drivers.common.definitions.interrupt_mapper import (
     irq_mapper,
 )
@@ -67,7 +70,11 @@ class PinDriver(BasePinDriver):
         self.port_pins: Dict[int, PinPortData] = {}
         self.interrupt: int | None = None
         self._ready = TimeEvent()
-        self._raise_interrupt = raise_interrupt_func
+        # Interrupts carry one pin each, held interrupts are coalesced per pin
+        self.interrupt_batch = InterruptBatch(
+            raise_interrupt_func, lambda irq_id, flags: (irq_id, flags >> 16)
+        )
+        self._raise_interrupt = self.interrupt_batch
         self._initialized = False
 
     def set(self, pin: int, value: bool) -> None:
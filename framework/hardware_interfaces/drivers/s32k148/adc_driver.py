@@ -1,6 +1,10 @@
 import struct
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, Mapping
 
+from framework.hardware_interfaces.drivers.common.adc_bank import AdcBank
+from framework.hardware_interfaces.drivers.common.definitions.interrupt_batch import (
+    InterruptBatch,
+)
 from framework.support.reports import rpc_call, logger
 from framework.hardware_interfaces.protoc.s32k148.adc_driver_pb2 import (
     ADGetValueReturn,
@@ -19,15 +23,15 @@ class AdcChannel:
     """
     A class to represent an ADC channel.
 
+    Parameters of the channel are kept in a slot of an `AdcBank` shared by all channels of the instance.
+
     Attributes:
-        vref_mv (int | None): The reference voltage in millivolts.
-        max_counts (int | None): The maximum number of counts.
-        _voltage (float): The voltage of the channel.
+        _bank (AdcBank): The bank keeping parameters of the channel.
+        _index (int): The index of the channel in the bank.
         _raise_interrupt (Callable[[int, int], None]): The function to raise an interrupt.
         _instance_id (int): The instance ID of the channel.
         _channel_id (int): The channel ID of the channel.
         iqr_id (int | None): The IRQ ID of the channel.
-        _multiplier (float): The multiplier of the channel.
     """
 
     def __init__(
@@ -36,15 +40,14 @@ class AdcChannel:
         channel_id: int,
         raise_interrupt_func: Callable[[int, int], None],
         value: float = 0,
+        bank: AdcBank | None = None,
     ) -> None:
-        self.vref_mv: int | None = None
-        self.max_counts: int | None = None
-        self._voltage = value
+        self._bank = bank if bank is not None else AdcBank()
+        self._index = self._bank.add_channel(voltage=value)
         self._raise_interrupt = raise_interrupt_func
         self._instance_id = instance_id
         self._channel_id = channel_id
         self.iqr_id: int | None = None
-        self._multiplier: float = 1.0
 
     def initialize(self, vref: int, max_counts: int, irq_id: int) -> None:
         """
@@ -55,10 +58,30 @@ class AdcChannel:
             max_counts (int): The maximum number of counts.
             irq_id (int): The IRQ ID.
         """
-        self.vref_mv = vref
-        self.max_counts = max_counts
+        self._bank.set("vref_mv", self._index, vref)
+        self._bank.set("max_counts", self._index, max_counts)
         self.iqr_id = irq_id
 
+    @property
+    def vref_mv(self) -> int | None:
+        """
+        Get the reference voltage of the channel.
+
+        Returns:
+            int | None: The reference voltage in millivolts, None if the channel is not initialized.
+        """
+        return int(self._bank.get("vref_mv", self._index)) or None
+
+    @property
+    def max_counts(self) -> int | None:
+        """
+        Get the maximum number of counts of the channel.
+
+        Returns:
+            int | None: The maximum number of counts, None if the channel is not initialized.
+        """
+        return int(self._bank.get("max_counts", self._index)) or None
+
     @property
     def multiplier(self) -> float:
         """
@@ -67,7 +90,7 @@ class AdcChannel:
         Returns:
             float: The multiplier of the channel.
         """
-        return self._multiplier
+        return self._bank.get("multiplier", self._index)
 
     @multiplier.setter
     def multiplier(self, value: float) -> None:
@@ -77,7 +100,68 @@ class AdcChannel:
         Args:
             value (float): The multiplier to set.
         """
-        self._multiplier = value
+        self._bank.set("multiplier", self._index, value)
+
+    @property
+    def gain(self) -> float:
+        """
+        Get the gain error of the channel (1.0 - no error).
+
+        Returns:
+            float: The gain of the channel.
+        """
+        return self._bank.get("gain", self._index)
+
+    @gain.setter
+    def gain(self, value: float) -> None:
+        """
+        Set the gain error of the channel.
+
+        Args:
+            value (float): The gain to set.
+        """
+        self._bank.set("gain", self._index, value)
+
+    @property
+    def offset(self) -> float:
+        """
+        Get the offset error of the channel in counts.
+
+        Returns:
+            float: The offset of the channel.
+        """
+        return self._bank.get("offset", self._index)
+
+    @offset.setter
+    def offset(self, value: float) -> None:
+        """
+        Set the offset error of the channel in counts.
+
+        Args:
+            value (float): The offset to set.
+        """
+        self._bank.set("offset", self._index, value)
+
+    @property
+    def noise(self) -> int:
+        """
+        Get the noise amplitude of the channel in counts.
+
+        Returns:
+            int: The noise amplitude (0 - no noise).
+        """
+        return int(self._bank.get("noise", self._index))
+
+    @noise.setter
+    def noise(self, value: int) -> None:
+        """
+        Set the noise amplitude of the channel in counts, each reading is changed by a uniform random
+        integer in range -value - +value.
+
+        Args:
+            value (int): The noise amplitude to set.
+        """
+        self._bank.set("noise", self._index, value)
 
     @property
     def voltage(self) -> float:
@@ -87,7 +171,7 @@ class AdcChannel:
         Returns:
             float: The voltage of the channel.
         """
-        return self._voltage
+        return self._bank.get("voltage", self._index)
 
     @voltage.setter
     def voltage(self, value: float) -> None:
@@ -97,10 +181,20 @@ class AdcChannel:
         Args:
             value (float): The voltage to set.
         """
-        self._voltage = value
+        self._bank.set("voltage", self._index, value)
+        if self.iqr_id:
+            self.notify(self.counts)
+
+    def notify(self, counts: int) -> None:
+        """
+        Raise the interrupt of the channel with the given counts.
+
+        Args:
+            counts (int): The counts of the channel.
+        """
         if self.iqr_id:
             flags = int.from_bytes(
-                struct.pack(">BBH", self._channel_id, self._instance_id, self.counts),
+                struct.pack(">BBH", self._channel_id, self._instance_id, counts),
                 byteorder="big",
             )
             self._raise_interrupt(self.iqr_id, flags)
@@ -114,11 +208,8 @@ class AdcChannel:
             int: The counts of the channel.
         """
         assert self.vref_mv is not None
-        assert self.voltage is not None
         assert self.max_counts is not None
-        return int(
-            ((self.voltage * self.multiplier * 1000) / self.vref_mv) * self.max_counts
-        )
+        return self._bank.counts([self._index])[0]
 
 
 class AdcDriver(AdcDriverServicer):
@@ -127,14 +218,21 @@ class AdcDriver(AdcDriverServicer):
 
     Attributes:
         _channels (Dict[int, Dict[int, AdcChannel]]): The ADC channels.
+        _banks (Dict[int, AdcBank]): The banks keeping parameters of channels, one per instance.
         _ready (TimeEvent): The ready event.
         _raise_interrupt (Callable[[int, int], None]): The function to raise an interrupt.
+        interrupt_batch (InterruptBatch): Holds interrupts of all channels back (see `PinTransaction`).
     """
 
     def __init__(self, raise_interrupt_func: Callable[[int, int], None]) -> None:
         self._channels: Dict[int, Dict[int, AdcChannel]] = {}
+        self._banks: Dict[int, AdcBank] = {}
         self._ready = TimeEvent()
-        self._raise_interrupt = raise_interrupt_func
+        # Interrupts carry counts of one channel, held interrupts are coalesced per channel
+        self.interrupt_batch = InterruptBatch(
+            raise_interrupt_func, lambda irq_id, flags: (irq_id, flags >> 16)
+        )
+        self._raise_interrupt = self.interrupt_batch
 
     def wait_for_initialization(self) -> None:
         """
@@ -155,18 +253,61 @@ class AdcDriver(AdcDriverServicer):
         Returns:
             AdcChannel: The ADC channel.
         """
-        if instance_id in self._channels:
-            if channel_id not in self._channels[instance_id]:
-                self._channels[instance_id][channel_id] = AdcChannel(
-                    instance_id, channel_id, self._raise_interrupt
-                )
-        else:
-            self._channels[instance_id] = {
-                channel_id: AdcChannel(instance_id, channel_id, self._raise_interrupt)
-            }
+        channels = self._channels.setdefault(instance_id, {})
+        if channel_id not in channels:
+            channels[channel_id] = AdcChannel(
+                instance_id,
+                channel_id,
+                self._raise_interrupt,
+                bank=self._banks.setdefault(instance_id, AdcBank()),
+            )
 
         return self._channels[instance_id][channel_id]
 
+    def get_counts(self, instance_id: int) -> Dict[int, int]:
+        """
+        Get counts of all channels of the instance, computed in one step.
+
+        Args:
+            instance_id (int): The instance ID.
+
+        Returns:
+            Dict[int, int]: The counts by channel ID.
+        """
+        channels = self._channels.get(instance_id, {})
+        if not channels:
+            return {}
+        counts = self._banks[instance_id].counts(
+            [channel._index for channel in channels.values()]
+        )
+        return dict(zip(channels, counts))
+
+    def set_voltages(self, instance_id: int, voltages: Mapping[int, float]) -> None:
+        """
+        Set voltages of several channels of the instance at once.
+
+        Voltages are stored and converted to counts in one step, interrupts of the channels are raised together
+        after all voltages are changed.
+
+        Args:
+            instance_id (int): The instance ID.
+            voltages (Mapping[int, float]): The voltages by channel ID.
+        """
+        channels = [
+            self.get_channel(instance_id, channel_id) for channel_id in voltages
+        ]
+        indices = [channel._index for channel in channels]
+        bank = self._banks[instance_id]
+        bank.set("voltage", indices, list(voltages.values()))
+        notified = [channel for channel in channels if channel.iqr_id]
+        counts = bank.counts([channel._index for channel in notified])
+        self.interrupt_batch.hold()
+        try:
+            for channel, channel_counts in zip(notified, counts):
+                channel.notify(channel_counts)
+        finally:
+            self.interrupt_batch.release()
+
     @rpc_call
     def AdcDriver_InitChannel(self, request: ADInitParams, context: Any) -> Status:
         """
@@ -196,8 +337,10 @@ class AdcDriver(AdcDriverServicer):
         Returns:
             Status: The status.
         """
-        for channel in self._channels[request.instance_id].values():
-            channel.voltage = 0
+        self.set_voltages(
+            request.instance_id,
+            dict.fromkeys(self._channels[request.instance_id], 0.0),
+        )
         return Status(status=StatusEnum.STATUS_SUCCESS)
 
     @rpc_call
@@ -15,7 +15,7 @@ from framework.hardware_interfaces.protoc.s32k148.rtc_driver_pb2_grpc import (
 )
 
 from framework.core.control.rtc import RTC_Timer
-from framework.support.vtime import TimeEvent
+from framework.support.vtime import TimeEvent, TimerEngine
 
 
 class RtcDriver(RtcDriverServicer):
@@ -25,19 +25,27 @@ class RtcDriver(RtcDriverServicer):
     Attributes:
         raise_interrupt: A function that raises an interrupt.
         timer: An instance of the RTC_Timer class.
+        timer_engine: Optional TimerEngine driving the RTC timer.
         _ready: An event that signals that the RTC is ready.
     """
 
-    def __init__(self, raise_interrupt_func: Callable[[int, int], None]) -> None:
+    def __init__(
+        self,
+        raise_interrupt_func: Callable[[int, int], None],
+        timer_engine: Optional[TimerEngine] = None,
+    ) -> None:
         self.raise_interrupt = raise_interrupt_func
         self.timer: Optional[RTC_Timer] = None
+        self.timer_engine = timer_engine
         self._ready = TimeEvent()
 
     @rpc_call
     def RTC_DRV_Init(self, request: RtcInitParams, context: ServicerContext) -> Status:
         """Initializes RTC."""
         try:
-            self.timer = RTC_Timer(request.seconds_irq_id, self.raise_interrupt)
+            self.timer = RTC_Timer(
+                request.seconds_irq_id, self.raise_interrupt, self.timer_engine
+            )
             logger.info(
                 f"RTC initialized with IRQ ID {request.irq_id}, Seconds IRQ ID {request.seconds_irq_id}"
             )
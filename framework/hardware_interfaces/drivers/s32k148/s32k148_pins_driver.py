@@ -1,12 +1,12 @@
 import dataclasses
-import struct
 from typing import Any, Dict, Callable
 
-import bitstruct
-
 from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
     BasePinDriver,
 )
+from framework.hardware_interfaces.drivers.common.definitions.interrupt_batch import (
+    InterruptBatch,
+)
 from framework.support.reports import logger, rpc_call
 from framework.hardware_interfaces.protoc.common.common_pb2 import Status, StatusEnum
 from framework.hardware_interfaces.protoc.s32k148.s32k148_pins_driver_pb2 import (
@@ -42,22 +42,29 @@ class PinPortData:
 
     Attributes:
         direction (Direction): The direction.
-        value (int): The value.
     """
 
     direction: Direction
-    value: int
 
 
 class PinDriver(PinsDriverServicer, BasePinDriver):
-    """Stub for GPIO pins."""
+    """
+    Stub for GPIO pins.
+
+    Values of the pins of each port are kept as a bitmask (bit N - pin N), which is passed as flags of the port
+    interrupt raised on each change.
+    """
 
     def __init__(self, raise_interrupt_func: Callable[[int, int], None]) -> None:
         super().__init__()
         self.port_pins: Dict[PinPort, PinPortData] = {}
+        self.port_values: Dict[int, int] = {}
+        self._port_masks: Dict[int, int] = {}
         self.interrupts: Dict[int, int] = {}
         self._ready = TimeEvent()
-        self._raise_interrupt = raise_interrupt_func
+        # Interrupts carry state of the whole port, held interrupts are coalesced per port
+        self.interrupt_batch = InterruptBatch(raise_interrupt_func)
+        self._raise_interrupt = self.interrupt_batch
 
     def set(self, port: int, pin: int, value: bool) -> None:
         """
@@ -68,16 +75,21 @@ class PinDriver(PinsDriverServicer, BasePinDriver):
             pin (int): The pin.
             value (bool): The value.
         """
-        self.port_pins[PinPort(port, pin)].value = value
-        pin_values = []
-        for i in range(32):
-            pin_port = PinPort(port, i)
-            pin_values.append(
-                self.port_pins[pin_port].value if pin_port in self.port_pins else 0
-            )
+        self.set_many(port, 1 << pin, (1 << pin) if value else 0)
+
+    def set_many(self, port: int, mask: int, values: int) -> None:
+        """
+        Set values of several pins of a port at once, the port interrupt is raised once.
 
-        flags = struct.unpack(">I", bitstruct.pack(32 * "b1", *reversed(pin_values)))[0]
-        self._raise_interrupt(self.interrupts[port], flags)
+        Args:
+            port (int): The port.
+            mask (int): Bitmask of the set pins (bit N - pin N).
+            values (int): Bitmask of the values, only bits selected by mask are used.
+        """
+        self._check_pins(port, mask)
+        state = (self.port_values[port] & ~mask) | (values & mask)
+        self.port_values[port] = state
+        self._raise_interrupt(self.interrupts[port], state)
 
     def get(self, port: int, pin: int) -> bool:
         """
@@ -90,10 +102,20 @@ class PinDriver(PinsDriverServicer, BasePinDriver):
         Returns:
             bool: The value.
         """
-        pin_port = PinPort(port, pin)
-        if pin_port not in self.port_pins:
-            raise KeyError(f"{pin_port} not configured/initialized")
-        return bool(self.port_pins[pin_port].value)
+        self._check_pins(port, 1 << pin)
+        return bool(self.port_values[port] >> pin & 1)
+
+    def _check_pins(self, port: int, mask: int) -> None:
+        """
+        Check that all pins selected by the mask are configured.
+
+        Raises:
+            KeyError: If any of the pins is not configured.
+        """
+        unknown = mask & ~self._port_masks.get(port, 0)
+        if unknown:
+            pins = [pin for pin in range(unknown.bit_length()) if unknown >> pin & 1]
+            raise KeyError(f"Pins {pins} of port {port:#x} not configured/initialized")
 
     def wait_for_initialization(self) -> None:
         """
@@ -113,11 +135,19 @@ class PinDriver(PinsDriverServicer, BasePinDriver):
         Initialize the pins.
         """
         self.port_pins = {
-            PinPort(item.port_id, item.pin_id): PinPortData(
-                item.direction, item.init_value
-            )
+            PinPort(item.port_id, item.pin_id): PinPortData(item.direction)
             for item in request.config
         }
+        self.port_values = {}
+        self._port_masks = {}
+        for item in request.config:
+            pin_bit = 1 << item.pin_id
+            self._port_masks[item.port_id] = (
+                self._port_masks.get(item.port_id, 0) | pin_bit
+            )
+            self.port_values[item.port_id] = self.port_values.get(item.port_id, 0) | (
+                pin_bit if item.init_value else 0
+            )
         self.interrupts = {
             setting.port_id: setting.irq_id for setting in request.irq_ids
         }
@@ -131,9 +161,9 @@ class PinDriver(PinsDriverServicer, BasePinDriver):
         """
         Set the direction of a pin.
         """
-        self.port_pins[
-            PinPort(request.port_id, request.pin_id)
-        ].direction = request.direction
+        self.port_pins[PinPort(request.port_id, request.pin_id)].direction = (
+            request.direction
+        )
         return Status(status=StatusEnum.STATUS_SUCCESS)
 
     @rpc_call
@@ -141,5 +171,9 @@ class PinDriver(PinsDriverServicer, BasePinDriver):
         """
         Write to a pin.
         """
-        self.port_pins[PinPort(request.port_id, request.pin_id)].value = request.value
+        pin_bit = 1 << request.pin_id
+        self._check_pins(request.port_id, pin_bit)
+        self.port_values[request.port_id] = (
+            self.port_values[request.port_id] & ~pin_bit
+        ) | (pin_bit if request.value else 0)
         return Status(status=StatusEnum.STATUS_SUCCESS)
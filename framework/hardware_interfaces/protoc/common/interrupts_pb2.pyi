@@ -7,10 +7,12 @@ from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Map
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class IdleContext(_message.Message):
-    __slots__ = ("idle_cycles",)
+    __slots__ = ("idle_cycles", "max_batch_size")
     IDLE_CYCLES_FIELD_NUMBER: _ClassVar[int]
+    MAX_BATCH_SIZE_FIELD_NUMBER: _ClassVar[int]
     idle_cycles: int
-    def __init__(self, idle_cycles: _Optional[int] = ...) -> None: ...
+    max_batch_size: int
+    def __init__(self, idle_cycles: _Optional[int] = ..., max_batch_size: _Optional[int] = ...) -> None: ...
 
 class InterruptContext(_message.Message):
     __slots__ = ("irq_id", "irq_flags", "time")
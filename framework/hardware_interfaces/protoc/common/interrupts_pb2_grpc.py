@@ -44,6 +44,11 @@ class InterruptsStub(object):
                 request_serializer=interrupts__pb2.IdleContext.SerializeToString,
                 response_deserializer=interrupts__pb2.InterruptContextQueue.FromString,
                 _registered_method=True)
+        self.InterruptStream = channel.stream_stream(
+                '/rpc_general.Interrupts/InterruptStream',
+                request_serializer=interrupts__pb2.IdleContext.SerializeToString,
+                response_deserializer=interrupts__pb2.InterruptContextQueue.FromString,
+                _registered_method=True)
 
 
 class InterruptsServicer(object):
@@ -55,6 +60,14 @@ class InterruptsServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def InterruptStream(self, request_iterator, context):
+        """Streaming alternative of WaitForInterrupt - emulator reports each idle cycle on the stream and
+        simulator responds with interrupts collected for that cycle.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_InterruptsServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -63,6 +76,11 @@ def add_InterruptsServicer_to_server(servicer, server):
                     request_deserializer=interrupts__pb2.IdleContext.FromString,
                     response_serializer=interrupts__pb2.InterruptContextQueue.SerializeToString,
             ),
+            'InterruptStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.InterruptStream,
+                    request_deserializer=interrupts__pb2.IdleContext.FromString,
+                    response_serializer=interrupts__pb2.InterruptContextQueue.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'rpc_general.Interrupts', rpc_method_handlers)
@@ -100,3 +118,30 @@ class Interrupts(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def InterruptStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/rpc_general.Interrupts/InterruptStream',
+            interrupts__pb2.IdleContext.SerializeToString,
+            interrupts__pb2.InterruptContextQueue.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
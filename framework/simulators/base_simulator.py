@@ -11,8 +11,6 @@
 # @section libraries_base_simulator Libraries/Modules
 # - signal standard library
 # - abc standard library
-# - concurrent.futures standard library
-# - grpc module
 # - framework.core.control.encoder module (local)
 #   - Access to Encoder class.
 # - framework.support.reports module (local)
@@ -21,6 +19,11 @@
 #   - Access to get_rpc_connect function.
 # - framework.hardware_interfaces.drivers.common.interrupts module (local)
 #   - Access to Interrupts class.
+# - framework.support.vtime module (local)
+#   - Access to TimerEngine class.
+# - framework.simulators.grpc_server module (local)
+#   - Access to GrpcServerConfig class.
+#   - Access to create_grpc_server function.
 #
 # @section notes_base_simulator Notes
 # - None.
@@ -37,9 +40,7 @@
 # Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved.
 import signal
 from abc import abstractmethod, ABC
-from concurrent import futures
-
-import grpc
+from typing import Optional
 
 from framework.core.control.encoder import Encoder
 from framework.support.reports import (
@@ -50,27 +51,66 @@ from framework.hardware_interfaces.drivers import (
 )
 
 from framework.hardware_interfaces.drivers.common.interrupts import Interrupts
+from framework.support.vtime import TimerEngine
+from framework.simulators.grpc_server import GrpcServerConfig, create_grpc_server
 
 
 class BaseSimulator(ABC):
     """
     Simulator class that initializes all the hardware drivers and gRPC server.
+
+    If `use_timer_engine` is set, all periodic HW timers are driven by one shared `TimerEngine`
+    instead of running each in its own virtual time worker. `fast_forward_timers` additionally lets the engine
+    step through timeouts that wake up no other worker without going idle (implies `use_timer_engine`, see
+    `TimerEngine`). Timers raising interrupts to the emulator are still stepped one expiration at a time.
+
+    `pipelined_can_tx` lets the FlexCAN driver queue frames sent to the firmware instead of blocking the
+    sender until the firmware takes each frame (see `FlexCanDriver`).
+
+    The gRPC server (number of threads, channel options, per-service concurrency and transport) is configured
+    by `server_config`; by default RPCs are handled by a single thread listening on TCP `rpc_listening_port`.
     """
 
-    def __init__(self, rpc_listening_port: int) -> None:
+    def __init__(
+        self,
+        rpc_listening_port: int,
+        use_timer_engine: bool = False,
+        server_config: Optional[GrpcServerConfig] = None,
+        fast_forward_timers: bool = False,
+        pipelined_can_tx: bool = False,
+    ) -> None:
         # Allow interruption Ctrl+C
         signal.signal(signal.SIGINT, signal.SIG_DFL)
 
+        # Queue frames sent to the firmware by the FlexCAN driver (opt-in)
+        self.pipelined_can_tx = pipelined_can_tx
+
         # Interrupt manager
         self.irq_manager = Interrupts()
 
+        # Shared engine for periodic HW timers (opt-in)
+        self.timer_engine: Optional[TimerEngine] = (
+            TimerEngine(fast_forward=fast_forward_timers)
+            if use_timer_engine or fast_forward_timers
+            else None
+        )
+
         # HW drivers simulator
         self.rpc_connect_svc = get_rpc_connect()
-        self.encoder = Encoder(self.irq_manager.raise_interrupt)
+        self.encoder = Encoder(self.irq_manager.raise_interrupt, self.timer_engine)
         # gRPC server setup
         self.port = str(rpc_listening_port)
-        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
-        self.port = self.server.add_insecure_port("[::]:" + self.port)
+        self.server_config = (
+            server_config if server_config is not None else GrpcServerConfig()
+        )
+        self.server = create_grpc_server(self.server_config)
+        # Address used by the emulator to connect to the server (TCP port or Unix domain socket)
+        if self.server_config.unix_socket_path is not None:
+            self.rpc_address = f"unix:{self.server_config.unix_socket_path}"
+            self.port = self.server.add_insecure_port(self.rpc_address)
+        else:
+            self.port = self.server.add_insecure_port("[::]:" + self.port)
+            self.rpc_address = f"localhost:{self.port}"
 
     def run(self) -> None:
         """
@@ -78,7 +118,7 @@ class BaseSimulator(ABC):
         """
         self.server.start()
         self.irq_manager.start()
-        logger.info(f"Server started, listening on {self.port}")
+        logger.info(f"Server started, listening on {self.rpc_address}")
 
     def run_forever(self) -> None:
         """
@@ -15,7 +15,7 @@
 # - vtime module (local)
 #   - Access to VirtualTimeWorker class.
 
-from typing import cast
+from typing import Optional, cast
 
 from framework.core.boards.flu.hw_board import HwBoard
 from framework.core.control.pit import PITChannelManager
@@ -33,6 +33,7 @@ from framework.hardware_interfaces.protoc.mpc5777c.mpc5777c_pins_driver_pb2_grpc
     add_PinsDriverServicer_to_server,
 )
 from framework.simulators.base_simulator import BaseSimulator
+from framework.simulators.grpc_server import GrpcServerConfig
 from framework.support.reports import (
     logger,
     configure_logger_for_script,
@@ -70,15 +71,30 @@ class FlacsLgsSimulator(BaseSimulator):
 
     MCU_TYPE: MCUType = MCUType.MPC5777C
 
-    def __init__(self, rpc_listening_port: int) -> None:
+    def __init__(
+        self,
+        rpc_listening_port: int,
+        use_timer_engine: bool = False,
+        server_config: Optional[GrpcServerConfig] = None,
+        fast_forward_timers: bool = False,
+        pipelined_can_tx: bool = False,
+    ) -> None:
         # Initialize interrupt mapper for the MCU type (used by logger)
         initialize_irq_mapper(self.MCU_TYPE)
 
-        super().__init__(rpc_listening_port)
+        super().__init__(
+            rpc_listening_port,
+            use_timer_engine,
+            server_config,
+            fast_forward_timers,
+            pipelined_can_tx,
+        )
 
         # HW drivers simulators
         self.pins = get_pins_drv(self.irq_manager.raise_interrupt, self.MCU_TYPE)
-        self.pit = get_pit_drv(self.irq_manager.raise_interrupt, PITChannelManager())
+        self.pit = get_pit_drv(
+            self.irq_manager.raise_interrupt, PITChannelManager(self.timer_engine)
+        )
         self.sync_interface = cast(
             SifDriver, get_sync_drv(self.irq_manager.raise_interrupt, self.MCU_TYPE)
         )
@@ -145,6 +161,8 @@ class FlacsLgsSimulator(BaseSimulator):
         self.server.stop(5)
         self.irq_manager.stop()
         self.pit.time_manager.stop_all()
+        if self.timer_engine is not None:
+            self.timer_engine.stop()
         vtime_manager.reset()
 
 
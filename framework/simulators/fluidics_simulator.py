@@ -29,7 +29,7 @@
 #
 # Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved.
 
-from typing import cast
+from typing import Optional, cast
 
 from framework.core.boards.flu.hw_board import HwBoard
 from framework.core.control.pit import PITChannelManager
@@ -48,6 +48,7 @@ from framework.hardware_interfaces.protoc.mpc5777c.mpc5777c_pins_driver_pb2_grpc
     add_PinsDriverServicer_to_server,
 )
 from framework.simulators.base_simulator import BaseSimulator
+from framework.simulators.grpc_server import GrpcServerConfig
 
 from framework.hardware_interfaces.drivers import (
     get_pit_drv,
@@ -106,17 +107,34 @@ class FluidicsSimulator(BaseSimulator):
 
     MCU_TYPE: MCUType = MCUType.MPC5777C
 
-    def __init__(self, rpc_listening_port: int) -> None:
+    def __init__(
+        self,
+        rpc_listening_port: int,
+        use_timer_engine: bool = False,
+        server_config: Optional[GrpcServerConfig] = None,
+        fast_forward_timers: bool = False,
+        pipelined_can_tx: bool = False,
+    ) -> None:
         # Initialize interrupt mapper for the MCU type (used by logger)
         initialize_irq_mapper(self.MCU_TYPE)
 
-        super().__init__(rpc_listening_port)
+        super().__init__(
+            rpc_listening_port,
+            use_timer_engine,
+            server_config,
+            fast_forward_timers,
+            pipelined_can_tx,
+        )
 
         # HW drivers simulators
-        self.can_node = get_can_bus_drv(self.irq_manager.raise_interrupt)
+        self.can_node = get_can_bus_drv(
+            self.irq_manager.raise_interrupt, self.pipelined_can_tx
+        )
         self.mcan_node = get_mcan_drv(self.irq_manager.raise_interrupt)
         self.pins = get_pins_drv(self.irq_manager.raise_interrupt, self.MCU_TYPE)
-        self.pit = get_pit_drv(self.irq_manager.raise_interrupt, PITChannelManager())
+        self.pit = get_pit_drv(
+            self.irq_manager.raise_interrupt, PITChannelManager(self.timer_engine)
+        )
         self.sync_interface = cast(
             SifDriver, get_sync_drv(self.irq_manager.raise_interrupt, self.MCU_TYPE)
         )
@@ -124,7 +142,9 @@ class FluidicsSimulator(BaseSimulator):
 
         self.emios_common = get_emios_common_drv(self.irq_manager.raise_interrupt)
         self.emios_qdec = get_emios_qdec_drv(self.irq_manager.raise_interrupt)
-        self.emios_mc = get_emios_mc_drv(self.irq_manager.raise_interrupt)
+        self.emios_mc = get_emios_mc_drv(
+            self.irq_manager.raise_interrupt, self.timer_engine
+        )
         self.etpu_i2c = get_etpu_i2c_drv(self.irq_manager.raise_interrupt)
         self.eqadc = get_eqadc_drv(self.irq_manager.raise_interrupt)
 
@@ -206,4 +226,6 @@ class FluidicsSimulator(BaseSimulator):
         self.mcan_node.shutdown()
         self.pit.time_manager.stop_all()
         self.emios_mc.stop_all()
+        if self.timer_engine is not None:
+            self.timer_engine.stop()
         vtime_manager.reset()
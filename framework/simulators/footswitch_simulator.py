@@ -69,9 +69,10 @@
 #
 # Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved.
 
-from typing import cast
+from typing import Optional, cast
 
 from framework.simulators.base_simulator import BaseSimulator
+from framework.simulators.grpc_server import GrpcServerConfig
 from framework.core.control.pwm import Pwm
 from framework.support.reports import (
     logger,
@@ -160,16 +161,33 @@ class FootSwitchSimulator(BaseSimulator):
 
     MCU_TYPE: MCUType = MCUType.S32K148
 
-    def __init__(self, rpc_listening_port: int) -> None:
+    def __init__(
+        self,
+        rpc_listening_port: int,
+        use_timer_engine: bool = False,
+        server_config: Optional[GrpcServerConfig] = None,
+        fast_forward_timers: bool = False,
+        pipelined_can_tx: bool = False,
+    ) -> None:
         # Initialize interrupt mapper for the MCU type (used by logger)
         initialize_irq_mapper(self.MCU_TYPE)
 
-        super().__init__(rpc_listening_port)
+        super().__init__(
+            rpc_listening_port,
+            use_timer_engine,
+            server_config,
+            fast_forward_timers,
+            pipelined_can_tx,
+        )
 
         # HW drivers simulator
-        self.can_node = get_can_bus_drv(self.irq_manager.raise_interrupt)
+        self.can_node = get_can_bus_drv(
+            self.irq_manager.raise_interrupt, self.pipelined_can_tx
+        )
         self.pins = get_pins_drv(self.irq_manager.raise_interrupt, self.MCU_TYPE)
-        self.lpit = get_lpit_drv(self.irq_manager.raise_interrupt, TimerManager())
+        self.lpit = get_lpit_drv(
+            self.irq_manager.raise_interrupt, TimerManager(self.timer_engine)
+        )
         self.async_interface = get_async_drv(self.irq_manager.raise_interrupt)
         # fmt: off
         self.async_interface.register_stream(
@@ -200,7 +218,9 @@ class FootSwitchSimulator(BaseSimulator):
         self.pwm_driver.register_pwm_channel(self.pwm1)
         self.pwm_driver.register_pwm_channel(self.pwm2)
 
-        self.rtc_driver = get_rtc_drv(self.irq_manager.raise_interrupt)
+        self.rtc_driver = get_rtc_drv(
+            self.irq_manager.raise_interrupt, self.timer_engine
+        )
 
         self.sync_interface = cast(
             SifDriver, get_sync_drv(self.irq_manager.raise_interrupt, self.MCU_TYPE)
@@ -311,6 +331,8 @@ class FootSwitchSimulator(BaseSimulator):
         if self.rtc_driver.timer is not None:
             self.rtc_driver.timer.stop()
         self.encoder.channel.stop()
+        if self.timer_engine is not None:
+            self.timer_engine.stop()
         vtime_manager.reset()
 
 
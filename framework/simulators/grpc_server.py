@@ -0,0 +1,167 @@
+"""! @Brief Configuration and construction of the simulator's gRPC server."""
+
+#
+# @file grpc_server.py
+#
+# @brief Configuration and construction of the simulator's gRPC server.
+#
+# @section description_grpc_server Description
+# This module represents the GrpcServerConfig and the VirtualTimeServerInterceptor classes.
+#
+# @section libraries_grpc_server Libraries/Modules
+# - dataclasses standard library
+# - threading standard library
+# - concurrent.futures standard library
+# - typing standard library (https://docs.python.org/3/library/typing.html)
+# - grpc module
+# - framework.support.vtime module (local)
+#   - Access to get_worker_manager function.
+#   - Access to VirtualTimeWorker class.
+#
+# @section notes_grpc_server Notes
+# - RPCs of the Interrupts service are not tracked by the interceptor as they manage the emulator's worker
+#   on their own (see `Interrupts.start` and `VirtualTimeWorker.set_worker_id`).
+#
+# @section todo_grpc_server TODO
+# - None.
+#
+# Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved.
+import dataclasses
+import threading
+from concurrent import futures
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import grpc
+
+from framework.support.vtime import get_worker_manager, VirtualTimeWorker
+
+
+@dataclasses.dataclass
+class GrpcServerConfig:
+    """! Configuration of the simulator's gRPC server.
+
+    @param max_workers  Number of threads handling RPCs concurrently.
+    @param max_message_length  Maximum size of received and sent message in bytes (None - gRPC default).
+    @param keepalive_time_ms  Period of keepalive pings in milliseconds (None - gRPC default).
+    @param keepalive_timeout_ms  Timeout of keepalive ping acknowledgement in milliseconds (None - gRPC default).
+    @param service_concurrency  Maximum number of concurrently handled calls per service,
+        keyed by full service name (e.g. `rpc_general.FlexCanDriver`).
+    @param options  Additional raw gRPC channel options.
+    @param unix_socket_path  Path of Unix domain socket the server listens on instead of TCP port
+        (both processes have to run on the same host).
+    """
+
+    max_workers: int = 1
+    max_message_length: Optional[int] = None
+    keepalive_time_ms: Optional[int] = None
+    keepalive_timeout_ms: Optional[int] = None
+    service_concurrency: Dict[str, int] = dataclasses.field(default_factory=dict)
+    options: List[Tuple[str, Any]] = dataclasses.field(default_factory=list)
+    unix_socket_path: Optional[str] = None
+
+    def channel_options(self) -> List[Tuple[str, Any]]:
+        """! Get gRPC channel options.
+
+        @return  List of gRPC channel options.
+        """
+        options = list(self.options)
+        if self.max_message_length is not None:
+            options.append(("grpc.max_receive_message_length", self.max_message_length))
+            options.append(("grpc.max_send_message_length", self.max_message_length))
+        if self.keepalive_time_ms is not None:
+            options.append(("grpc.keepalive_time_ms", self.keepalive_time_ms))
+        if self.keepalive_timeout_ms is not None:
+            options.append(("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms))
+        return options
+
+
+class VirtualTimeServerInterceptor(grpc.ServerInterceptor):  # type: ignore
+    """! Server interceptor keeping virtual time accounting correct for concurrently handled RPCs.
+
+    With a single server thread, driver RPCs are never handled while the emulator waits for interrupts.
+    With more threads they are, so each handled RPC is registered as an active virtual time worker for
+    its duration - virtual time is not advanced while the emulator's request is processed.
+
+    The interceptor also limits number of concurrently handled calls per service.
+    """
+
+    UNTRACKED_SERVICES = ("rpc_general.Interrupts",)
+
+    def __init__(
+        self, service_concurrency: Dict[str, int], track_workers: bool = True
+    ) -> None:
+        self._track_workers = track_workers
+        self._limits = {
+            service: threading.BoundedSemaphore(limit)
+            for service, limit in service_concurrency.items()
+        }
+
+    def intercept_service(
+        self,
+        continuation: Callable[[grpc.HandlerCallDetails], grpc.RpcMethodHandler],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        """! Wrap unary RPC handlers with worker registration and concurrency limit.
+
+        @param continuation  Function returning the next RPC handler.
+        @param handler_call_details  Details of the called method.
+
+        @return  RPC handler.
+        """
+        handler = continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        service = handler_call_details.method.split("/")[1]
+        limit = self._limits.get(service)
+        track = self._track_workers and service not in self.UNTRACKED_SERVICES
+        if limit is None and not track:
+            return handler
+
+        behavior = handler.unary_unary
+
+        def wrapped_behavior(request: Any, context: grpc.ServicerContext) -> Any:
+            if limit is not None:
+                limit.acquire()
+            try:
+                if not track:
+                    return behavior(request, context)
+                worker_id = VirtualTimeWorker.current_worker()
+                get_worker_manager().register_worker(worker_id)
+                try:
+                    return behavior(request, context)
+                finally:
+                    get_worker_manager().unregister_worker(worker_id)
+            finally:
+                if limit is not None:
+                    limit.release()
+
+        return grpc.unary_unary_rpc_method_handler(
+            wrapped_behavior,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+
+def create_grpc_server(config: GrpcServerConfig) -> grpc.Server:
+    """! Create gRPC server based on configuration.
+
+    The virtual time interceptor is installed only when RPCs can be handled concurrently
+    or concurrency of some service is limited.
+
+    @param config  Configuration of the server.
+
+    @return  gRPC server.
+    """
+    interceptors = []
+    if config.max_workers > 1 or config.service_concurrency:
+        interceptors.append(
+            VirtualTimeServerInterceptor(
+                config.service_concurrency, track_workers=config.max_workers > 1
+            )
+        )
+    return grpc.server(
+        futures.ThreadPoolExecutor(max_workers=config.max_workers),
+        interceptors=interceptors,
+        options=config.channel_options(),
+    )
@@ -0,0 +1,13 @@
+from framework.support.can_log.can_log import (
+    CanLogRecord,
+    CanRecorder,
+    CanReplayer,
+    Direction,
+)
+
+__all__ = [
+    "CanLogRecord",
+    "CanRecorder",
+    "CanReplayer",
+    "Direction",
+]
@@ -0,0 +1,256 @@
+import bisect
+import dataclasses
+import inspect
+import os
+import struct
+import threading
+from enum import IntEnum
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple
+
+from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
+    CanBus,
+    CanMessage,
+)
+from framework.support.reports import logger
+from framework.support.vtime import vtime_manager
+
+
+class Direction(IntEnum):
+    """Direction of the recorded frame seen from the firmware."""
+
+    RX = 0  # Frame sent to the firmware (console side, `CanBus.send`)
+    TX = 1  # Frame sent by the firmware (`*_DRV_Send`)
+
+
+@dataclasses.dataclass(frozen=True)
+class CanLogRecord:
+    """Recorded CAN frame."""
+
+    time_us: int
+    instance: int
+    direction: Direction
+    arbitration_id: int
+    is_extended_id: bool
+    data: bytes
+    dlc: int
+    is_remote_frame: bool = False
+    is_fd: bool = False
+
+    def to_message(self) -> CanMessage:
+        """Convert record to CAN message."""
+        return CanMessage(
+            arbitration_id=self.arbitration_id,
+            is_extended_id=self.is_extended_id,
+            is_remote_frame=self.is_remote_frame,
+            is_fd=self.is_fd,
+            dlc=self.dlc,
+            data=self.data,
+        )
+
+
+MAGIC = b"ATFCAN\x02\x00"
+# time_us, arbitration ID, instance, direction, flags, DLC, data length
+RECORD = struct.Struct("<QIBBBBB")
+# time_us, file offset
+INDEX_ENTRY = struct.Struct("<QQ")
+FLAG_EXTENDED_ID = 0x01
+FLAG_REMOTE_FRAME = 0x02
+FLAG_FD = 0x04
+
+
+def index_path(path: str) -> str:
+    """Return path of the index file belonging to the CAN log."""
+    return path + ".idx"
+
+
+class CanRecorder:
+    """Recorder streaming CAN frames to a binary log.
+
+    The log starts with a magic header followed by records: fixed-size header (virtual time in microseconds,
+    arbitration ID, instance, direction, flags, DLC, data length) and frame data. Flags keep the extended ID,
+    remote and FD frame markers, the DLC is stored as sent since it can differ from the data length (remote
+    frames). Every `index_interval` records
+    the time and offset of the record are appended to the index file (`<path>.idx`), which allows the replayer
+    to seek to a given virtual time without reading the whole log.
+
+    Drivers (`FlexCanDriver`, `MCANDriver`) record frames when a recorder is assigned to their `recorder`
+    attribute.
+    """
+
+    def __init__(self, path: str, index_interval: int = 256) -> None:
+        """Create the log, an existing log and its index are overwritten.
+
+        Each recording starts a new log, so virtual time of the records (restarting with each session) and
+        the index stay monotonic.
+
+        Args:
+            path: Path of the log file.
+            index_interval: Number of records between index entries.
+        """
+        self.path = path
+        self._index_interval = index_interval
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            logger.warning(f"Overwriting CAN log {path}")
+        self._log: BinaryIO = open(path, "wb")
+        self._index: BinaryIO = open(index_path(path), "wb")
+        self._log.write(MAGIC)
+        self._num_of_records = 0
+
+    def record(self, msg: CanMessage, direction: Direction, instance: int = 0) -> None:
+        """Append frame to the log.
+
+        Args:
+            msg: The CAN frame.
+            direction: Direction of the frame seen from the firmware.
+            instance: CAN instance of the frame.
+        """
+        data = bytes(msg.data)
+        flags = (
+            (FLAG_EXTENDED_ID if msg.is_extended_id else 0)
+            | (FLAG_REMOTE_FRAME if msg.is_remote_frame else 0)
+            | (FLAG_FD if msg.is_fd else 0)
+        )
+        with self._lock:
+            if self._log.closed:
+                return
+            time_us = vtime_manager.time_us()
+            if self._num_of_records % self._index_interval == 0:
+                self._index.write(INDEX_ENTRY.pack(time_us, self._log.tell()))
+            self._log.write(
+                RECORD.pack(
+                    time_us,
+                    msg.arbitration_id,
+                    instance,
+                    direction,
+                    flags,
+                    msg.dlc,
+                    len(data),
+                )
+                + data
+            )
+            self._num_of_records += 1
+
+    def record_rx(self, msg: CanMessage, instance: int = 0) -> None:
+        """Append frame sent to the firmware to the log."""
+        self.record(msg, Direction.RX, instance)
+
+    def record_tx(self, msg: CanMessage, instance: int = 0) -> None:
+        """Append frame sent by the firmware to the log."""
+        self.record(msg, Direction.TX, instance)
+
+    def close(self) -> None:
+        """Flush and close the log."""
+        with self._lock:
+            self._log.close()
+            self._index.close()
+        logger.info(f"{self._num_of_records} CAN frames recorded to {self.path}")
+
+
+class CanReplayer:
+    """Reader and replayer of CAN logs written by `CanRecorder`."""
+
+    def __init__(self, path: str) -> None:
+        """Open the log.
+
+        Args:
+            path: Path of the log file.
+
+        Raises:
+            ValueError: If the file is not a CAN log.
+        """
+        self.path = path
+        with open(path, "rb") as log:
+            if log.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a CAN log")
+        self._index: List[Tuple[int, int]] = []
+        if os.path.exists(index_path(path)):
+            with open(index_path(path), "rb") as index:
+                self._index = [entry for entry in INDEX_ENTRY.iter_unpack(index.read())]
+
+    def records(
+        self, direction: Optional[Direction] = None, start_us: int = 0
+    ) -> Iterator[CanLogRecord]:
+        """Iterate over recorded frames.
+
+        Args:
+            direction: Only frames of given direction (None - all frames).
+            start_us: Skip frames recorded before this virtual time (index is used to seek).
+
+        Yields:
+            Recorded frames in order of recording.
+        """
+        pos = bisect.bisect_right(self._index, (start_us, -1)) - 1
+        offset = self._index[pos][1] if pos >= 0 else len(MAGIC)
+        with open(self.path, "rb") as log:
+            log.seek(offset)
+            while True:
+                header = log.read(RECORD.size)
+                if len(header) < RECORD.size:
+                    return
+                time_us, arbitration_id, instance, rec_direction, flags, dlc, length = (
+                    RECORD.unpack(header)
+                )
+                data = log.read(length)
+                if time_us < start_us or (
+                    direction is not None and rec_direction != direction
+                ):
+                    continue
+                yield CanLogRecord(
+                    time_us=time_us,
+                    instance=instance,
+                    direction=Direction(rec_direction),
+                    arbitration_id=arbitration_id,
+                    is_extended_id=bool(flags & FLAG_EXTENDED_ID),
+                    data=data,
+                    dlc=dlc,
+                    is_remote_frame=bool(flags & FLAG_REMOTE_FRAME),
+                    is_fd=bool(flags & FLAG_FD),
+                )
+
+    def replay(
+        self,
+        bus: CanBus,
+        direction: Direction = Direction.RX,
+        start_us: int = 0,
+        realtime: bool = True,
+    ) -> int:
+        """Send recorded frames through the bus.
+
+        Frames are sent from the calling worker. With `realtime` set, the worker sleeps (in virtual time)
+        between frames to keep the original spacing; the first frame is sent immediately. The recorded
+        instance is passed to buses addressing several instances (`FlexCanDriver`, `MCANDriver`), other buses
+        (`CanFabricEndpoint`, python-can buses) receive all frames.
+
+        Args:
+            bus: The CAN bus the frames are sent to (e.g. `FlexCanDriver`).
+            direction: Replayed direction, by default the console-side frames sent to the firmware.
+            start_us: Skip frames recorded before this virtual time.
+            realtime: True to keep the original virtual timing, False to send as fast as possible.
+
+        Returns:
+            Number of sent frames.
+        """
+        send = _instance_sender(bus)
+        sent = 0
+        first_us: Optional[int] = None
+        replay_start_us = vtime_manager.time_us()
+        for record in self.records(direction, start_us):
+            if realtime:
+                if first_us is None:
+                    first_us = record.time_us
+                delay_us = (record.time_us - first_us) - (
+                    vtime_manager.time_us() - replay_start_us
+                )
+                if delay_us > 0:
+                    vtime_manager.sleep(delay_us / 1_000_000.0)
+            send(record.to_message(), record.instance)
+            sent += 1
+        return sent
+
+
+def _instance_sender(bus: CanBus) -> Callable[[CanMessage, int], None]:
+    """Return function sending a frame to the bus, passing the instance only if the bus supports it."""
+    if "instance_id" in inspect.signature(bus.send).parameters:
+        return lambda msg, instance: bus.send(msg, instance_id=instance)
+    return lambda msg, _: bus.send(msg)
@@ -0,0 +1,5 @@
+from framework.support.ipc.shm_ring_buffer import ShmRingBuffer
+
+__all__ = [
+    "ShmRingBuffer",
+]
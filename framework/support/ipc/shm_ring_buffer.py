@@ -0,0 +1,129 @@
+import struct
+from multiprocessing import shared_memory
+from typing import Optional
+
+
+class ShmRingBuffer:
+    """Experimental single-producer single-consumer ring buffer in shared memory.
+
+    Intended for passing high-rate records (e.g. interrupt contexts or serialized driver calls) between
+    the simulator and the emulator running on the same host without the network stack. One process creates
+    the buffer, the other one attaches to it by name.
+
+    Memory layout: 16 bytes header with free-running write and read offsets (unsigned 64-bit), followed by
+    the data area. Each record is stored as a 4 bytes length prefix followed by the payload; records wrap
+    around the end of the data area. The writer only updates the write offset and the reader only the read
+    offset, so no lock is required for a single producer and a single consumer.
+    """
+
+    HEADER = struct.Struct("<QQ")
+    RECORD_HEADER = struct.Struct("<I")
+
+    def __init__(
+        self, name: Optional[str] = None, size: int = 1 << 20, create: bool = True
+    ) -> None:
+        """Create or attach to the ring buffer.
+
+        Args:
+            name: Name of the shared memory block (None - generated, only when creating).
+            size: Size of the data area in bytes (ignored when attaching).
+            create: True to create new shared memory block, False to attach to an existing one.
+        """
+        if create:
+            self._shm = shared_memory.SharedMemory(
+                name=name, create=True, size=self.HEADER.size + size
+            )
+            self.HEADER.pack_into(self._shm.buf, 0, 0, 0)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._owner = create
+        self._buf = self._shm.buf
+        self._capacity = self._shm.size - self.HEADER.size
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block used to attach from the other process."""
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        """Size of the data area in bytes."""
+        return self._capacity
+
+    def put(self, data: bytes) -> bool:
+        """Write record into the buffer.
+
+        Args:
+            data: Payload of the record.
+
+        Returns:
+            False if there is not enough free space for the record, True otherwise.
+
+        Raises:
+            ValueError: If the record can never fit into the buffer.
+        """
+        record_size = self.RECORD_HEADER.size + len(data)
+        if record_size > self._capacity:
+            raise ValueError(
+                f"Record of {len(data)} bytes exceeds buffer capacity {self._capacity}."
+            )
+        write_pos, read_pos = self.HEADER.unpack_from(self._buf, 0)
+        if self._capacity - (write_pos - read_pos) < record_size:
+            return False
+        self._write(write_pos, self.RECORD_HEADER.pack(len(data)))
+        self._write(write_pos + self.RECORD_HEADER.size, data)
+        # Publish the record only after its content is written
+        struct.pack_into("<Q", self._buf, 0, write_pos + record_size)
+        return True
+
+    def get(self) -> Optional[bytes]:
+        """Read the oldest record from the buffer.
+
+        Returns:
+            Payload of the record or None if the buffer is empty.
+        """
+        write_pos, read_pos = self.HEADER.unpack_from(self._buf, 0)
+        if write_pos == read_pos:
+            return None
+        (length,) = self.RECORD_HEADER.unpack(
+            self._read(read_pos, self.RECORD_HEADER.size)
+        )
+        data = self._read(read_pos + self.RECORD_HEADER.size, length)
+        struct.pack_into(
+            "<Q", self._buf, 8, read_pos + self.RECORD_HEADER.size + length
+        )
+        return data
+
+    def getsize(self) -> int:
+        """Return number of bytes (including record headers) waiting in the buffer."""
+        write_pos, read_pos = self.HEADER.unpack_from(self._buf, 0)
+        return int(write_pos - read_pos)
+
+    def close(self) -> None:
+        """Detach from the shared memory; the creating side also releases the block."""
+        self._buf = None  # type: ignore
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def _write(self, pos: int, data: bytes) -> None:
+        """Copy data into the data area starting at (wrapped) position."""
+        offset = pos % self._capacity
+        first = min(len(data), self._capacity - offset)
+        start = self.HEADER.size + offset
+        self._buf[start : start + first] = data[:first]
+        if first < len(data):
+            rest = len(data) - first
+            self._buf[self.HEADER.size : self.HEADER.size + rest] = data[first:]
+
+    def _read(self, pos: int, length: int) -> bytes:
+        """Copy data of given length from the data area starting at (wrapped) position."""
+        offset = pos % self._capacity
+        first = min(length, self._capacity - offset)
+        start = self.HEADER.size + offset
+        data = bytes(self._buf[start : start + first])
+        if first < length:
+            data += bytes(
+                self._buf[self.HEADER.size : self.HEADER.size + length - first]
+            )
+        return data
@@ -15,12 +15,18 @@ class SutControl:
         emu_close_req_cb: Callable[[], threading.Event],
         log_file_pathname: str,
         emu_rpc_port: int,
+        emu_rpc_address: str | None = None,
     ) -> None:
         self.cmd_line = emulator_cmd_line
         self.process: subprocess.Popen[Any] | None = None
         self._log_file_pathname = log_file_pathname
         self._emu_close_req_cb = emu_close_req_cb
         self._emu_rpc_port = emu_rpc_port
+        self._emu_rpc_address = (
+            emu_rpc_address
+            if emu_rpc_address is not None
+            else f"localhost:{emu_rpc_port}"
+        )
 
     def start(self) -> None:
         """
@@ -29,7 +35,9 @@ class SutControl:
         Raises:
             RuntimeError: If emulator stopped unexpectedly.
         """
-        logger.info(f"Starting emulator `{self.cmd_line}`, port: {self._emu_rpc_port}.")
+        logger.info(
+            f"Starting emulator `{self.cmd_line}`, address: {self._emu_rpc_address}."
+        )
         cmd_line_list = self.cmd_line.split()
 
         if cmd_line_list[0] == "python":
@@ -37,9 +45,7 @@ class SutControl:
             # use the one from current env
             cmd_line_list[0] = sys.executable
 
-        cmd_line_list.extend(
-            [f"localhost:{self._emu_rpc_port}", f"{self._log_file_pathname}"]
-        )
+        cmd_line_list.extend([self._emu_rpc_address, f"{self._log_file_pathname}"])
 
         self.process = subprocess.Popen(
             cmd_line_list, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
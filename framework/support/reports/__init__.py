@@ -2,14 +2,19 @@ from framework.support.reports import log
 from framework.support.reports.log import (
     logger,
     rpc_call,
+    set_rpc_log_sampling,
     configure_logger_for_script,
     register_virtual_time_func,
 )
+from framework.support.reports.rpc_stats import RpcStatistics, rpc_stats
 
 __all__ = [
     "log",
     "rpc_call",
+    "set_rpc_log_sampling",
     "register_virtual_time_func",
+    "RpcStatistics",
+    "rpc_stats",
     "logger",
     "configure_logger_for_script",
 ]
@@ -1,9 +1,12 @@
 import functools
+import itertools
 import logging
 import sys
 import time
 import traceback
-from typing import Any, Callable, TypeVar, cast
+from typing import Any, Callable, Dict, Iterator, TypeVar, cast
+
+from framework.support.reports.rpc_stats import rpc_stats
 
 
 def add_logging_level(
@@ -118,12 +121,66 @@ def configure_logger_for_script() -> None:
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+__rpc_log_sampling: Dict[str, int] = {}
+__rpc_log_counters: Dict[str, Iterator[int]] = {}
+
+
+def set_rpc_log_sampling(method_name: str, every_n: int) -> None:
+    """Logs only every N-th call of the RPC method decorated with `rpc_call`.
+
+    Intended for noisy services (e.g. `PINS_DRV_QuickReadPin`) whose debug output
+    would otherwise dominate the log and the duration of the call.
+
+    Args:
+        method_name: Name of the RPC method (e.g. `FLEXCAN_DRV_GetReceivedData`).
+        every_n: Log 1 of `every_n` calls; 1 logs every call, 0 disables logging of the method.
+
+    Raises:
+        ValueError: If `every_n` is negative.
+    """
+    if every_n < 0:
+        raise ValueError(f"Invalid RPC log sampling {every_n} for {method_name}.")
+    if every_n == 1:
+        __rpc_log_sampling.pop(method_name, None)
+    else:
+        __rpc_log_sampling[method_name] = every_n
+    __rpc_log_counters[method_name] = itertools.count()
+
+
+class _RpcFields:
+    """Lazily formatted fields of RPC request, converted to string only when the log record is emitted."""
+
+    __slots__ = ("request",)
+
+    def __init__(self, request: Any) -> None:
+        self.request = request
+
+    def __str__(self) -> str:
+        return str(
+            [(desc.name, str(val).strip()) for desc, val in self.request.ListFields()]
+        )
+
+
+def _is_rpc_call_logged(method_name: str) -> bool:
+    """Checks whether the call of RPC method should be logged according to level and sampling."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return False
+    every_n = __rpc_log_sampling.get(method_name)
+    if every_n is None:
+        return True
+    if every_n == 0:
+        return False
+    return next(__rpc_log_counters[method_name]) % every_n == 0
+
 
 def rpc_call(func: F) -> F:
     """Decorator for making a remote procedure call (RPC).
 
     This decorator logs the function name and its arguments, executes the function,
     and handles any exceptions that occur during the function execution.
+    The arguments are formatted only when DEBUG level is enabled and the call is not
+    skipped by sampling (see `set_rpc_log_sampling`). When `rpc_stats` is enabled, the call
+    is recorded there as well.
 
     Args:
         func: The function to be decorated.
@@ -131,6 +188,8 @@ def rpc_call(func: F) -> F:
     Returns:
         The decorated function.
     """
+    method_name = func.__name__
+    stats_name = func.__qualname__
 
     @functools.wraps(func)  # type: ignore
     def wrapper_rpc_call(*args, **kwargs):
@@ -149,8 +208,10 @@ def rpc_call(func: F) -> F:
         Raises:
             Exception: If an error occurs during the function execution.
         """
-        fields = [(desc.name, str(val).strip()) for desc, val in args[1].ListFields()]
-        logger.debug(f"[gRPC]: {func.__name__}: {fields}")
+        if _is_rpc_call_logged(method_name):
+            logger.debug("[gRPC]: %s: %s", method_name, _RpcFields(args[1]))
+        if rpc_stats.enabled:
+            return _call_recorded(stats_name, func, *args, **kwargs)
         try:
             return func(*args, **kwargs)
         except Exception as err:
@@ -161,11 +222,36 @@ def rpc_call(func: F) -> F:
     return cast(F, wrapper_rpc_call)
 
 
+def _call_recorded(
+    name: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Calls RPC function and records its duration in `rpc_stats`."""
+    start_time = time.monotonic_ns()
+    start_vtime = rpc_stats.vtime_us()
+    failed = True
+    try:
+        result = func(*args, **kwargs)
+        failed = False
+        return result
+    except Exception as err:
+        logger.fatal(f"gRPC call failed with: {err}")
+        logger.fatal(traceback.format_exc())
+        raise err
+    finally:
+        rpc_stats.record_call(
+            name,
+            time.monotonic_ns() - start_time,
+            rpc_stats.vtime_us() - start_vtime,
+            failed,
+        )
+
+
 def measure_duration(func: F) -> F:
     """Decorator for measuring the duration of a function call.
 
     This decorator logs the function name, its return value, and the duration of the function execution
     if the duration exceeds 500 microseconds. It also handles any exceptions that occur during the function execution.
+    When `rpc_stats` is enabled, the call is recorded there as well.
 
     Args:
         func: The function to be decorated.
@@ -173,6 +259,7 @@ def measure_duration(func: F) -> F:
     Returns:
         The decorated function.
     """
+    stats_name = func.__qualname__
 
     @functools.wraps(func)  # type: ignore
     def wrapper_func(*args, **kwargs):
@@ -194,9 +281,18 @@ def measure_duration(func: F) -> F:
         """
         try:
             start_time = time.monotonic_ns()
-            result = func(*args, **kwargs)
-            duration = time.monotonic_ns() - start_time
-            if duration > 500_000:  # 500 microseconds
+            if rpc_stats.enabled:
+                start_vtime = rpc_stats.vtime_us()
+                result = func(*args, **kwargs)
+                duration = time.monotonic_ns() - start_time
+                rpc_stats.record_call(
+                    stats_name, duration, rpc_stats.vtime_us() - start_vtime
+                )
+            else:
+                result = func(*args, **kwargs)
+                duration = time.monotonic_ns() - start_time
+            # 500 microseconds
+            if duration > 500_000 and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     f"Function call ({func.__name__} returning {result})took: {duration * 1e-3:.2f} microsecs"
                 )
@@ -0,0 +1,179 @@
+import dataclasses
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _bucket(value: int) -> str:
+    """Returns label of power-of-two histogram bucket the value falls into."""
+    return f"<={1 << max(value - 1, 0).bit_length()}"
+
+
+@dataclasses.dataclass
+class _Histogram:
+    """Count, total, maximum and power-of-two histogram of measured values."""
+
+    count: int = 0
+    total: int = 0
+    max: int = 0
+    buckets: Dict[str, int] = dataclasses.field(default_factory=dict)
+
+    def add(self, value: int) -> None:
+        """Adds measured value."""
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        label = _bucket(value)
+        self.buckets[label] = self.buckets.get(label, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns histogram as JSON serializable dictionary."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0,
+            "max": self.max,
+            "buckets": self.buckets,
+        }
+
+
+@dataclasses.dataclass
+class _CallStatistics:
+    """Statistics of calls of one method."""
+
+    errors: int = 0
+    wall_us: _Histogram = dataclasses.field(default_factory=_Histogram)
+    vtime_us: _Histogram = dataclasses.field(default_factory=_Histogram)
+
+
+class RpcStatistics:
+    """Per-method call counters and latency histograms of RPCs and measured functions.
+
+    Methods decorated with `rpc_call` or `measure_duration` are recorded while the statistics are enabled.
+    Latency is measured in wall-clock time and in virtual time (when a virtual time function is provided);
+    histograms use power-of-two buckets in microseconds. Queue depths (e.g. of the interrupt queue) are
+    recorded as histograms as well.
+
+    Recording is disabled by default, so the decorators only check the `enabled` flag.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._vtime_us_func: Optional[Callable[[], int]] = None
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _CallStatistics] = {}
+        self._queue_depths: Dict[str, _Histogram] = {}
+
+    def enable(self, vtime_us_func: Optional[Callable[[], int]] = None) -> None:
+        """Enables recording.
+
+        Args:
+            vtime_us_func: Function returning current virtual time in microseconds (None - virtual time
+                latency is not recorded).
+        """
+        self._vtime_us_func = vtime_us_func
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Disables recording, already recorded data are kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Removes all recorded data."""
+        with self._lock:
+            self._calls.clear()
+            self._queue_depths.clear()
+
+    def vtime_us(self) -> int:
+        """Returns current virtual time in microseconds (0 if no virtual time function is set)."""
+        return self._vtime_us_func() if self._vtime_us_func is not None else 0
+
+    def record_call(
+        self, name: str, wall_ns: int, vtime_us: int, failed: bool = False
+    ) -> None:
+        """Records one call of a method.
+
+        Args:
+            name: Name of the method.
+            wall_ns: Wall-clock duration of the call in nanoseconds.
+            vtime_us: Virtual time duration of the call in microseconds.
+            failed: True if the call raised an exception.
+        """
+        with self._lock:
+            stats = self._calls.get(name)
+            if stats is None:
+                stats = self._calls[name] = _CallStatistics()
+            stats.wall_us.add(wall_ns // 1000)
+            if self._vtime_us_func is not None:
+                stats.vtime_us.add(vtime_us)
+            if failed:
+                stats.errors += 1
+
+    def record_queue_depth(self, name: str, depth: int) -> None:
+        """Records current depth of a queue.
+
+        Args:
+            name: Name of the queue.
+            depth: Number of items in the queue.
+        """
+        with self._lock:
+            histogram = self._queue_depths.get(name)
+            if histogram is None:
+                histogram = self._queue_depths[name] = _Histogram()
+            histogram.add(depth)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns recorded data as JSON serializable dictionary."""
+        with self._lock:
+            return {
+                "calls": {
+                    name: {
+                        "count": stats.wall_us.count,
+                        "errors": stats.errors,
+                        "wall_us": stats.wall_us.to_dict(),
+                        "vtime_us": stats.vtime_us.to_dict(),
+                    }
+                    for name, stats in self._calls.items()
+                },
+                "queue_depths": {
+                    name: histogram.to_dict()
+                    for name, histogram in self._queue_depths.items()
+                },
+            }
+
+    def dump_json(self, path: str) -> None:
+        """Writes recorded data to JSON file.
+
+        Args:
+            path: Path of the JSON file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def format_table(self, top_n: int = 20) -> List[str]:
+        """Formats methods with the highest total wall-clock time as table.
+
+        Args:
+            top_n: Number of listed methods.
+
+        Returns:
+            Lines of the table.
+        """
+        calls = self.to_dict()["calls"]
+        ordered = sorted(
+            calls.items(), key=lambda item: item[1]["wall_us"]["total"], reverse=True
+        )
+        lines = [
+            f"{'method':<60} {'calls':>9} {'errors':>6} {'total ms':>10} {'mean us':>9} "
+            f"{'max us':>9} {'vtime ms':>10}"
+        ]
+        for name, stats in ordered[:top_n]:
+            wall = stats["wall_us"]
+            lines.append(
+                f"{name:<60} {stats['count']:>9} {stats['errors']:>6} {wall['total'] / 1000:>10.2f} "
+                f"{wall['mean']:>9.1f} {wall['max']:>9} {stats['vtime_us']['total'] / 1000:>10.2f}"
+            )
+        return lines
+
+
+rpc_stats = RpcStatistics()
@@ -9,17 +9,24 @@ from framework.support.vtime.workers import (
     VirtualTimeWorker,
     VirtualTimeThreadPoolExecutor,
     get_worker_manager,
+    idle_worker,
+    join_worker,
 )
-from framework.support.vtime.queue import Queue
+from framework.support.vtime.queue import OverflowPolicy, Queue
+from framework.support.vtime.timer_engine import TimerEngine
 
 __all__ = [
     "VirtualTimeManager",
     "VirtualTimeWorker",
     "VirtualTimeThreadPoolExecutor",
     "get_worker_manager",
+    "idle_worker",
+    "join_worker",
+    "OverflowPolicy",
     "Queue",
     "TimeEvent",
     "TimeOutEvent",
+    "TimerEngine",
     "VirtualTimeManager",
     "VirtualTimeWorker",
     "vtime_manager",
@@ -1,20 +1,40 @@
-from queue import Queue as BaseQueue, Empty
+from enum import Enum
+from queue import Queue as BaseQueue, Empty, Full
 from threading import Lock
-from typing import TypeVar
+from typing import List, TypeVar
 
 from framework.support.reports import logger
-from framework.support.vtime.virtual_time import TimeEvent
-
+from framework.support.vtime.virtual_time import TimeEvent, vtime_manager
 
 _T = TypeVar("_T")
 
 
+class OverflowPolicy(Enum):
+    """Handling of an item put into a full bounded queue."""
+
+    # The oldest item is discarded (like an overrun receive mailbox)
+    DROP_OLDEST = "drop_oldest"
+    # The put item is discarded
+    DROP_NEWEST = "drop_newest"
+    # The put waits for free space (idle in virtual time)
+    BLOCK = "block"
+
+
 class Queue(BaseQueue[_T]):
-    """Queue with virtual vtime support i.e. waiting for data in empty queue leads to idle worker state."""
+    """Queue with virtual vtime support i.e. waiting for data in empty queue leads to idle worker state.
+
+    A bounded queue (`maxsize` > 0) handles a put into the full queue according to its `overflow` policy. Every
+    item dropped, as well as every put which timed out waiting for free space, is counted in `overruns`.
+    """
 
-    def __init__(self, maxsize: int = 0) -> None:
+    def __init__(
+        self, maxsize: int = 0, overflow: OverflowPolicy = OverflowPolicy.BLOCK
+    ) -> None:
         super().__init__(maxsize=maxsize)
+        self.overflow = overflow
+        self.overruns = 0
         self.q_event = TimeEvent()
+        self._space_event = TimeEvent()
         self._read_lock = Lock()
 
     def put(self, item: _T, block: bool = True, timeout: float | None = None) -> None:
@@ -23,14 +43,52 @@ class Queue(BaseQueue[_T]):
 
         Args:
             item: Item to put into the queue.
-            block: If True, block until the item is inserted.
+            block: If True, block until the item is inserted (`OverflowPolicy.BLOCK` only).
             timeout: If block is True, timeout in seconds to wait for the item to be inserted.
+
+        Raises:
+            Full: If the item was not inserted into the full queue with `OverflowPolicy.BLOCK`.
         """
-        if block is True:
-            super().put(item, block, timeout=timeout)
-            self.q_event.set()
-        else:
-            super().put(item, block, timeout)
+        end_time_us = (
+            None if timeout is None else vtime_manager.time_us() + int(timeout * 1e6)
+        )
+        while True:
+            with self.mutex:
+                if self.maxsize <= 0 or self._qsize() < self.maxsize:
+                    self._put(item)
+                    self.unfinished_tasks += 1
+                    self.not_empty.notify()
+                    break
+                if self.overflow is OverflowPolicy.DROP_OLDEST:
+                    self._get()
+                    self.overruns += 1
+                    self._put(item)
+                    logger.debug(f"Queue full ({self.maxsize}), oldest item dropped")
+                    break
+                if self.overflow is OverflowPolicy.DROP_NEWEST:
+                    self.overruns += 1
+                    logger.debug(f"Queue full ({self.maxsize}), item dropped")
+                    return
+                if not block:
+                    self.overruns += 1
+                    raise Full()
+                self._space_event.clear()
+                # Space freed by another put's retry doesn't restart the timeout, only the rest is waited for
+                remaining = (
+                    None
+                    if end_time_us is None
+                    else (end_time_us - vtime_manager.time_us()) / 1e6
+                )
+                if remaining is not None and remaining <= 0:
+                    self.overruns += 1
+                    logger.debug(f"Putting data into queue timeout ({timeout})")
+                    raise Full()
+            if self._space_event.wait(remaining) is False:
+                with self.mutex:
+                    self.overruns += 1
+                logger.debug(f"Putting data into queue timeout ({timeout})")
+                raise Full()
+        self.q_event.set()
 
     def put_nowait(self, item: _T) -> None:
         """
@@ -39,8 +97,7 @@ class Queue(BaseQueue[_T]):
         Args:
             item: Item to put into the queue.
         """
-        super().put_nowait(item)
-        self.q_event.set()
+        self.put(item, block=False)
 
     def get(self, block: bool = True, timeout: float | None = None) -> _T:
         """
@@ -60,3 +117,31 @@ class Queue(BaseQueue[_T]):
                 val = super().get_nowait()
                 return val
         return super().get(block=block, timeout=timeout)
+
+    def _get(self) -> _T:
+        """Remove the oldest item (the mutex has to be held) and wake up a waiting put."""
+        item = super()._get()
+        if self.maxsize > 0:
+            self._space_event.set()
+        return item
+
+    def get_batch(
+        self, max_items: int = 0, block: bool = True, timeout: float | None = None
+    ) -> List[_T]:
+        """
+        Remove and return all items available in the queue.
+
+        Waits for the first item the same way as `get`, all other items already stored in the queue
+        are then removed in one locked operation.
+
+        Args:
+            max_items: Maximum number of returned items (0 - no limit).
+            block: If True, block until an item is available.
+            timeout: If block is True, timeout in seconds to wait for the item to be available.
+        """
+        items = [self.get(block=block, timeout=timeout)]
+        with self.mutex:
+            while self._qsize() and (max_items <= 0 or len(items) < max_items):
+                items.append(self._get())
+            self.not_full.notify_all()
+        return items
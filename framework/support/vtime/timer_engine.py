@@ -0,0 +1,186 @@
+import dataclasses
+import heapq
+import itertools
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from framework.support.reports import logger
+from framework.support.vtime.virtual_time import TimeEvent, vtime_manager
+from framework.support.vtime.workers import VirtualTimeWorker, join_worker
+
+
+@dataclasses.dataclass(eq=False)
+class _PeriodicTimer:
+    """Periodic timer scheduled by `TimerEngine`."""
+
+    period_us: Callable[[], int]
+    callback: Callable[[], None]
+    due_us: int
+    active: bool = True
+
+
+class TimerEngine:
+    """Discrete-event engine running all periodic timers on a single virtual time worker.
+
+    Hardware timers (LPIT timers, PIT/eMIOS channels, FTM channels, RTC) normally spawn a `VirtualTimeWorker`
+    each. When a `TimerEngine` is passed to them, their timeouts are executed as callbacks of the engine's
+    worker instead. The worker waits for the earliest wake-up time of all registered timers, so the virtual
+    clock is advanced directly to the next timer expiration.
+
+    The worker is started with the first added timer and finishes when the last timer is removed.
+
+    In fast-forward mode the worker does not go idle between timeouts as long as nothing else is active and no other
+    worker waits for an earlier time. The clock is moved directly from one expiration to the next one and callbacks
+    are executed in one run, so consecutive timeouts whose callbacks wake up nobody (e.g. masked or disabled
+    interrupts, simulator-side housekeeping) cost no thread wake-ups. Interrupts are not synthesized in bulk: once a
+    callback activates another worker (e.g. raised interrupt wakes up the emulator), the engine waits as usual, so
+    timers raising interrupts are stepped one expiration at a time as without fast-forward.
+    """
+
+    def __init__(self, fast_forward: bool = False) -> None:
+        self.fast_forward = fast_forward
+        self._timers: Dict[int, _PeriodicTimer] = {}
+        self._schedule: List[Tuple[int, int, _PeriodicTimer]] = []
+        self._timer_ids = itertools.count(1)
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._schedule_changed = TimeEvent()
+        self._worker: Optional[threading.Thread] = None
+
+    def add_timer(
+        self,
+        period_us: Callable[[], int],
+        callback: Callable[[], None],
+        delay_us: Optional[int] = None,
+    ) -> int:
+        """Add periodic timer.
+
+        Args:
+            period_us: Function returning period of the timer in microseconds. It is evaluated each time
+                the timer is rescheduled, so period changes are applied from the next timeout. A timer whose
+                period is not positive is not rescheduled (it never expires again, like a timer worker waiting
+                for such period).
+            callback: Function called on each timeout.
+            delay_us: Delay of the first timeout in microseconds, 0 for immediate timeout (None - one period).
+
+        Returns:
+            ID of the timer used for its removal.
+        """
+        with self._lock:
+            timer_id = next(self._timer_ids)
+            if delay_us is None:
+                delay_us = period_us()
+                if delay_us <= 0:
+                    # Not positive period - the timer never expires
+                    delay_us = -1
+            timer = _PeriodicTimer(
+                period_us=period_us,
+                callback=callback,
+                due_us=vtime_manager.time_us() + delay_us,
+            )
+            self._timers[timer_id] = timer
+            if delay_us < 0:
+                return timer_id
+            heapq.heappush(self._schedule, (timer.due_us, next(self._sequence), timer))
+            if self._worker is None:
+                self._worker = VirtualTimeWorker(
+                    target=self._run, daemon=True, name="TimerEngine"
+                )
+                self._worker.start()
+        self._schedule_changed.set()
+        return timer_id
+
+    def remove_timer(self, timer_id: int) -> None:
+        """Remove periodic timer.
+
+        Args:
+            timer_id: ID of the timer returned by `add_timer`.
+        """
+        with self._lock:
+            timer = self._timers.pop(timer_id, None)
+            if timer is None:
+                logger.debug(f"Timer {timer_id} is not scheduled in timer engine.")
+                return
+            timer.active = False
+        self._schedule_changed.set()
+
+    def get_num_of_timers(self) -> int:
+        """Return number of scheduled timers."""
+        return len(self._timers)
+
+    def stop(self) -> None:
+        """Remove all timers and wait for the engine's worker to finish.
+
+        A virtual time worker calling this is idle while waiting, so callbacks in progress which wait in virtual
+        time can complete.
+        """
+        with self._lock:
+            for timer in self._timers.values():
+                timer.active = False
+            self._timers.clear()
+            worker = self._worker
+        self._schedule_changed.set()
+        if worker is not None and worker is not threading.current_thread():
+            join_worker(worker)
+
+    def _run(self) -> None:
+        """Wait for the earliest timer expiration and execute callbacks of all expired timers."""
+        try:
+            while True:
+                with self._lock:
+                    while self._schedule and not self._is_scheduled(*self._schedule[0]):
+                        heapq.heappop(self._schedule)
+                    if not self._schedule:
+                        self._worker = None
+                        logger.debug("Timer engine stopped.")
+                        return
+                    due_us = self._schedule[0][0]
+                    self._schedule_changed.clear()
+
+                delay_us = due_us - vtime_manager.time_us()
+                if (
+                    delay_us > 0
+                    and not (self.fast_forward and vtime_manager.fast_forward(due_us))
+                    and self._schedule_changed.wait(delay_us / 1_000_000.0)
+                ):
+                    # Timer added or removed - recalculate the earliest expiration
+                    continue
+                self._fire_expired_timers()
+        except BaseException:
+            with self._lock:
+                self._worker = None
+            raise
+
+    def _fire_expired_timers(self) -> None:
+        """Reschedule all expired timers and execute their callbacks."""
+        now_us = vtime_manager.time_us()
+        expired: List[_PeriodicTimer] = []
+        with self._lock:
+            while self._schedule and self._schedule[0][0] <= now_us:
+                entry = heapq.heappop(self._schedule)
+                if not self._is_scheduled(*entry):
+                    continue
+                timer = entry[2]
+                period_us = timer.period_us()
+                if period_us > 0:
+                    timer.due_us = now_us + period_us
+                    heapq.heappush(
+                        self._schedule, (timer.due_us, next(self._sequence), timer)
+                    )
+                else:
+                    # Not positive period - the timer is kept but never expires again
+                    timer.due_us = -1
+                expired.append(timer)
+
+        for timer in expired:
+            if timer.active:
+                try:
+                    timer.callback()
+                except Exception:  # pylint: disable=broad-except
+                    # One failing timer must not stop the worker shared by all timers
+                    logger.exception("Timer engine callback failed.")
+
+    @staticmethod
+    def _is_scheduled(due_us: int, _: int, timer: _PeriodicTimer) -> bool:
+        """Check whether heap entry is valid i.e. timer was not removed or rescheduled meanwhile."""
+        return timer.active and timer.due_us == due_us
@@ -1,5 +1,7 @@
+import heapq
+import itertools
 import threading
-from typing import List
+from typing import List, Set, Tuple
 
 from framework.support.reports import logger
 from framework.support.vtime.workers import get_worker_manager, VirtualTimeWorker
@@ -88,8 +90,10 @@ class VirtualTimeManager:
     - Clock is increased as much as possible (doest not need to be 1). This is ensured by knowing timeout
     of each worker(thread). The step is `min(timeouts of all workers)`.
 
-    This VirtualTimeManager implementation uses list of `TimeOutEvent` objects. Each `TimeOutEvent` (if not set)
-    represents an idle worker and has timeout property.
+    This VirtualTimeManager implementation uses a heap of `TimeOutEvent` objects keyed by their wake-up time.
+    Each `TimeOutEvent` (if not set) represents an idle worker and has timeout property. Cancelled events are not
+    removed from the heap immediately (lazy deletion) - they are only dropped from the set of pending events and
+    skipped once they reach the top of the heap.
 
     Method `_idle_reached` is called from `WorkersManager` when all threads (which are expected to be affected
     by virtual vtime) are in idle state.
@@ -97,7 +101,9 @@ class VirtualTimeManager:
 
     def __init__(self) -> None:
         self._clock_us = 0
-        self._time_events: List[TimeOutEvent] = []
+        self._time_events: List[Tuple[int, int, TimeOutEvent]] = []
+        self._pending_events: Set[TimeOutEvent] = set()
+        self._sequence = itertools.count()
         get_worker_manager().register_idle_observer(self._idle_reached)
         self._events_lock = threading.Lock()
 
@@ -105,57 +111,104 @@ class VirtualTimeManager:
         """
         Handles the situation when the emulator is in an IDLE state awaiting interrupts.
 
-        This method is called when all threads are in an idle state. It updates the list of TimeOutEvents,
-        calculates the minimum wake-up time from all wake-up times in the waiting TimeEvents, and updates the clock.
-        It also updates all TimeEvents for which the wake-up time is reached and cancels the event.
+        This method is called when all threads are in an idle state. It drops cancelled and already set events
+        from the top of the heap, moves the clock to the earliest wake-up time and expires all TimeOutEvents
+        for which the wake-up time is reached.
 
         This method is part of the internal workings of the VirtualTimeManager and is not intended to be used directly.
         """
-        # Step is minimum from all wake-up vtime in waiting TimeEvents and `max_step_ms` argument
+        expired_events: List[TimeOutEvent] = []
         with self._events_lock:
-            self._time_events = [
-                event for event in self._time_events if not event.is_set()
-            ]
-        if self._time_events:
-            wakeup_times = [
-                event.wake_up_time
-                for event in self._time_events
-                if event.wake_up_time is not None
-            ]
-            if any(wakeup_times):
-                self._clock_us = min(wakeup_times)
-
-                # Update all TimeEvents for which wake-up vtime is reached
-                for event in set(self._time_events):
-                    if event.wake_up_time == self._clock_us:
-                        event.expire()
-                        self.cancel_event(event)
+            self._drop_stale_events()
+            if not self._time_events:
+                return
+
+            # Step is the earliest wake-up time of all waiting TimeEvents
+            self._clock_us = self._time_events[0][0]
+
+            # Collect all TimeEvents for which wake-up vtime is reached
+            while self._time_events and self._time_events[0][0] == self._clock_us:
+                _, _, event = heapq.heappop(self._time_events)
+                if event in self._pending_events and not event.is_set():
+                    expired_events.append(event)
+                self._pending_events.discard(event)
+
+        for event in expired_events:
+            event.expire()
+
+    def _drop_stale_events(self) -> None:
+        """Pop cancelled or already set events from the top of the heap. Must be called with `_events_lock` held."""
+        while self._time_events:
+            event = self._time_events[0][2]
+            if event in self._pending_events and not event.is_set():
+                return
+            heapq.heappop(self._time_events)
+            self._pending_events.discard(event)
 
     def get_timeout_event(self, timeout_s: float | None) -> TimeOutEvent:
         """Creates and returns a TimeOutEvent object.
 
-        This object is included in list of timeouts used for calculation
+        This object is included in heap of timeouts used for calculation
         of next clock step.
         """
         wake_up_time = int(self._clock_us + (timeout_s * 1e6)) if timeout_s else None
         timeout = TimeOutEvent(wake_up_time=wake_up_time)
         with self._events_lock:
-            self._time_events.append(timeout)
+            self._pending_events.add(timeout)
+            if wake_up_time is not None:
+                heapq.heappush(
+                    self._time_events, (wake_up_time, next(self._sequence), timeout)
+                )
         return timeout
 
     def cancel_event(self, event: TimeOutEvent) -> None:
-        """Cancel timeout event (e.g. when awaiting data and data were generated by different worker)."""
-        try:
-            with self._events_lock:
-                self._time_events.remove(event)
-        except ValueError:
-            pass
+        """Cancel timeout event (e.g. when awaiting data and data were generated by different worker).
+
+        The event stays in the heap until it reaches its top, where it is dropped as not pending anymore. To keep
+        memory bounded, the heap is compacted when cancelled entries dominate it.
+        """
+        with self._events_lock:
+            self._pending_events.discard(event)
+            if len(self._time_events) > 2 * len(self._pending_events) + 64:
+                self._time_events = [
+                    entry
+                    for entry in self._time_events
+                    if entry[2] in self._pending_events
+                ]
+                heapq.heapify(self._time_events)
 
     def timeout_all_events(self) -> None:
         """Raise timeout for all events to allow all workers to continue (e.g. when cleaning up)."""
-        for event in self._time_events:
+        with self._events_lock:
+            events = list(self._pending_events)
+            self._pending_events.clear()
+        for event in events:
             event.expire()
 
+    def fast_forward(self, wake_up_time: int) -> bool:
+        """Move the clock forward without the calling worker going idle.
+
+        Moving the clock is allowed only if the calling worker is the only active worker and no other worker waits
+        for an earlier wake-up time, i.e. the same clock value would be reached by `_idle_reached` if the worker
+        went idle. Used to skip idle windows without waking up the worker (see `TimerEngine`).
+
+        Args:
+            wake_up_time: Requested clock value in microseconds.
+
+        Returns:
+            True if the clock was moved (or has already reached the value), False otherwise.
+        """
+        workers = get_worker_manager()
+        with workers.lock:
+            if not workers.is_only_active_worker(VirtualTimeWorker.current_worker()):
+                return False
+            with self._events_lock:
+                self._drop_stale_events()
+                if self._time_events and self._time_events[0][0] < wake_up_time:
+                    return False
+                self._clock_us = max(self._clock_us, wake_up_time)
+        return True
+
     def sleep(self, secs: float) -> None:
         """Sleep for defined virtual milliseconds."""
         event = self.get_timeout_event(secs)
@@ -1,8 +1,10 @@
+import contextlib
 import functools
+import logging
 import threading
 import concurrent.futures
 from concurrent.futures import Future
-from typing import TypeAlias, List, Callable, Any, TypeVar, ParamSpec
+from typing import TypeAlias, Set, Callable, Any, TypeVar, ParamSpec, Iterator
 
 from framework.support.reports import logger
 
@@ -69,13 +71,15 @@ class WorkersManager:
     """
     Manages workers which are virtual-vtime related.
 
-    It stores list of all workers and list of all idle workers.
-    In case all workers are in idle state then VirtualTimeManager is notified.
+    It stores set of all workers and set of idle workers together with number of active workers.
+    In case all workers are in idle state (i.e. number of active workers drops to zero) then VirtualTimeManager
+    is notified.
     """
 
     def __init__(self) -> None:
-        self._idle_workers: List[WorkerId] = []
-        self._all_workers: List[WorkerId] = []
+        self._idle_workers: Set[WorkerId] = set()
+        self._all_workers: Set[WorkerId] = set()
+        self._num_active_workers = 0
         self.all_idle = threading.Event()
         self._update_idle: Callable[[], None] | None = None
         self._idle_lock = threading.RLock()
@@ -96,9 +100,11 @@ class WorkersManager:
         Args:
             worker_id: ID of worker to register.
         """
-        logger.debug(f"Registering worker {worker_id}")
-        assert worker_id not in self._all_workers
-        self._all_workers.append(worker_id)
+        logger.debug("Registering worker %s", worker_id)
+        with self._idle_lock:
+            assert worker_id not in self._all_workers
+            self._all_workers.add(worker_id)
+            self._num_active_workers += 1
 
     def unregister_worker(self, worker_id: WorkerId) -> None:
         """
@@ -107,12 +113,15 @@ class WorkersManager:
         Args:
             worker_id: ID of worker to unregister.
         """
-        logger.debug(f"Unregistering worker {worker_id}")
-        if worker_id in self._all_workers:
-            self._all_workers.remove(worker_id)
-        if worker_id in self._idle_workers:
-            self._idle_workers.remove(worker_id)
-        self._check_idle()
+        logger.debug("Unregistering worker %s", worker_id)
+        with self._idle_lock:
+            if worker_id in self._all_workers:
+                self._all_workers.remove(worker_id)
+                if worker_id in self._idle_workers:
+                    self._idle_workers.remove(worker_id)
+                else:
+                    self._num_active_workers -= 1
+            self._check_idle()
 
     def go_idle(self, worker_id: WorkerId) -> None:
         """
@@ -121,15 +130,16 @@ class WorkersManager:
         Args:
             worker_id: ID of worker which is idle.
         """
-        logger.debug(
-            f"Worker {worker_id} idle ({set(self._all_workers) - set(self._idle_workers)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Worker {worker_id} idle ({self._all_workers - self._idle_workers}"
+            )
         assert worker_id in self._all_workers
         with self._idle_lock:
-            self._idle_workers.append(worker_id)
-            logger.debug("appended")
+            if worker_id not in self._idle_workers:
+                self._idle_workers.add(worker_id)
+                self._num_active_workers -= 1
             self._check_idle()
-            logger.debug("checked")
 
     def go_active(self, worker_id: WorkerId) -> None:
         """
@@ -138,25 +148,54 @@ class WorkersManager:
         Args:
             worker_id: ID of worker which is active.
         """
-        logger.debug(f"Worker {worker_id} active")
-        if worker_id in self._idle_workers:
-            self._idle_workers.remove(worker_id)
+        logger.debug("Worker %s active", worker_id)
+        with self._idle_lock:
+            if worker_id in self._idle_workers:
+                self._idle_workers.remove(worker_id)
+                self._num_active_workers += 1
 
     def _check_idle(self) -> None:
         """
         Check if all workers are idle and notify VirtualTimeManager.
 
-        If all workers are idle then VirtualTimeManager is notified.
+        If all workers are idle then VirtualTimeManager is notified. Must be called with `_idle_lock` held.
         """
-        if set(self._idle_workers) == set(self._all_workers):
+        if self._num_active_workers == 0:
             if self._update_idle:
                 logger.debug("All workers are idle")
                 self._update_idle()
 
+    def is_registered(self, worker_id: WorkerId) -> bool:
+        """
+        Check whether the worker is registered.
+
+        Args:
+            worker_id: ID of worker to check.
+        """
+        return worker_id in self._all_workers
+
     def get_num_of_workers(self) -> int:
         """Return number of registered workers."""
         return len(self._all_workers)
 
+    def get_num_of_active_workers(self) -> int:
+        """Return number of registered workers which are not idle."""
+        return self._num_active_workers
+
+    def is_only_active_worker(self, worker_id: WorkerId) -> bool:
+        """
+        Check whether the worker is the only active one. Must be called with `lock` held to get stable result.
+
+        Args:
+            worker_id: ID of worker to check.
+        """
+        return self._num_active_workers == 1 and worker_id not in self._idle_workers
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock guarding worker states. Idle observer is called with this lock held."""
+        return self._idle_lock
+
 
 _worker_manager = WorkersManager()
 
@@ -168,6 +207,39 @@ def get_worker_manager() -> WorkersManager:
     return _worker_manager
 
 
+@contextlib.contextmanager
+def idle_worker() -> Iterator[None]:
+    """
+    Keep the calling virtual time worker idle while blocked outside of virtual time.
+
+    The caller can block on a thread primitive (join, `threading.Event`) while other workers wait in virtual
+    time. Callers which are not registered workers are not affected.
+    """
+    workers = get_worker_manager()
+    caller = VirtualTimeWorker.current_worker()
+    if not workers.is_registered(caller):
+        yield
+        return
+    workers.go_idle(caller)
+    try:
+        yield
+    finally:
+        workers.go_active(caller)
+
+
+def join_worker(thread: threading.Thread) -> None:
+    """
+    Wait for the thread to finish.
+
+    A virtual time worker calling this is idle while waiting, so the joined thread can wait in virtual time.
+
+    Args:
+        thread: Thread to wait for.
+    """
+    with idle_worker():
+        thread.join()
+
+
 class VirtualTimeThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
     """
     ThreadPoolExecutor which notifies `WorkersManager` when a task is submitted for execution.
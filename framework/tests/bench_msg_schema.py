@@ -0,0 +1,97 @@
+"""
+Microbenchmark of footswitch message codecs.
+
+Compares the compiled message schemas with decoding by format strings on every call (the previous
+implementation of the message classes). Run with `python -m framework.tests.bench_msg_schema`.
+"""
+
+import struct
+import timeit
+
+import bitstruct
+
+from framework.communications.uvcs_footswitch.msg_types.aux_data_types import (
+    BatteryStatus1,
+    ErrorFlags,
+)
+from framework.communications.uvcs_footswitch.msg_types.configuration_msg import (
+    ConfigurationMsg310,
+)
+from framework.communications.uvcs_footswitch.msg_types.fault_msgs import Fault010
+from framework.communications.uvcs_footswitch.msg_types.real_time_status_msgs import (
+    StatusMsg210,
+)
+
+STATUS_210 = struct.pack(">BBBcHcB", 2, 1, 7, b"\x05", 0x1234, b"\x03", 0)
+FAULT_010 = bitstruct.pack("u5u3u4u4u8u8u16u16", 1, 2, 0, 5, 7, 4, 300, 0xABCD)
+AUX_DATA = b"\x81\x10\x05\x5a"
+
+
+def format_string_status_210() -> tuple:
+    values = struct.unpack(">BBBcHcB", STATUS_210)
+    buttons = tuple(reversed(bitstruct.unpack("<b1b1b1b1b1b1b1b1", values[3])))
+    laser_buttons = tuple(reversed(bitstruct.unpack("p3b1b1b1b1b1", values[5])))
+    return values, buttons, laser_buttons
+
+
+def compiled_status_210() -> tuple:
+    message = StatusMsg210.unpack(STATUS_210)
+    return message.treadle_count, message.buttons, message.laser_buttons
+
+
+def format_string_fault_010() -> tuple:
+    return tuple(bitstruct.unpack("u5u3u4u4u8u8u16u16", FAULT_010))
+
+
+def format_string_error_flags() -> list:
+    byte_4 = list(bitstruct.unpack("b1b1b1b1b1b1b1b1", AUX_DATA[0:1]))
+    byte_5 = list(bitstruct.unpack("b1b1b1b1b1b1b1b1", AUX_DATA[1:2]))
+    byte_6 = list(bitstruct.unpack("p3b1b1b1b1b1", AUX_DATA[2:3]))
+    byte_4.reverse()
+    byte_5.reverse()
+    byte_6.reverse()
+    return byte_4 + byte_5 + byte_6
+
+
+def format_string_battery_status_1() -> tuple:
+    return tuple(bitstruct.unpack("b1u7b1b1b1b1b1b1b1b1u8u8", AUX_DATA))
+
+
+def format_string_config_310() -> bytes:
+    byte6 = bitstruct.pack(">p5u2b1", 1, True)
+    return struct.pack("BBBBhsB", 255, 1, 10, 0, 0, byte6, 1)
+
+
+CASES = {
+    "StatusMsg210.unpack": (format_string_status_210, compiled_status_210),
+    "Fault010.unpack": (format_string_fault_010, lambda: Fault010.unpack(FAULT_010)),
+    "ErrorFlags.unpack": (
+        format_string_error_flags,
+        lambda: ErrorFlags.unpack(AUX_DATA),
+    ),
+    "BatteryStatus1.unpack": (
+        format_string_battery_status_1,
+        lambda: BatteryStatus1.unpack(AUX_DATA),
+    ),
+    "ConfigurationMsg310.pack": (
+        format_string_config_310,
+        ConfigurationMsg310().pack,
+    ),
+}
+
+
+def main(number: int = 20_000) -> None:
+    print(f"{'codec':<26} {'format str us':>14} {'compiled us':>12} {'speedup':>8}")
+    for name, (format_string, compiled) in CASES.items():
+        format_string_us = min(timeit.repeat(format_string, number=number, repeat=3))
+        compiled_us = min(timeit.repeat(compiled, number=number, repeat=3))
+        format_string_us *= 1_000_000 / number
+        compiled_us *= 1_000_000 / number
+        print(
+            f"{name:<26} {format_string_us:>14.2f} {compiled_us:>12.2f} "
+            f"{format_string_us / compiled_us:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
+from typing import Any, Callable, List, TypeVar
+
 import pytest
 
 from framework.support.reports import log
-from framework.support.vtime import vtime_manager
+from framework.support.vtime import VirtualTimeWorker, vtime_manager
+
+T = TypeVar("T")
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -10,3 +14,29 @@ def fixture_virtual_time() -> None:
     Fixture for virtual time.
     """
     log.register_virtual_time_func(vtime_manager.time_ms)
+
+
+@pytest.fixture
+def run_in_worker() -> Callable[[Callable[[], Any]], Any]:
+    """
+    Fixture running a function in a virtual time worker, its result is returned and its exception re-raised.
+    """
+
+    def _run_in_worker(func: Callable[[], T]) -> T:
+        results: List[T] = []
+        errors: List[BaseException] = []
+
+        def _target() -> None:
+            try:
+                results.append(func())
+            except BaseException as err:  # pylint: disable=broad-except
+                errors.append(err)
+
+        worker = VirtualTimeWorker(target=_target)
+        worker.start()
+        worker.join()
+        if errors:
+            raise errors[0]
+        return results[0]
+
+    return _run_in_worker
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from framework.core.boards.fsw.hw_board import HwBoard
+from framework.hardware_interfaces.drivers.common.adc_bank import AdcBank
+from framework.hardware_interfaces.drivers.s32k148.adc_driver import AdcDriver
+
+VREF_MV = 5000
+MAX_COUNTS = 4095
+IRQ_ID = 39
+
+
+def _bank_counts(use_numpy: bool) -> list[int]:
+    """Counts of a bank with channels exercising multiplier, gain, offset, noise and clipping."""
+    bank = AdcBank(VREF_MV, MAX_COUNTS, seed=1, use_numpy=use_numpy)
+    bank.add_channel(voltage=2.5)
+    bank.add_channel(voltage=24.0, multiplier=0.1)
+    bank.add_channel(voltage=1.0, gain=1.1, offset=-10)
+    bank.add_channel(voltage=6.0)
+    bank.add_channel(voltage=0.0, offset=-5)
+    bank.add_channel(voltage=1.0, vref_mv=0)
+    bank.add_channel(voltage=2.5, noise=3)
+    return bank.counts()
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_bank_counts(use_numpy: bool) -> None:
+    """
+    Test conversion of voltages of all channels in one step.
+    """
+    if use_numpy:
+        pytest.importorskip("numpy")
+    counts = _bank_counts(use_numpy)
+
+    assert counts[:6] == [2047, 1965, 890, MAX_COUNTS, 0, 0]
+    assert 2044 <= counts[6] <= 2050
+
+
+def test_driver_channels_share_bank() -> None:
+    """
+    Test that channels of an instance are converted and updated together.
+    """
+    raise_interrupt = MagicMock()
+    adc_driver = AdcDriver(raise_interrupt)
+    for channel_id in (2, 3):
+        channel = adc_driver.get_channel(1, channel_id)
+        channel.initialize(VREF_MV, MAX_COUNTS, IRQ_ID)
+        channel.multiplier = 0.5
+    adc_driver.get_channel(1, 7).initialize(VREF_MV, MAX_COUNTS, 0)
+
+    adc_driver.set_voltages(1, {2: 4.0, 3: 2.0, 7: 1.25})
+
+    assert adc_driver.get_counts(1) == {2: 1638, 3: 819, 7: 1023}
+    assert adc_driver.get_channel(1, 3).counts == 819
+    assert raise_interrupt.call_args_list == [
+        call(IRQ_ID, 2 << 24 | 1 << 16 | 1638),
+        call(IRQ_ID, 3 << 24 | 1 << 16 | 819),
+    ]
+    assert adc_driver.get_counts(0) == {}
+
+
+def test_board_on_uninitialized_driver() -> None:
+    """
+    Test that voltages are set on channels not yet initialized by the firmware, counts follow initialization.
+    """
+    raise_interrupt = MagicMock()
+    adc_driver = AdcDriver(raise_interrupt)
+
+    board = HwBoard(adc_driver, MagicMock())
+
+    assert board.board_id.voltage == 1.13
+    raise_interrupt.assert_not_called()
+    board.board_id.initialize(VREF_MV, MAX_COUNTS, IRQ_ID)
+    assert board.board_id.counts == 925
+    board.board_id.voltage = 2.5
+    raise_interrupt.assert_called_once_with(IRQ_ID, 6 << 24 | 1 << 16 | 2047)
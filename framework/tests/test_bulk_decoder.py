@@ -0,0 +1,77 @@
+import struct
+
+import bitstruct
+import pytest
+
+from framework.communications.uvcs_footswitch.bulk_decoder import BulkDecoder
+from framework.communications.uvcs_footswitch.msg_types.aux_data_types import (
+    AuxDataType,
+    BatteryStatus1,
+    BatteryStatus3,
+)
+from framework.communications.uvcs_footswitch.msg_types.fault_msgs import Fault010
+from framework.communications.uvcs_footswitch.msg_types.real_time_status_msgs import (
+    StatusMsg210,
+    StatusMsg211,
+)
+
+
+def capture() -> tuple[list[int], list[int], list[bytes]]:
+    """
+    Create capture of treadle sweep interleaved with aux data and fault frames.
+    """
+    ids, timestamps, payloads = [], [], []
+    for index in range(100):
+        ids.append(0x210)
+        timestamps.append(index * 10)
+        payloads.append(
+            struct.pack(">BBBcHcB", 2, 2, index, b"\x01", index * 3, b"\x00", 0)
+        )
+        ids.append(0x211)
+        timestamps.append(index * 10 + 5)
+        if index % 2:
+            aux_data = struct.pack(">Hh", 8000 + index, -index)
+            payloads.append(bytes([0, 0, 0, AuxDataType.BatteryStatus3]) + aux_data)
+        else:
+            aux_data = bitstruct.pack(
+                "b1u7b1b1b1b1b1b1b1b1u8u8", 1, 50, *[0] * 8, 30, 95
+            )
+            payloads.append(bytes([0, 0, 0, AuxDataType.BatteryStatus1]) + aux_data)
+    ids.append(0x010)
+    timestamps.append(1000)
+    payloads.append(bitstruct.pack("u5u3u4u4u8u8u16u16", 1, 2, 0, 5, 7, 4, 300, 1))
+    return ids, timestamps, payloads
+
+
+def test_bulk_decode_lists() -> None:
+    """
+    Test decoding of a capture into columns of lists.
+    """
+    columns = BulkDecoder(use_numpy=False).decode(*capture())
+
+    treadle_count = columns[StatusMsg210]["treadle_count"]
+    assert len(treadle_count) == 100
+    assert all(a < b for a, b in zip(treadle_count, treadle_count[1:]))
+    assert columns[StatusMsg210]["timestamp"][-1] == 990
+    assert columns[StatusMsg211]["aux_type"][:2] == [
+        AuxDataType.BatteryStatus1,
+        AuxDataType.BatteryStatus3,
+    ]
+    assert columns[BatteryStatus3]["voltage"][0] == 8001
+    assert columns[BatteryStatus3]["average_current"][0] == -1
+    assert columns[BatteryStatus1]["level"] == [50] * 50
+    assert columns[Fault010]["file_line_no"] == [300]
+
+
+def test_bulk_decode_numpy() -> None:
+    """
+    Test decoding of a capture into NumPy structured arrays matches decoding into lists.
+    """
+    pytest.importorskip("numpy")
+    frames = capture()
+    arrays = BulkDecoder(use_numpy=True).decode(*frames)
+    lists = BulkDecoder(use_numpy=False).decode(*frames)
+
+    for message_cls, columns in lists.items():
+        for name, values in columns.items():
+            assert arrays[message_cls][name].tolist() == values
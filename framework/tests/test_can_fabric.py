@@ -0,0 +1,142 @@
+"""CAN fabric tests."""
+
+from typing import Callable
+
+from pytest_mock import MockFixture
+
+from framework.hardware_interfaces.drivers import get_can_bus_drv
+from framework.hardware_interfaces.drivers.common.can_fabric import (
+    CanFabric,
+    arbitration_key,
+    frame_bits,
+)
+from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
+    CanMessage,
+)
+from framework.hardware_interfaces.protoc.common.flexcan_driver_pb2 import (
+    FCGetReceivedDataParams,
+    FCIrqFlags,
+    FCMsgIdType,
+    FCSendParams,
+)
+from framework.support.vtime import vtime_manager
+from framework.tests.test_flexcan import setup_flexcan_drv
+
+
+def test_frame_priority_and_size() -> None:
+    """Verify arbitration order and frame size of standard and extended frames."""
+    standard = CanMessage(arbitration_id=0x100, data=bytes(8), is_extended_id=False)
+    extended = CanMessage(arbitration_id=0x100 << 18, data=bytes(2))
+    low = CanMessage(arbitration_id=0x101, is_extended_id=False)
+
+    assert sorted([low, extended, standard], key=arbitration_key) == [
+        standard,
+        extended,
+        low,
+    ]
+    assert frame_bits(standard) == 111
+    assert frame_bits(extended) == 83
+
+
+def test_fabric_connects_driver_and_endpoints(
+    mocker: MockFixture, run_in_worker: Callable
+) -> None:
+    """Verify routing through acceptance filters, priority ordering and bus load accounting."""
+    interrupt_callback = mocker.MagicMock()
+    canbus = get_can_bus_drv(interrupt_callback)
+    setup_flexcan_drv(canbus, 0, 1, -1, msg_id=0x310)
+
+    def _scenario() -> None:
+        with CanFabric(bitrate=500_000, timed=True) as fabric:
+            fabric.attach(canbus)
+            console = fabric.endpoint("console")
+            monitor = fabric.endpoint(
+                "monitor", can_filters=[{"can_id": 0x210, "can_mask": 0x7FF}]
+            )
+            start_us = vtime_manager.time_us()
+
+            console.send(CanMessage(arbitration_id=0x310, data=bytes([1, 2])))
+            assert monitor.recv(timeout=0.01) is None
+            interrupt_callback.assert_called_once_with(
+                -1, (1 << 16) | FCIrqFlags.FCIrqFlags_RX_COMPLETE
+            )
+            data = canbus.FLEXCAN_DRV_GetReceivedData(
+                FCGetReceivedDataParams(instance_id=0, mb_idx=1), None
+            )
+            assert data.msg_id == 0x310 and data.mb_data == bytes([1, 2])
+
+            for msg_id in (0x7FF, 0x300, 0x210):
+                canbus.FLEXCAN_DRV_Send(
+                    FCSendParams(
+                        instance_id=0,
+                        mb_idx=2,
+                        msg_id_type=FCMsgIdType.FCMsgIdType_STD,
+                        msg_id=msg_id,
+                        mb_data=bytes(8),
+                    ),
+                    None,
+                )
+            received = [console.recv(timeout=0.01).arbitration_id for _ in range(3)]
+            # The first frame may win the idle bus, the others are arbitrated by priority
+            assert received in ([0x7FF, 0x210, 0x300], [0x210, 0x300, 0x7FF])
+            assert monitor.recv(timeout=0.01).arbitration_id == 0x210
+            assert monitor.recv(timeout=0.01) is None
+            assert canbus.get_instance(0).in_msgs.empty()
+
+            assert fabric.transmitted_frames == 4
+            assert (
+                fabric.transmitted_bits == 83 + 3 * 111
+            )  # extended 0x310, standard frames
+            vtime_manager.sleep((start_us + 100_000 - vtime_manager.time_us()) / 1e6)
+            assert fabric.bits_per_second() == fabric.transmitted_bits * 10
+            assert fabric.bus_load() == fabric.bits_per_second() / 500_000
+
+    run_in_worker(_scenario)
+    assert not canbus.fabric_ports
+
+
+def test_stop_with_unread_mailbox(mocker: MockFixture, run_in_worker: Callable) -> None:
+    """Verify that the fabric stops while a frame waits for the firmware to read the mailbox."""
+    interrupt_callback = mocker.MagicMock()
+    canbus = get_can_bus_drv(interrupt_callback)
+    setup_flexcan_drv(canbus, 0, 1, -1, msg_id=0x310)
+
+    def _scenario() -> None:
+        fabric = CanFabric(timed=True)
+        port = fabric.attach(canbus, delivery_timeout=0.05)
+        console = fabric.endpoint("console")
+        for data in (b"\x01", b"\x02", b"\x03"):
+            console.send(CanMessage(arbitration_id=0x310, data=data))
+        # The firmware requested read of the first frame only, the second one waits in the port's worker
+        vtime_manager.sleep(0.01)
+        assert interrupt_callback.call_count == 1
+
+        fabric.stop()
+        # The port's worker finishes once delivery of the frame times out
+        vtime_manager.sleep(0.1)
+        port._worker.join(timeout=1)
+        assert not port._worker.is_alive()
+
+    run_in_worker(_scenario)
+    assert not canbus.fabric_ports
+
+
+def test_endpoint_overrun(run_in_worker: Callable) -> None:
+    """Verify that a full endpoint drops its oldest frames and counts them."""
+
+    def _scenario() -> None:
+        with CanFabric() as fabric:
+            console = fabric.endpoint("console")
+            monitor = fabric.endpoint("monitor", rx_queue_size=2)
+            for msg_id in (0x100, 0x101, 0x102):
+                console.send(CanMessage(arbitration_id=msg_id))
+            vtime_manager.sleep(0.01)
+
+            assert monitor.overruns == 1
+            assert [monitor.recv(timeout=0.01).arbitration_id for _ in range(2)] == [
+                0x101,
+                0x102,
+            ]
+            assert monitor.recv(timeout=0.01) is None
+
+    run_in_worker(_scenario)
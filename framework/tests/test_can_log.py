@@ -0,0 +1,124 @@
+"""CAN recorder and replayer tests."""
+
+from typing import Any, List, Optional, Tuple
+
+from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
+    CanMessage,
+)
+from framework.support.can_log import CanRecorder, CanReplayer, Direction
+from framework.support.vtime import VirtualTimeWorker, vtime_manager
+
+
+class _Bus:
+    """CAN bus collecting sent frames with virtual time of sending."""
+
+    def __init__(self) -> None:
+        self.sent: List[Tuple[int, int, int]] = []
+
+    def send(self, msg: CanMessage, instance_id: int = 0) -> None:
+        """Collect frame."""
+        self.sent.append((vtime_manager.time_us(), msg.arbitration_id, instance_id))
+
+
+def _record(path: str) -> int:
+    """Record frames in both directions 1 ms apart, return virtual time of the first frame."""
+    recorder = CanRecorder(path, index_interval=2)
+    start_us = vtime_manager.time_us()
+    for i in range(6):
+        direction = Direction.RX if i % 2 == 0 else Direction.TX
+        recorder.record(
+            CanMessage(arbitration_id=0x300 + i, data=bytes([i] * i)), direction, 1
+        )
+        vtime_manager.sleep(0.001)
+    recorder.close()
+    return start_us
+
+
+def test_record_and_read(tmp_path: Any) -> None:
+    """Verify that recorded frames are read back including seek by virtual time."""
+    path = str(tmp_path / "traffic.canlog")
+    result: List[int] = []
+    worker = VirtualTimeWorker(target=lambda: result.append(_record(path)))
+    worker.start()
+    worker.join()
+    start_us = result[0]
+
+    replayer = CanReplayer(path)
+    records = list(replayer.records())
+    assert [r.arbitration_id for r in records] == [0x300 + i for i in range(6)]
+    assert records[3].data == bytes([3] * 3)
+    assert records[3].direction == Direction.TX
+    assert records[5].time_us - records[0].time_us == 5_000
+
+    later = list(replayer.records(Direction.RX, start_us=start_us + 3_000))
+    assert [r.arbitration_id for r in later] == [0x304]
+
+
+def test_replay_keeps_virtual_timing(tmp_path: Any) -> None:
+    """Verify that console-side frames are replayed with their original spacing."""
+    path = str(tmp_path / "traffic.canlog")
+    worker = VirtualTimeWorker(target=lambda: _record(path))
+    worker.start()
+    worker.join()
+
+    bus = _Bus()
+    worker = VirtualTimeWorker(target=lambda: CanReplayer(path).replay(bus))  # type: ignore
+    worker.start()
+    worker.join()
+
+    first_us = bus.sent[0][0]
+    assert bus.sent == [
+        (first_us, 0x300, 1),
+        (first_us + 2_000, 0x302, 1),
+        (first_us + 4_000, 0x304, 1),
+    ]
+
+    fast_bus = _Bus()
+    assert CanReplayer(path).replay(fast_bus, realtime=False) == 3  # type: ignore
+    assert len({time_us for time_us, _, _ in fast_bus.sent}) == 1
+
+
+def test_recording_overwrites_log(tmp_path: Any) -> None:
+    """Verify that a new recording replaces the previous one, keeping the index monotonic."""
+    path = str(tmp_path / "traffic.canlog")
+    for _ in range(2):
+        worker = VirtualTimeWorker(target=lambda: _record(path))
+        worker.start()
+        worker.join()
+
+    replayer = CanReplayer(path)
+    records = list(replayer.records())
+    assert [r.arbitration_id for r in records] == [0x300 + i for i in range(6)]
+    later = list(replayer.records(start_us=records[4].time_us))
+    assert [r.arbitration_id for r in later] == [0x304, 0x305]
+
+
+class _PlainBus:
+    """CAN bus without instances (like `CanFabricEndpoint` or python-can buses) collecting sent frames."""
+
+    def __init__(self) -> None:
+        self.sent: List[CanMessage] = []
+
+    def send(self, msg: CanMessage, timeout: Optional[float] = None) -> None:
+        """Collect frame."""
+        self.sent.append(msg)
+
+
+def test_replay_keeps_frame_flags(tmp_path: Any) -> None:
+    """Verify that DLC and remote flag are recorded and frames are replayed to a bus without instances."""
+    path = str(tmp_path / "traffic.canlog")
+    recorder = CanRecorder(path)
+    recorder.record_rx(CanMessage(arbitration_id=0x310, is_remote_frame=True, dlc=8), 1)
+    recorder.record_rx(CanMessage(arbitration_id=0x311, data=bytes([1, 2])), 1)
+    recorder.close()
+
+    remote, data = CanReplayer(path).records()
+    assert (remote.is_remote_frame, remote.dlc, remote.data) == (True, 8, b"")
+    assert (data.is_remote_frame, data.dlc, data.data) == (False, 2, bytes([1, 2]))
+
+    bus = _PlainBus()
+    assert CanReplayer(path).replay(bus, realtime=False) == 2  # type: ignore
+    assert [(msg.arbitration_id, msg.is_remote_frame, msg.dlc) for msg in bus.sent] == [
+        (0x310, True, 8),
+        (0x311, False, 2),
+    ]
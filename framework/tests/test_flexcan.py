@@ -1,5 +1,7 @@
+from typing import Callable
 from unittest.mock import call
 
+import pytest
 from pytest_mock import MockFixture
 
 from framework.communications.uvcs_footswitch.msg_types.real_time_status_msgs import (
@@ -18,9 +20,16 @@ from framework.hardware_interfaces.protoc.common.flexcan_driver_pb2 import (
 from framework.communications.uvcs_footswitch.msg_types.configuration_msg import (
     ConfigurationMsg310,
 )
-from framework.communications.uvcs_console.wired.wiredconn import WiredConn
+from framework.communications.uvcs_console.wired.wiredconn import (
+    CanMsgTimeoutError,
+    WiredConn,
+)
 from framework.hardware_interfaces.drivers import get_can_bus_drv
+from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
+    CanMessage,
+)
 from framework.hardware_interfaces.drivers.common.flexcan_driver import FlexCanDriver
+from framework.support.vtime import vtime_manager
 
 
 def setup_flexcan_drv(
@@ -171,7 +180,7 @@ def test_more_buffers_filter_read(mocker: MockFixture) -> None:
     assert data.mb_data == config_msg.pack()
 
 
-def test_transfer_data_write(mocker: MockFixture) -> None:
+def test_transfer_data_write(mocker: MockFixture, run_in_worker: Callable) -> None:
     """
     Test the transfer of data to the CAN bus.
     """
@@ -197,5 +206,137 @@ def test_transfer_data_write(mocker: MockFixture) -> None:
     )
 
     wired = WiredConn(canbus)
-    msg = wired.await_message(StatusMsg210)
+    msg = run_in_worker(lambda: wired.await_message(StatusMsg210))
     print(msg)
+
+
+def test_await_message_timeout(mocker: MockFixture, run_in_worker: Callable) -> None:
+    """
+    Test that awaiting a message on a silent bus raises once the timeout expires in virtual time.
+    """
+    canbus = get_can_bus_drv(mocker.MagicMock())
+    setup_flexcan_drv(canbus, 0, 1, -1)
+    wired = WiredConn(canbus)
+
+    def _await() -> None:
+        start_us = vtime_manager.time_us()
+        with pytest.raises(CanMsgTimeoutError):
+            wired.await_message(StatusMsg210, timeout=0.05)
+        assert vtime_manager.time_us() - start_us == 50_000
+        with pytest.raises(CanMsgTimeoutError):
+            wired.await_message(StatusMsg210, timeout=0)
+        assert vtime_manager.time_us() - start_us == 50_000
+
+    run_in_worker(_await)
+
+
+def test_masked_buffer_filter_read(mocker: MockFixture) -> None:
+    """
+    Test that individual mask set by FLEXCAN_DRV_SetRxIndividualMask is applied when routing messages.
+    """
+    interrupt_callback = mocker.MagicMock()
+    irq_id = -1
+    instance_id = 0
+
+    canbus = get_can_bus_drv(interrupt_callback)
+    canbus.FLEXCAN_DRV_Init(
+        FCInitParams(instance_id=instance_id, irq_id=irq_id, max_num_mb=255), None
+    )
+    # Mailbox 1 accepts 0x310-0x31F, mailbox 2 accepts only 0x210
+    canbus.FLEXCAN_DRV_SetRxIndividualMask(
+        FCSetRxIndMaskParams(instance_id=instance_id, mb_idx=1, mask=0x7F0), None
+    )
+    canbus.FLEXCAN_DRV_ConfigRxMb(
+        FCConfigRxMbParams(instance_id=instance_id, mb_idx=1, msg_id=0x31A), None
+    )
+    setup_flexcan_drv(canbus, instance_id, 2, irq_id, msg_id=0x210)
+    canbus.FLEXCAN_DRV_ReceiveReq(
+        FCReceiveReqParams(instance_id=instance_id, mb_idx=1), None
+    )
+
+    wired = WiredConn(canbus)
+    config_msg = ConfigurationMsg310()
+    wired.send_config(config_msg)
+
+    interrupt_callback.assert_called_once_with(
+        irq_id, (1 << 16) | FCIrqFlags.FCIrqFlags_RX_COMPLETE
+    )
+    data = canbus.FLEXCAN_DRV_GetReceivedData(
+        FCGetReceivedDataParams(instance_id=instance_id, mb_idx=1), None
+    )
+    assert data.msg_id == 0x310
+    assert canbus.get_instance(instance_id).rx_filter.match(0x210) == (2,)
+    assert canbus.get_instance(instance_id).rx_filter.match(0x320) == ()
+
+
+def test_pipelined_transmit(mocker: MockFixture) -> None:
+    """
+    Test that queued frames are delivered one by one as the firmware requests read of the mailbox.
+    """
+    interrupt_callback = mocker.MagicMock()
+    mb_idx = 1
+    irq_id = -1
+    instance_id = 0
+    rx_complete = (mb_idx << 16) | FCIrqFlags.FCIrqFlags_RX_COMPLETE
+
+    canbus = get_can_bus_drv(interrupt_callback, pipelined_tx=True)
+    setup_flexcan_drv(canbus, instance_id, mb_idx, irq_id)
+
+    delivered = []
+    futures = [
+        canbus.send_nowait(
+            CanMessage(arbitration_id=0x310, data=bytes([i])),
+            callback=lambda i=i: delivered.append(i),  # type: ignore
+        )
+        for i in range(3)
+    ]
+    # Read was already requested during setup - the first frame is delivered immediately
+    assert delivered == [0]
+    assert interrupt_callback.call_count == 1
+    assert not futures[1].done()
+
+    for i in range(3):
+        data = canbus.FLEXCAN_DRV_GetReceivedData(
+            FCGetReceivedDataParams(instance_id=instance_id, mb_idx=mb_idx), None
+        )
+        assert data.mb_data == bytes([i])
+        canbus.FLEXCAN_DRV_ReceiveReq(
+            FCReceiveReqParams(instance_id=instance_id, mb_idx=mb_idx), None
+        )
+
+    assert delivered == [0, 1, 2]
+    assert all(future.done() for future in futures)
+    interrupt_callback.assert_has_calls([call(irq_id, rx_complete)] * 3)
+    assert canbus.flush_tx(instance_id, timeout=0.001)
+
+
+def test_bounded_queues_count_overruns(mocker: MockFixture) -> None:
+    """
+    Test that frames sent by the firmware and frames put into a full mailbox overwrite the oldest frames.
+    """
+    canbus = FlexCanDriver(mocker.MagicMock(), rx_depth=2, mailbox_depth=1)
+    setup_flexcan_drv(canbus, 0, 1, -1)
+    instance = canbus.get_instance(0)
+
+    for msg_id in (0x210, 0x211, 0x212):
+        canbus.FLEXCAN_DRV_Send(
+            FCSendParams(
+                instance_id=0,
+                mb_idx=2,
+                msg_id_type=FCMsgIdType.FCMsgIdType_STD,
+                msg_id=msg_id,
+                mb_data=bytes(8),
+            ),
+            None,
+        )
+    assert instance.rx_overruns == 1
+    assert [canbus.recv(0.001).arbitration_id for _ in range(2)] == [0x211, 0x212]
+
+    buffer = instance.out_buffers[1]
+    buffer.put(CanMessage(arbitration_id=0x310, data=bytes([1])))
+    buffer.put(CanMessage(arbitration_id=0x310, data=bytes([2])))
+    assert instance.mailbox_overruns == {1: 1}
+    data = canbus.FLEXCAN_DRV_GetReceivedData(
+        FCGetReceivedDataParams(instance_id=0, mb_idx=1), None
+    )
+    assert data.mb_data == bytes([2])
@@ -0,0 +1,86 @@
+import struct
+
+import pytest
+
+from framework.communications.uvcs_footswitch.msg_types.aux_data_types import (
+    AuxDataType,
+    FootSwitchSwVersion,
+)
+from framework.communications.uvcs_footswitch.msg_types.msg_data_structures import (
+    Buttons,
+    FootSwitchState,
+    FootSwitchType,
+    LaserButtons,
+)
+from framework.communications.uvcs_footswitch.msg_types.real_time_status_msgs import (
+    StatusMsg210,
+    StatusMsg211,
+    StatusMsg212,
+)
+
+
+def test_status_msg_210_unpack() -> None:
+    """
+    Test Status Message 210 decodes fields on access and equals message created from values.
+    """
+    data = struct.pack(">BBBcHcB", 2, 1, 7, b"\x05", 0x1234, b"\x03", 0)
+    message = StatusMsg210.unpack(data)
+    assert "treadle_count" not in vars(message)
+    assert message.treadle_count == 0x1234
+    assert "buttons" not in vars(message)
+    assert message == StatusMsg210(
+        foot_switch_type=FootSwitchType.UvcsCombined,
+        foot_switch_state=FootSwitchState.Cradled,
+        tx_counter=7,
+        buttons=Buttons.unpack(b"\x05"),
+        treadle_count=0x1234,
+        laser_buttons=LaserButtons.unpack(b"\x03"),
+    )
+    assert repr(message).startswith("StatusMsg210(foot_switch_type=")
+
+
+def test_status_msg_211_unpack() -> None:
+    """
+    Test Status Message 211 decodes aux data on access.
+    """
+    data = bytes([0, 0, 0, AuxDataType.FootSwitchSwVersion, 0x12, 0x34, 0x56, 0])
+    message = StatusMsg211.unpack(data)
+    assert message.aux_type == AuxDataType.FootSwitchSwVersion
+    assert message.data == FootSwitchSwVersion.unpack(data[4:])
+
+
+def test_status_msg_212_unpack() -> None:
+    """
+    Test Status Message 212 unpack.
+    """
+    data = struct.pack("<BBBHBBB", 5, 1, 3, 0xBEEF, 0, 0, 0)
+    message = StatusMsg212.unpack(data)
+    assert message == StatusMsg212(5, 1, FootSwitchType.UvcsAnterior, 0xBEEF)
+
+
+def test_status_msg_fields_validated() -> None:
+    """
+    Test messages created from field values reject unknown, duplicate and missing fields.
+    """
+    with pytest.raises(TypeError, match="unexpected keyword argument 'sesion_id'"):
+        StatusMsg212(5, 1, FootSwitchType.UvcsAnterior, sesion_id=0xBEEF)
+    with pytest.raises(TypeError, match="multiple values"):
+        StatusMsg212(5, 1, FootSwitchType.UvcsAnterior, 0xBEEF, session_id=1)
+    with pytest.raises(TypeError, match="missing arguments: session_id"):
+        StatusMsg212(5, 1, FootSwitchType.UvcsAnterior)
+    with pytest.raises(TypeError, match="positional arguments"):
+        StatusMsg212(5, 1, FootSwitchType.UvcsAnterior, 0xBEEF, 0)
+
+
+def test_status_msg_unpack_rejects_invalid_frames() -> None:
+    """
+    Test that frames of wrong size or with invalid enum values are rejected when unpacked.
+    """
+    with pytest.raises(ValueError):
+        StatusMsg210.unpack(bytes([99, 0, 0, 0, 0, 5, 0, 0]))
+    with pytest.raises(struct.error):
+        StatusMsg211.unpack(b"\x00\x00")
+    with pytest.raises(ValueError):
+        StatusMsg211.unpack(bytes([0, 0, 0, 0xEE, 0, 0, 0, 0]))
+    with pytest.raises(struct.error):
+        StatusMsg212.unpack(bytes(3))
@@ -0,0 +1,131 @@
+"""! @brief Simulator's gRPC server configuration tests."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List
+
+import grpc
+import pytest
+
+from framework.hardware_interfaces.drivers.common.connect import Connect
+from framework.hardware_interfaces.protoc.common import connect_pb2
+from framework.hardware_interfaces.protoc.common.connect_pb2_grpc import (
+    ConnectStub,
+    add_ConnectServicer_to_server,
+)
+from framework.simulators.grpc_server import GrpcServerConfig, create_grpc_server
+from framework.support.vtime import get_worker_manager
+
+
+class _BlockingConnect(Connect):
+    """! Connect service blocking each handshake until all expected calls are handled concurrently."""
+
+    def __init__(self, parties: int) -> None:
+        super().__init__()
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.num_of_workers: List[int] = []
+
+    def HandShake(
+        self, request: connect_pb2.HandShakeRequest, context: Any
+    ) -> connect_pb2.HandShakeReply:
+        """! Record number of registered workers and wait for other calls."""
+        self.num_of_workers.append(get_worker_manager().get_num_of_workers())
+        self.barrier.wait()
+        return super().HandShake(request, context)
+
+
+@pytest.fixture
+def connect_stub_factory() -> Iterator[Any]:
+    """! Start a server with given configuration and return a Connect stub."""
+    servers: List[grpc.Server] = []
+
+    def _create(config: GrpcServerConfig, servicer: Connect) -> ConnectStub:
+        server = create_grpc_server(config)
+        add_ConnectServicer_to_server(servicer, server)  # type: ignore
+        if config.unix_socket_path is not None:
+            address = f"unix:{config.unix_socket_path}"
+            server.add_insecure_port(address)
+        else:
+            address = f"localhost:{server.add_insecure_port('localhost:0')}"
+        server.start()
+        servers.append(server)
+        return ConnectStub(grpc.insecure_channel(address))
+
+    yield _create
+    for server in servers:
+        server.stop(None)
+
+
+def test_channel_options() -> None:
+    """! Verify that gRPC channel options are generated from configuration."""
+    config = GrpcServerConfig(
+        max_message_length=1024,
+        keepalive_time_ms=100,
+        options=[("grpc.so_reuseport", 0)],
+    )
+    assert config.channel_options() == [
+        ("grpc.so_reuseport", 0),
+        ("grpc.max_receive_message_length", 1024),
+        ("grpc.max_send_message_length", 1024),
+        ("grpc.keepalive_time_ms", 100),
+    ]
+
+
+def test_concurrent_calls_are_registered_workers(connect_stub_factory: Any) -> None:
+    """! Verify that concurrently handled RPCs are registered as virtual time workers."""
+    servicer = _BlockingConnect(parties=2)
+    stub = connect_stub_factory(GrpcServerConfig(max_workers=2), servicer)
+    workers_before = get_worker_manager().get_num_of_workers()
+
+    with ThreadPoolExecutor(max_workers=2) as client:
+        replies = [
+            client.submit(stub.HandShake, connect_pb2.HandShakeRequest(message="emu"))
+            for _ in range(2)
+        ]
+        assert all(reply.result(timeout=5).message for reply in replies)
+
+    assert all(count > workers_before for count in servicer.num_of_workers)
+    assert get_worker_manager().get_num_of_workers() == workers_before
+
+
+def test_service_concurrency_limit(connect_stub_factory: Any) -> None:
+    """! Verify that calls of a service are serialized when its concurrency is limited to one."""
+    servicer = _BlockingConnect(parties=1)
+    active_calls: List[int] = []
+    lock = threading.Lock()
+    max_active = [0]
+    handshake = servicer.HandShake
+
+    def _counting_handshake(request: Any, context: Any) -> Any:
+        with lock:
+            active_calls.append(1)
+            max_active[0] = max(max_active[0], len(active_calls))
+        try:
+            return handshake(request, context)
+        finally:
+            with lock:
+                active_calls.pop()
+
+    servicer.HandShake = _counting_handshake  # type: ignore
+    stub = connect_stub_factory(
+        GrpcServerConfig(max_workers=4, service_concurrency={"rpc_general.Connect": 1}),
+        servicer,
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as client:
+        replies = [
+            client.submit(stub.HandShake, connect_pb2.HandShakeRequest(message="emu"))
+            for _ in range(8)
+        ]
+        assert all(reply.result(timeout=5).message for reply in replies)
+
+    assert max_active[0] == 1
+
+
+def test_unix_domain_socket_transport(connect_stub_factory: Any, tmp_path: Any) -> None:
+    """! Verify that the server is reachable over Unix domain socket."""
+    config = GrpcServerConfig(unix_socket_path=os.path.join(tmp_path, "rpc.sock"))
+    stub = connect_stub_factory(config, Connect())
+    reply = stub.HandShake(connect_pb2.HandShakeRequest(message="emu"), timeout=5)
+    assert reply.message
@@ -1,10 +1,18 @@
+import queue
 from concurrent.futures import ThreadPoolExecutor
 from typing import Iterator, List
 
+import grpc
 import pytest
 from pytest_check import check
 
 from framework.hardware_interfaces.drivers.common.interrupts import Interrupts, IrqId
+from framework.hardware_interfaces.protoc.common.interrupts_pb2 import IdleContext
+from framework.hardware_interfaces.protoc.common.interrupts_pb2_grpc import (
+    InterruptsStub,
+    add_InterruptsServicer_to_server,
+)
+from framework.simulators.grpc_server import GrpcServerConfig, create_grpc_server
 from framework.support.reports import logger
 from framework.support.vtime import (
     VirtualTimeThreadPoolExecutor,
@@ -145,3 +153,63 @@ def test_check_interrupts_queue_size(
 
         is_interrupt_queue_empty = irq_mgr.getsize()
         assert is_interrupt_queue_empty == 0, "Interrupt queue is not empty!"
+
+
+def test_wait_for_interrupt_batch(irq_mgr: Interrupts) -> None:
+    """! Verify that all scheduled interrupts are returned in one batch, limited by `max_batch_size`.
+
+    @param irq_mgr  The Interrupts class object
+    """
+    interrupts = [IrqId.HardFault_IRQn, IrqId.BusFault_IRQn, IrqId.SVCall_IRQn]
+    with ThreadPoolExecutor(max_workers=1) as emulator_executor:
+        for interrupt in interrupts:
+            irq_mgr.raise_interrupt(interrupt, flags=int(-interrupt))
+        batch = emulator_executor.submit(
+            irq_mgr.WaitForInterrupt, IdleContext(idle_cycles=0), None
+        ).result()
+        assert [ctx.irq_id for ctx in batch.queue] == interrupts
+        assert [ctx.irq_flags for ctx in batch.queue] == [-irq for irq in interrupts]
+        assert len({ctx.time for ctx in batch.queue}) == 1
+
+        for interrupt in interrupts:
+            irq_mgr.raise_interrupt(interrupt)
+        batch = emulator_executor.submit(
+            irq_mgr.WaitForInterrupt, IdleContext(idle_cycles=0, max_batch_size=2), None
+        ).result()
+        assert [ctx.irq_id for ctx in batch.queue] == interrupts[:2]
+        assert irq_mgr.getsize() == 1
+        batch = emulator_executor.submit(
+            irq_mgr.WaitForInterrupt, IdleContext(idle_cycles=0, max_batch_size=2), None
+        ).result()
+        assert [ctx.irq_id for ctx in batch.queue] == interrupts[2:]
+        assert irq_mgr.getsize() == 0
+
+
+def test_interrupt_stream(irq_mgr: Interrupts) -> None:
+    """! Verify that interrupts are pushed on the stream for each reported idle cycle.
+
+    @param irq_mgr  The Interrupts class object
+    """
+    server = create_grpc_server(GrpcServerConfig(max_workers=2))
+    add_InterruptsServicer_to_server(irq_mgr, server)  # type: ignore
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+
+    idle_cycles: queue.Queue[IdleContext | None] = queue.Queue()
+    try:
+        with grpc.insecure_channel(f"localhost:{port}") as channel:
+            responses = InterruptsStub(channel).InterruptStream(
+                iter(idle_cycles.get, None)
+            )
+            for interrupts in (
+                [IrqId.HardFault_IRQn],
+                [IrqId.BusFault_IRQn, IrqId.SVCall_IRQn],
+            ):
+                for interrupt in interrupts:
+                    irq_mgr.raise_interrupt(interrupt)
+                idle_cycles.put(IdleContext(idle_cycles=0))
+                assert [ctx.irq_id for ctx in next(responses).queue] == interrupts
+            idle_cycles.put(None)
+            assert list(responses) == []
+    finally:
+        server.stop(None)
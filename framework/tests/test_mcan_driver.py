@@ -11,6 +11,7 @@ from framework.hardware_interfaces.protoc.mpc5777c.mpc5777c_mcan_driver_pb2 impo
     MCMsgIdType,
     MCInitParams,
     MCSendParams,
+    MCSetRxFifoFiletrMaskParams,
 )
 from framework.hardware_interfaces.protoc.common.common_pb2 import StatusEnum
 
@@ -171,3 +172,19 @@ def test_mcan_driver_wait_for_initialization(
     mock_logger.assert_called_with(
         f"Wait for {mcan_driver.__class__.__name__} initialization"
     )
+
+
+def test_rx_fifo_filter_mask_accepts_all(mcan_driver: MCANDriver) -> None:
+    """Test that setting the RX FIFO filter mask keeps the FIFO accepting all message IDs.
+
+    The firmware configures ID and mask of the FIFO filter, the simulated FIFO does not filter by them.
+    """
+    mcan_driver.MCAN_DRV_Init(MCInitParams(instance_id=1, irq_id=5), None)
+    mcan_driver.MCAN_DRV_SetRxFifoFilterMask(
+        MCSetRxFifoFiletrMaskParams(instance_id=1, fl_idx=0, id=0x123, mask=0x7FF),
+        None,
+    )
+
+    instance = mcan_driver.get_instance(1)
+    assert instance.rx_filter.match(0x123) == (0,)
+    assert instance.rx_filter.match(0x456) == (0,)
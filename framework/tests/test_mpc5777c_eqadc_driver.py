@@ -1,4 +1,5 @@
 """! @Brief Test for MPC5777C EQADC driver."""
+
 #
 # @file test_mpc5777c_eqadc_driver.py
 #
@@ -32,7 +33,7 @@
 # Copyright (c) 2024 Alcon & GlobalLogic. All rights reserved.
 
 import pytest
-from unittest.mock import MagicMock, patch, Mock
+from unittest.mock import MagicMock, patch, Mock, call
 from framework.hardware_interfaces.drivers.mpc5777c.mpc5777c_eqadc_driver import (
     BaseEqAdcDevice,
     EqAdcDriver,
@@ -149,3 +150,37 @@ class TestEqAdcDriver:
         self.driver._initialize_device(self.init_params)
         self.driver.EQADC_DRV_CC_SamplesRequest(request_params, context=None)
         assert self.interrupt_mock.called
+
+    def test_eqadc_drv_cc_samples_request_batched(self) -> None:
+        """! The test checks that samples of all requested channels complete together."""
+        self.driver._initialize_device(self.init_params)
+        device = self.driver.devices[1]
+        device.set_channel(1, voltage=1.0, noise=0)
+        device.set_channel(2, voltage=4.0, noise=0)
+        request_params = EqAdcCCSamplesRequestParams(
+            instance_id=1, channel_id=[1, 2, 3]
+        )
+        self.driver.EQADC_DRV_CC_SamplesRequest(request_params, context=None)
+
+        assert device.last_samples[1] == 51
+        assert device.last_samples[2] == 204
+        assert 0 <= device.last_samples[3] <= 255
+        assert self.interrupt_mock.call_args_list[:2] == [
+            call(5, 1 | 1 << 2 | 1 << 24 | 1 << 16 | 51 << 8),
+            call(5, 1 | 2 << 2 | 1 << 24 | 2 << 16 | 204 << 8),
+        ]
+        assert self.interrupt_mock.call_count == 3
+
+    def test_eqadc_drv_cc_samples_request_repeated_channel(self) -> None:
+        """! The test checks that samples of a repeated channel complete each, also while pins are held."""
+        self.driver._initialize_device(self.init_params)
+        self.driver.devices[1].set_channel(3, voltage=1.0, noise=0)
+        request_params = EqAdcCCSamplesRequestParams(instance_id=1, channel_id=[3, 3])
+        self.driver.interrupt_batch.hold()
+        self.driver.EQADC_DRV_CC_SamplesRequest(request_params, context=None)
+
+        assert self.interrupt_mock.call_args_list == [
+            call(5, 1 | 3 << 2 | 1 << 24 | 3 << 16 | 51 << 8),
+            call(5, 1 | 3 << 2 | 1 << 24 | 3 << 16 | 51 << 8),
+        ]
+        self.driver.interrupt_batch.release()
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from framework.core.devices.mram_mr25h10 import MRAM_SIZE, Commands, MramMr25h10
+
+RECORD = bytes(range(64))
+
+
+def _write_command(addr: int, data: bytes) -> bytes:
+    """SPI frame of the write command."""
+    return bytes([Commands.WRITE, addr >> 16, (addr >> 8) & 0xFF, addr & 0xFF]) + data
+
+
+def _read_command(addr: int) -> bytes:
+    """SPI frame of the read command."""
+    return bytes([Commands.READ, addr >> 16, (addr >> 8) & 0xFF, addr & 0xFF, 0])
+
+
+def test_spi_read_write() -> None:
+    """
+    Test reading and writing the memory by SPI commands.
+    """
+    mram = MramMr25h10(instance_id=2, address=0)
+
+    mram.write(_write_command(0x400, RECORD))
+    mram.write(_read_command(0x400))
+    assert mram.read(4 + len(RECORD)) == bytes(4) + bytes([0xFF] * len(RECORD))
+
+    mram.write(bytes([Commands.WRITE_EN]))
+    mram.write(_write_command(0x400, RECORD))
+    mram.write(_read_command(0x400))
+    assert mram.read(4 + len(RECORD)) == bytes(4) + RECORD
+    assert mram.read_memory(0x410, 4) == RECORD[0x10:0x14]
+
+    with pytest.raises(IndexError):
+        mram.write_to_memory(MRAM_SIZE - 2, RECORD)
+
+
+def test_preload_and_persist(tmp_path: Path) -> None:
+    """
+    Test that the memory is preloaded from an image and persisted to it.
+    """
+    image_path = tmp_path / "mram.bin"
+    mram = MramMr25h10(instance_id=2, address=0)
+    mram.write_to_memory(0x1000, RECORD)
+    mram.save(image_path)
+    assert image_path.stat().st_size == MRAM_SIZE
+
+    preloaded = MramMr25h10(instance_id=2, address=0, image_path=image_path)
+    assert preloaded.read_memory(0x1000, len(RECORD)) == RECORD
+
+    mapped = MramMr25h10(
+        instance_id=2, address=0, image_path=image_path, mmap_image=True
+    )
+    assert mapped.read_memory(0x1000, len(RECORD)) == RECORD
+    mapped.write(bytes([Commands.WRITE_EN]))
+    mapped.write(_write_command(0x2000, RECORD[::-1]))
+    mapped.close()
+    assert image_path.read_bytes()[0x2000 : 0x2000 + len(RECORD)] == RECORD[::-1]
+
+    created = MramMr25h10(
+        instance_id=2, address=0, image_path=tmp_path / "new.bin", mmap_image=True
+    )
+    assert created.read_memory(0, 4) == bytes([0xFF] * 4)
+    created.close()
+    assert (tmp_path / "new.bin").stat().st_size == MRAM_SIZE
@@ -0,0 +1,89 @@
+import struct
+
+import bitstruct
+import pytest
+
+from framework.communications.uvcs_footswitch.msg_types.aux_data_types import (
+    AuxDataType,
+    BatteryStatus1,
+    ErrorFlags,
+)
+from framework.communications.uvcs_footswitch.msg_types.configuration_msg import (
+    ConfigurationMsg310,
+    ConfigurationMsg311,
+)
+from framework.communications.uvcs_footswitch.msg_types.fault_msgs import (
+    FaultType,
+    Fault010,
+    Fault011,
+)
+from framework.communications.uvcs_footswitch.msg_types.real_time_status_msgs import (
+    StatusMsg210,
+    StatusMsg211,
+)
+from framework.communications.uvcs_footswitch.msg_types.schema import MessageSchema
+
+
+def test_configuration_msg_pack() -> None:
+    """
+    Test configuration messages pack to the documented layout.
+    """
+    config = ConfigurationMsg310(console_network_id=-2, console_type=2)
+    assert config.pack() == struct.pack(
+        "<BBBBhsB", 255, 1, 10, 0, -2, bitstruct.pack(">p5u2b1", 2, True), 1
+    )
+    assert ConfigurationMsg310.unpack(config.pack()) == config
+    config_311 = ConfigurationMsg311(detent_strength=3)
+    assert config_311.pack() == (
+        bitstruct.pack(">b1u7", False, 50)
+        + bitstruct.pack(">b1u7", True, 15)
+        + b"\x03"
+        + bytes(5)
+    )
+
+
+def test_fault_msg_round_trip() -> None:
+    """
+    Test fault messages unpack and pack.
+    """
+    data = bitstruct.pack("u5u3u4u4u8u8u16u16", 1, 2, 0, 5, 7, 4, 300, 0xABCD)
+    fault = Fault010.unpack(data)
+    assert fault.fault_type == FaultType.WatchdogTimeout
+    assert fault.file_line_no == 300
+    assert fault.pack() == data
+    data = bitstruct.pack("u4u4u8u8u16", 1, 0, 2, 3, 0x1234)
+    assert Fault011.unpack(data).pack() == data
+
+
+def test_status_msg_pack() -> None:
+    """
+    Test status messages pack to the received payload.
+    """
+    data = struct.pack(">BBBcHcB", 2, 1, 7, b"\x05", 0x1234, b"\x03", 0)
+    assert StatusMsg210.unpack(data).pack() == data
+    aux_data = bitstruct.pack("b1u7b1b1b1b1b1b1b1b1u8u8", 1, 80, *([0] * 8), 25, 90)
+    data = bytes([0, 0, 0, AuxDataType.BatteryStatus1]) + aux_data
+    message = StatusMsg211.unpack(data)
+    assert isinstance(message.data, BatteryStatus1)
+    assert message.data.level == 80
+    assert message.data.charging
+    assert message.pack() == data
+
+
+def test_error_flags_bit_order() -> None:
+    """
+    Test error flags are mapped from bit 0 of each byte.
+    """
+    flags = ErrorFlags.unpack(b"\x01\x80\x10\x00")
+    assert flags.battery_comm_error
+    assert flags.treadle_homing_failure
+    assert flags.laser_footswitch_left_switch_failure
+    assert not flags.wireless_operation_failure
+
+
+def test_schema_format_mismatch() -> None:
+    """
+    Test schema rejects format not matching its fields.
+    """
+    with pytest.raises(ValueError):
+        MessageSchema.from_struct(">BH", ("only_one",))
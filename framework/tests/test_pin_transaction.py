@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock, call
+
+from framework.core.peripherals.pin_transaction import PinTransaction
+from framework.hardware_interfaces.drivers.mpc5777c.mpc5777c_pins_driver import (
+    PinDriver as Mpc5777cPinDriver,
+)
+from framework.hardware_interfaces.drivers.s32k148.adc_driver import AdcDriver
+from framework.hardware_interfaces.drivers.s32k148.s32k148_pins_driver import (
+    PinDriver as S32k148PinDriver,
+)
+from framework.hardware_interfaces.protoc.mpc5777c.mpc5777c_pins_driver_pb2 import (
+    PinsInitParams as Mpc5777cPinsInitParams,
+)
+from framework.hardware_interfaces.protoc.s32k148.s32k148_pins_driver_pb2 import (
+    PinSettingConfig,
+    PinsInitParams,
+    PortIrqId,
+)
+
+PORT = 4
+PORT_IRQ = 63
+ADC_IRQ = 39
+MPC_PINS_IRQ = -10
+
+
+def test_transaction_coalesces_interrupts() -> None:
+    """
+    Test that changes within a transaction raise one interrupt per port/pin/channel on exit.
+    """
+    raise_interrupt = MagicMock()
+    pins_drv = S32k148PinDriver(raise_interrupt)
+    pins_drv.PINS_DRV_Init(
+        PinsInitParams(
+            config=[PinSettingConfig(port_id=PORT, pin_id=pin) for pin in (8, 12)],
+            irq_ids=[PortIrqId(port_id=PORT, irq_id=PORT_IRQ)],
+        ),
+        None,
+    )
+    adc_driver = AdcDriver(raise_interrupt)
+    channel = adc_driver.get_channel(0, 4)
+    channel.initialize(5000, 4095, ADC_IRQ)
+    mpc_pins_drv = Mpc5777cPinDriver(raise_interrupt)
+    mpc_pins_drv.PINS_DRV_Init(Mpc5777cPinsInitParams(irq_id=MPC_PINS_IRQ), None)
+
+    with PinTransaction(pins_drv, adc_driver, mpc_pins_drv):
+        pins_drv.set(PORT, 8, True)
+        channel.voltage = 1.0
+        mpc_pins_drv.set(5, True)
+        with PinTransaction(pins_drv):
+            pins_drv.set(PORT, 12, True)
+        mpc_pins_drv.set(6, True)
+        pins_drv.set(PORT, 8, False)
+        channel.voltage = 2.5
+        mpc_pins_drv.set(5, False)
+
+        assert pins_drv.get(PORT, 12) and not pins_drv.get(PORT, 8)
+        raise_interrupt.assert_not_called()
+
+    assert raise_interrupt.call_args_list == [
+        call(PORT_IRQ, 1 << 12),
+        call(ADC_IRQ, 4 << 24 | channel.counts),
+        call(MPC_PINS_IRQ, 6 << 16 | 1),
+        call(MPC_PINS_IRQ, 5 << 16),
+    ]
+
+    pins_drv.set(PORT, 8, True)
+    assert raise_interrupt.call_args == call(PORT_IRQ, 1 << 12 | 1 << 8)
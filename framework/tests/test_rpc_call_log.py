@@ -0,0 +1,60 @@
+"""RPC call logging tests."""
+
+import logging
+from typing import Any, Iterator
+
+import pytest
+
+from framework.hardware_interfaces.protoc.common.connect_pb2 import HandShakeRequest
+from framework.support.reports import logger, rpc_call, set_rpc_log_sampling
+
+
+class _Service:
+    """Service with a single RPC method."""
+
+    @rpc_call
+    def NoisyCall(self, request: Any, context: Any) -> str:
+        """Return request message."""
+        return str(request.message)
+
+
+@pytest.fixture
+def debug_log(caplog: pytest.LogCaptureFixture) -> Iterator[pytest.LogCaptureFixture]:
+    """Capture DEBUG records of the framework logger and reset sampling of the test method."""
+    caplog.set_level(logging.DEBUG, logger=logger.name)
+    yield caplog
+    set_rpc_log_sampling("NoisyCall", 1)
+
+
+def test_request_not_formatted_when_debug_disabled(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Verify that the request is not converted to string when DEBUG level is disabled."""
+
+    class _Request:
+        message = "emu"
+
+        def ListFields(self) -> Any:
+            """Fail if the request is formatted."""
+            raise AssertionError("Request fields must not be accessed.")
+
+    caplog.set_level(logging.INFO, logger=logger.name)
+    _Service().NoisyCall(_Request(), None)  # type: ignore
+
+
+def test_rpc_call_sampling(debug_log: pytest.LogCaptureFixture) -> None:
+    """Verify that only every N-th call is logged when sampling is set."""
+    set_rpc_log_sampling("NoisyCall", 3)
+    service = _Service()
+    for _ in range(7):
+        service.NoisyCall(HandShakeRequest(message="emu"), None)
+
+    records = [
+        r.getMessage() for r in debug_log.records if "NoisyCall" in r.getMessage()
+    ]
+    assert len(records) == 3
+    assert "('message', 'emu')" in records[0]
+
+    set_rpc_log_sampling("NoisyCall", 0)
+    service.NoisyCall(HandShakeRequest(message="emu"), None)
+    assert len([r for r in debug_log.records if "NoisyCall" in r.getMessage()]) == 3
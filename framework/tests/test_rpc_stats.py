@@ -0,0 +1,72 @@
+"""RPC statistics tests."""
+
+import json
+from typing import Any, Iterator
+
+import pytest
+
+from framework.hardware_interfaces.protoc.common.connect_pb2 import HandShakeRequest
+from framework.support.reports import RpcStatistics, rpc_call, rpc_stats
+from framework.support.reports.log import measure_duration
+from framework.support.vtime import vtime_manager
+
+
+class _Service:
+    """Service with RPC methods."""
+
+    @rpc_call
+    def Call(self, request: Any, context: Any) -> str:
+        """Return request message."""
+        return str(request.message)
+
+    @rpc_call
+    def FailingCall(self, request: Any, context: Any) -> None:
+        """Raise an error."""
+        raise RuntimeError("failed")
+
+    @measure_duration
+    def measured(self) -> int:
+        """Return constant."""
+        return 1
+
+
+@pytest.fixture
+def stats() -> Iterator[RpcStatistics]:
+    """Enable recording of RPC statistics for the test."""
+    rpc_stats.reset()
+    rpc_stats.enable(vtime_manager.time_us)
+    yield rpc_stats
+    rpc_stats.disable()
+    rpc_stats.reset()
+
+
+def test_calls_are_recorded(stats: RpcStatistics, tmp_path: Any) -> None:
+    """Verify that calls, errors and queue depths are recorded and dumped to JSON."""
+    service = _Service()
+    for _ in range(3):
+        service.Call(HandShakeRequest(message="emu"), None)
+    with pytest.raises(RuntimeError):
+        service.FailingCall(HandShakeRequest(), None)
+    service.measured()
+    stats.record_queue_depth("Interrupts", 3)
+
+    path = tmp_path / "rpc_stats.json"
+    stats.dump_json(str(path))
+    data = json.loads(path.read_text())
+
+    assert data["calls"]["_Service.Call"]["count"] == 3
+    assert data["calls"]["_Service.Call"]["errors"] == 0
+    assert data["calls"]["_Service.FailingCall"]["errors"] == 1
+    assert data["calls"]["_Service.measured"]["count"] == 1
+    assert data["calls"]["_Service.Call"]["vtime_us"]["total"] == 0
+    assert data["queue_depths"]["Interrupts"]["buckets"] == {"<=4": 1}
+
+    table = stats.format_table(top_n=2)
+    assert len(table) == 3
+
+
+def test_disabled_statistics_are_not_recorded() -> None:
+    """Verify that nothing is recorded while statistics are disabled."""
+    rpc_stats.reset()
+    _Service().Call(HandShakeRequest(message="emu"), None)
+    assert rpc_stats.to_dict() == {"calls": {}, "queue_depths": {}}
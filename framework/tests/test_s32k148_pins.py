@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from framework.core.components.button import Button
+from framework.core.components.treadle import Treadle
+from framework.hardware_interfaces.drivers.common.definitions.pins_def import (
+    InputPins,
+    Ports,
+)
+from framework.hardware_interfaces.drivers.s32k148.s32k148_pins_driver import (
+    PinDriver,
+)
+from framework.hardware_interfaces.protoc.s32k148.s32k148_pins_driver_pb2 import (
+    Direction,
+    PinSettingConfig,
+    PinsInitParams,
+    PinWriteParams,
+    PortIrqId,
+)
+
+IRQ_PORT_E = 63
+TREADLE_PINS = [
+    InputPins.TREADLE_UP0,
+    InputPins.TREADLE_UP1,
+    InputPins.TREADLE_UP2,
+    InputPins.TREADLE_UP3,
+    InputPins.TREADLE_UP4,
+]
+
+
+@pytest.fixture
+def raise_interrupt() -> MagicMock:
+    """
+    Fixture for the interrupt raising function.
+    """
+    return MagicMock()
+
+
+@pytest.fixture
+def pins_drv(raise_interrupt: MagicMock) -> PinDriver:
+    """
+    Fixture for the pin driver with the treadle switches configured on port E.
+    """
+    driver = PinDriver(raise_interrupt)
+    driver.PINS_DRV_Init(
+        PinsInitParams(
+            config=[
+                PinSettingConfig(
+                    port_id=port,
+                    pin_id=pin,
+                    direction=Direction.FSW_IN,
+                    init_value=int(pin == 14),
+                )
+                for port, pin in (pins.value for pins in TREADLE_PINS)
+            ],
+            irq_ids=[PortIrqId(port_id=Ports.PORT_E, irq_id=IRQ_PORT_E)],
+        ),
+        None,
+    )
+    return driver
+
+
+def test_port_bitmask(pins_drv: PinDriver, raise_interrupt: MagicMock) -> None:
+    """
+    Test that pin values are kept in the port bitmask passed as interrupt flags.
+    """
+    assert pins_drv.port_values[Ports.PORT_E] == 1 << 14
+    assert pins_drv.get(Ports.PORT_E, 14)
+
+    pins_drv.set(Ports.PORT_E, 8, True)
+    pins_drv.set_many(Ports.PORT_E, 1 << 0 | 1 << 1 | 1 << 14, 1 << 1)
+    pins_drv.PINS_DRV_WritePin(
+        PinWriteParams(port_id=Ports.PORT_E, pin_id=12, value=1), None
+    )
+
+    assert raise_interrupt.call_args_list == [
+        call(IRQ_PORT_E, 1 << 14 | 1 << 8),
+        call(IRQ_PORT_E, 1 << 8 | 1 << 1),
+    ]
+    assert [pins_drv.get(Ports.PORT_E, pin) for pin in (0, 1, 8, 12, 14)] == [
+        False,
+        True,
+        True,
+        True,
+        False,
+    ]
+    with pytest.raises(KeyError):
+        pins_drv.set_many(Ports.PORT_E, 1 << 2, 0)
+    with pytest.raises(KeyError):
+        pins_drv.get(Ports.PORT_A, 9)
+
+
+def test_treadle_switches_raise_one_interrupt(
+    pins_drv: PinDriver, raise_interrupt: MagicMock
+) -> None:
+    """
+    Test that moving the treadle updates all switches by one port interrupt.
+    """
+    treadle = Treadle.__new__(Treadle)
+    treadle._switches = [Button(pins_drv, *pins.value) for pins in TREADLE_PINS]
+
+    treadle._set_switches(3, True)
+
+    raise_interrupt.assert_called_once_with(IRQ_PORT_E, 1 << 8 | 1 << 12 | 1 << 14)
+    assert [switch.state for switch in treadle._switches] == [
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
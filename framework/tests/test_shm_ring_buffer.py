@@ -0,0 +1,39 @@
+"""Shared-memory ring buffer tests."""
+
+from typing import Iterator
+
+import pytest
+
+from framework.support.ipc import ShmRingBuffer
+
+
+@pytest.fixture
+def ring_buffer() -> Iterator[ShmRingBuffer]:
+    """Create small ring buffer so records wrap around the end of the data area."""
+    buffer = ShmRingBuffer(size=32)
+    yield buffer
+    buffer.close()
+
+
+def test_records_wrap_around(ring_buffer: ShmRingBuffer) -> None:
+    """Verify records are read in order including those wrapped around the end of the buffer."""
+    reader = ShmRingBuffer(name=ring_buffer.name, create=False)
+    try:
+        for i in range(10):
+            assert ring_buffer.put(bytes([i]) * 10)
+            assert reader.get() == bytes([i]) * 10
+        assert reader.get() is None
+    finally:
+        reader.close()
+
+
+def test_full_buffer(ring_buffer: ShmRingBuffer) -> None:
+    """Verify that record is rejected when there is not enough free space."""
+    assert ring_buffer.put(b"x" * 12)
+    assert ring_buffer.put(b"y" * 12)
+    assert ring_buffer.getsize() == 32
+    assert not ring_buffer.put(b"z")
+    assert ring_buffer.get() == b"x" * 12
+    assert ring_buffer.put(b"z")
+    with pytest.raises(ValueError):
+        ring_buffer.put(b"w" * 32)
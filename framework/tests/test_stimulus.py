@@ -0,0 +1,188 @@
+from typing import Any, Callable, List, Tuple
+
+import pytest
+
+from framework.core.peripherals.stimulus import (
+    Bounce,
+    PiecewiseLinear,
+    Pwm,
+    StimulusEngine,
+    Waveform,
+)
+from framework.support.vtime import vtime_manager
+
+
+class _Recorder:
+    """Stimulus target recording virtual times of its value changes."""
+
+    def __init__(self) -> None:
+        self.changes: List[Tuple[int, Any]] = []
+        self._start_us = vtime_manager.time_us()
+
+    def _record(self, value: Any) -> None:
+        self.changes.append((vtime_manager.time_us() - self._start_us, value))
+
+    state = property(fset=_record)
+    voltage = property(fset=_record)
+
+
+def test_waveform_changes() -> None:
+    """
+    Test value changes generated by the waveforms.
+    """
+    assert list(PiecewiseLinear([(0, 0.0), (0.004, 2.0), (0.006, 2.0)]).changes()) == [
+        (0, 0.0),
+        (1000, 0.5),
+        (2000, 1.0),
+        (3000, 1.5),
+        (4000, 2.0),
+    ]
+    assert list(Pwm(0.01, duty=0.25, cycles=2).changes()) == [
+        (0, True),
+        (2500, False),
+        (10_000, True),
+        (12_500, False),
+    ]
+    assert list(Bounce(True, [0.001, 0.0005, 0.002], hold=0.1).changes()) == [
+        (0, True),
+        (1000, False),
+        (1500, True),
+        (3500, False),
+        (5500, True),
+        (105_500, False),
+    ]
+
+
+def test_play_waveforms(run_in_worker: Callable) -> None:
+    """
+    Test that waveforms are played on the virtual clock by one call each.
+    """
+    stimulus = StimulusEngine()
+    button = _Recorder()
+    adc_channel = _Recorder()
+    ramp = PiecewiseLinear([(0, 0.0), (10, 24.0)], step=0.01)
+
+    def _scenario() -> None:
+        start_us = vtime_manager.time_us()
+        stimulus.play(button, Bounce(True, [0.001, 0.001], hold=0.02), delay=0.5)
+        ramp_id = stimulus.play(adc_channel, ramp)
+        assert stimulus.wait_all(timeout=20)
+        assert not stimulus.is_playing(ramp_id)
+        assert vtime_manager.time_us() - start_us == 10_000_000
+
+    run_in_worker(_scenario)
+
+    assert button.changes == [
+        (500_000, True),
+        (501_000, False),
+        (502_000, True),
+        (522_000, False),
+    ]
+    assert len(adc_channel.changes) == 1001
+    assert adc_channel.changes[::250] == [
+        (0, 0.0),
+        (2_500_000, 6.0),
+        (5_000_000, 12.0),
+        (7_500_000, 18.0),
+        (10_000_000, 24.0),
+    ]
+
+
+def test_stop_stimulus(run_in_worker: Callable) -> None:
+    """
+    Test that stopped stimulus keeps the target at its current value.
+    """
+    stimulus = StimulusEngine()
+    pin = _Recorder()
+
+    def _scenario() -> None:
+        pwm_id = stimulus.play(pin, Pwm(0.01, cycles=100))
+        assert not stimulus.wait(pwm_id, timeout=0.022)
+        stimulus.stop(pwm_id)
+        assert stimulus.wait(pwm_id)
+
+    run_in_worker(_scenario)
+
+    assert pin.changes == [
+        (0, True),
+        (5000, False),
+        (10_000, True),
+        (15_000, False),
+        (20_000, True),
+    ]
+    assert not stimulus.is_playing(1)
+
+
+def test_same_time_changes(run_in_worker: Callable) -> None:
+    """
+    Test that changes at the same time are collapsed without shifting the following changes.
+    """
+    stimulus = StimulusEngine()
+    button = _Recorder()
+    bounce = Bounce(True, [0.001, 0.0, 0.002])
+
+    run_in_worker(lambda: stimulus.wait(stimulus.play(button, bounce)))
+
+    assert button.changes == [(0, True), (1000, True), (3000, False), (5000, True)]
+
+
+def test_play_after_wait(run_in_worker: Callable) -> None:
+    """
+    Test that a stimulus played right after the previous one finished is played to its end.
+    """
+    stimulus = StimulusEngine()
+    pin = _Recorder()
+
+    def _scenario() -> None:
+        for _ in range(3):
+            assert stimulus.wait(stimulus.play(pin, Pwm(0.002)), timeout=1)
+
+    run_in_worker(_scenario)
+
+    assert pin.changes == [
+        (0, True),
+        (1000, False),
+        (1000, True),
+        (2000, False),
+        (2000, True),
+        (3000, False),
+    ]
+
+
+class _FailingPin(_Recorder):
+    """Stimulus target failing to change its value after the first change."""
+
+    def _record(self, value: Any) -> None:
+        if self.changes:
+            raise KeyError("pin not configured")
+        super()._record(value)
+
+    state = property(fset=_record)
+
+
+def test_failing_target(run_in_worker: Callable) -> None:
+    """
+    Test that a stimulus failing to change its target is finished and the engine keeps playing other stimuli.
+    """
+    stimulus = StimulusEngine()
+    failing_pin = _FailingPin()
+    pin = _Recorder()
+
+    def _scenario() -> None:
+        failing_id = stimulus.play(failing_pin, Pwm(0.002, cycles=2))
+        assert stimulus.wait(failing_id, timeout=1)
+        assert not stimulus.is_playing(failing_id)
+        assert stimulus.wait(stimulus.play(pin, Pwm(0.002)), timeout=1)
+
+    run_in_worker(_scenario)
+
+    assert failing_pin.changes == [(0, True)]
+    assert [value for _, value in pin.changes] == [True, False]
+
+
+def test_waveform_is_abstract() -> None:
+    """
+    Test that a waveform without changes can't be created.
+    """
+    with pytest.raises(TypeError):
+        Waveform()  # type: ignore
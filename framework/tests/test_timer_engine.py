@@ -0,0 +1,226 @@
+import threading
+import time
+from typing import Callable, Iterator, List, Tuple
+
+import pytest
+
+from framework.core.control.lpit import TimerManager
+from framework.core.control.pit import PITChannelManager
+from framework.hardware_interfaces.drivers.common.interrupts import Interrupts
+from framework.support.vtime import (
+    TimeEvent,
+    TimerEngine,
+    VirtualTimeWorker,
+    get_worker_manager,
+    vtime_manager,
+)
+
+
+@pytest.fixture(scope="function")
+def timer_engine() -> Iterator[TimerEngine]:
+    """
+    Fixture to create a TimerEngine instance.
+    """
+    engine = TimerEngine()
+    yield engine
+    engine.stop()
+
+
+@pytest.fixture(scope="function")
+def irq_mgr() -> Iterator[Interrupts]:
+    """
+    Fixture to create an Interrupts instance.
+    """
+    irq_mgr = Interrupts()
+    irq_mgr.start()
+    yield irq_mgr
+    irq_mgr.stop()
+
+
+def test_multiple_timers_single_worker(
+    timer_engine: TimerEngine, irq_mgr: Interrupts
+) -> None:
+    """
+    Test multiple LPIT timers driven by the timer engine.
+
+    All timers share one worker thread and interrupts are generated at their own periods.
+    """
+    timer_manager = TimerManager(timer_engine)
+    timers = [
+        (1, 3001, 500_000),  # Timer ID 1, IRQ ID 3001, period 0.5 seconds
+        (2, 3002, 750_000),  # Timer ID 2, IRQ ID 3002, period 0.75 seconds
+        (3, 3003, 1_000_000),  # Timer ID 3, IRQ ID 3003, period 1 second
+    ]
+    periods = {irq_id: period_us for _, irq_id, period_us in timers}
+    threads_before = threading.active_count()
+
+    start_time = vtime_manager.time_us()
+    for timer_id, irq_id, period_us in timers:
+        timer_manager.create_timer(timer_id, irq_id, irq_mgr.raise_interrupt)
+        timer_manager.set_timer_period(timer_id, period_us)
+        timer_manager.start_timer(timer_id)
+    time.sleep(0.1)
+
+    assert threading.active_count() == threads_before + 1
+    assert timer_engine.get_num_of_timers() == len(timers)
+
+    next_expected_interrupt = {
+        irq_id: start_time + period_us for irq_id, period_us in periods.items()
+    }
+    for _ in range(20):
+        interrupt = irq_mgr.wait_for_interrupt().irq_id
+        assert next_expected_interrupt[interrupt] == vtime_manager.time_us()
+        next_expected_interrupt[interrupt] += periods[interrupt]
+
+    timer_manager.stop_all_timers()
+    timer_engine.stop()
+    assert timer_engine.get_num_of_timers() == 0
+    assert threading.active_count() == threads_before
+
+
+def test_channel_period_change(timer_engine: TimerEngine, irq_mgr: Interrupts) -> None:
+    """
+    Test PIT channel driven by the timer engine applies new period from the next timeout.
+    """
+    channel_manager = PITChannelManager(timer_engine)
+    channel_manager.create_channel(0)
+    channel_manager.set_period_us(0, 1_000)
+    channel_manager.enable_interrupt(0, 301, irq_mgr.raise_interrupt)
+
+    start_time = vtime_manager.time_us()
+    channel_manager.start_channel(0)
+    time.sleep(0.1)
+    assert channel_manager.channels[0].is_running()
+
+    assert irq_mgr.wait_for_interrupt().irq_id == 301
+    assert vtime_manager.time_us() == start_time + 1_000
+
+    # Already scheduled timeout keeps the original period
+    channel_manager.set_period_us(0, 2_500)
+    assert irq_mgr.wait_for_interrupt().irq_id == 301
+    assert vtime_manager.time_us() == start_time + 2_000
+    assert irq_mgr.wait_for_interrupt().irq_id == 301
+    assert vtime_manager.time_us() == start_time + 4_500
+
+    channel_manager.stop_all()
+    assert not channel_manager.channels[0].is_running()
+
+
+def test_fast_forward_skips_idle_windows() -> None:
+    """
+    Test fast-forward mode executes timeouts without the engine's worker going idle between them.
+    """
+    engine = TimerEngine(fast_forward=True)
+    timeouts: List[int] = []
+    engine_waits = [0]
+    wait = engine._schedule_changed.wait
+
+    def _counting_wait(timeout: float | None = None) -> bool:
+        engine_waits[0] += 1
+        return wait(timeout)
+
+    engine._schedule_changed.wait = _counting_wait  # type: ignore
+    observed: List[Tuple[int, int, int]] = []
+    start_time = vtime_manager.time_us()
+
+    def _sleeper() -> None:
+        vtime_manager.sleep(0.0105)
+        observed.append((vtime_manager.time_us(), len(timeouts), engine_waits[0]))
+
+    # Hold virtual time until the engine waits for its first timeout
+    main_worker = VirtualTimeWorker.current_worker()
+    get_worker_manager().register_worker(main_worker)
+    sleeper = VirtualTimeWorker(target=_sleeper, daemon=True)
+    sleeper.start()
+    engine.add_timer(lambda: 1_000, lambda: timeouts.append(vtime_manager.time_us()))
+    while engine_waits[0] == 0 or get_worker_manager().get_num_of_active_workers() > 1:
+        time.sleep(0.001)
+    get_worker_manager().unregister_worker(main_worker)
+
+    sleeper.join(timeout=5)
+    engine.stop()
+
+    # Only the first timeout and the one after the sleeper's wake-up are waited for
+    assert observed == [(start_time + 10_500, 10, 2)]
+    assert timeouts[:10] == [start_time + 1_000 * (i + 1) for i in range(10)]
+
+
+def test_fast_forward_with_interrupts(irq_mgr: Interrupts) -> None:
+    """
+    Test fast-forward mode with callbacks raising interrupts.
+
+    Interrupts are not synthesized in bulk: each one wakes up the consumer at its own expiration time, and silent
+    timeouts in between are still executed at their own times.
+    """
+    engine = TimerEngine(fast_forward=True)
+    silent_timeouts: List[int] = []
+    start_time = vtime_manager.time_us()
+    engine.add_timer(lambda: 1_000, lambda: irq_mgr.raise_interrupt(3001))
+    engine.add_timer(
+        lambda: 250, lambda: silent_timeouts.append(vtime_manager.time_us())
+    )
+
+    interrupt_times = []
+    for _ in range(10):
+        assert irq_mgr.wait_for_interrupt().irq_id == 3001
+        interrupt_times.append(vtime_manager.time_us())
+    engine.stop()
+
+    assert interrupt_times == [start_time + 1_000 * (i + 1) for i in range(10)]
+    assert silent_timeouts[:40] == [start_time + 250 * (i + 1) for i in range(40)]
+
+
+def test_stop_from_worker(run_in_worker: Callable) -> None:
+    """
+    Test that a virtual time worker stopping the engine lets a callback waiting in virtual time complete.
+    """
+    engine = TimerEngine()
+    started = TimeEvent()
+
+    def _callback() -> None:
+        started.set()
+        vtime_manager.sleep(0.01)
+
+    def _scenario() -> int:
+        engine.add_timer(lambda: 1_000, _callback, delay_us=0)
+        assert started.wait(1)
+        start_time = vtime_manager.time_us()
+        engine.stop()
+        return vtime_manager.time_us() - start_time
+
+    assert run_in_worker(_scenario) == 10_000
+    assert engine.get_num_of_timers() == 0
+
+
+def test_failing_callback_and_zero_period(run_in_worker: Callable) -> None:
+    """
+    Test that a failing callback doesn't stop other timers and a timer with zero period never expires.
+    """
+    engine = TimerEngine()
+    timeouts: List[int] = []
+    failures = [0]
+    period_us = [1_000]
+
+    def _fail() -> None:
+        failures[0] += 1
+        raise RuntimeError("Timer callback failure")
+
+    def _scenario() -> None:
+        start_time = vtime_manager.time_us()
+        engine.add_timer(lambda: 1_000, _fail, delay_us=0)
+        vtime_manager.sleep(0.0025)
+        engine.add_timer(lambda: 0, lambda: timeouts.append(-1))
+        engine.add_timer(
+            lambda: period_us[0],
+            lambda: timeouts.append(vtime_manager.time_us() - start_time),
+        )
+        vtime_manager.sleep(0.0021)
+        period_us[0] = 0
+        vtime_manager.sleep(0.005)
+        engine.stop()
+
+    run_in_worker(_scenario)
+
+    # The period is evaluated when the timer expires, zero period stops it after the timeout at 5.5 ms
+    assert timeouts == [3_500, 4_500, 5_500]
+    assert failures[0] == 10
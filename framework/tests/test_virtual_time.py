@@ -4,16 +4,18 @@ import concurrent.futures
 import threading
 import time
 from concurrent.futures import ALL_COMPLETED
-from queue import Empty
+from queue import Empty, Full
 
 
 from framework.support.reports import logger
-from framework.support.vtime.queue import Queue
+from framework.support.vtime.queue import OverflowPolicy, Queue
 from framework.support.vtime import VirtualTimeManager, vtime_manager, TimeEvent
 from framework.support.vtime import (
     VirtualTimeThreadPoolExecutor,
     VirtualTimeWorker,
+    get_worker_manager,
 )
+from framework.support.vtime.workers import WorkersManager
 
 
 def _sleep(vm: VirtualTimeManager, duration: int) -> None:
@@ -169,3 +171,156 @@ def test_queue() -> None:
 
         concurrent.futures.wait([fut_provider, fut_consumer], return_when=ALL_COMPLETED)  # type: ignore
         assert fut_consumer.result()
+
+
+def test_queue_overflow_policies() -> None:
+    """
+    Test handling of items put into a full bounded queue and counting of overruns.
+    """
+    drop_oldest: Queue[int] = Queue(2, OverflowPolicy.DROP_OLDEST)
+    drop_newest: Queue[int] = Queue(2, OverflowPolicy.DROP_NEWEST)
+    for item in range(4):
+        drop_oldest.put(item)
+        drop_newest.put(item)
+    assert drop_oldest.get_batch() == [2, 3] and drop_oldest.overruns == 2
+    assert drop_newest.get_batch() == [0, 1] and drop_newest.overruns == 2
+
+    blocking: Queue[int] = Queue(1)
+    blocking.put(0)
+    try:
+        blocking.put_nowait(1)
+        assert False, "Full queue accepted item"
+    except Full:
+        assert blocking.overruns == 1
+    start_time = vtime_manager.time_ms()
+
+    def _put_blocked() -> int:
+        blocking.put(1)
+        return vtime_manager.time_ms()
+
+    def _get_delayed() -> int:
+        vtime_manager.sleep(0.002)
+        return blocking.get()
+
+    with VirtualTimeThreadPoolExecutor(max_workers=2) as executor:
+        producer = executor.submit(_put_blocked)
+        consumer = executor.submit(_get_delayed)
+        assert consumer.result() == 0
+        assert producer.result() == start_time + 2
+    assert blocking.get_nowait() == 1 and blocking.overruns == 1
+
+
+def test_queue_put_timeout_spans_retries() -> None:
+    """
+    Test that a blocked put losing the freed space to another put only waits for the rest of its timeout.
+    """
+    blocking: Queue[int] = Queue(1)
+    blocking.put(0)
+    results: list[tuple[bool, int]] = []
+
+    def _put(item: int) -> None:
+        try:
+            blocking.put(item, timeout=0.01)
+            results.append((True, vtime_manager.time_ms() - start_time))
+        except Full:
+            results.append((False, vtime_manager.time_ms() - start_time))
+
+    def _get_delayed() -> None:
+        vtime_manager.sleep(0.004)
+        blocking.get()
+
+    # Hold virtual time until all workers wait
+    main_worker = VirtualTimeWorker.current_worker()
+    get_worker_manager().register_worker(main_worker)
+    num_of_workers = get_worker_manager().get_num_of_workers()
+    start_time = vtime_manager.time_ms()
+    workers = [VirtualTimeWorker(target=_put, args=(item,)) for item in (1, 2)]
+    workers.append(VirtualTimeWorker(target=_get_delayed))
+    for worker in workers:
+        worker.start()
+    while (
+        get_worker_manager().get_num_of_workers() < num_of_workers + len(workers)
+        or get_worker_manager().get_num_of_active_workers() > 1
+    ):
+        time.sleep(0.001)
+    get_worker_manager().unregister_worker(main_worker)
+    for worker in workers:
+        worker.join(timeout=5)
+
+    assert sorted(results) == [(False, 10), (True, 4)]
+    assert blocking.overruns == 1
+
+
+def test_wake_up_order() -> None:
+    """
+    Test that workers sleeping for different durations are woken up at their own wake-up time.
+
+    Sleep durations are submitted out of order to exercise ordering of the timeout events.
+    """
+    durations_ms = [7, 2, 5, 2, 11, 1]
+    start_time = vtime_manager.time_ms()
+
+    def _sleep_and_report(duration: int) -> int:
+        time.sleep(0.1)  # Wait for all workers to be running
+        vtime_manager.sleep(duration * 1e-3)
+        return vtime_manager.time_ms()
+
+    with VirtualTimeThreadPoolExecutor(max_workers=len(durations_ms)) as executor:
+        futures = [
+            executor.submit(_sleep_and_report, duration) for duration in durations_ms
+        ]
+        concurrent.futures.wait(futures, return_when=ALL_COMPLETED)  # type: ignore
+
+    for duration, future in zip(durations_ms, futures):
+        assert future.result() == start_time + duration
+    assert vtime_manager.time_ms() == start_time + max(durations_ms)
+
+
+def test_cancelled_timeout_does_not_advance_clock() -> None:
+    """
+    Test that cancelled timeout event is not used for calculation of the next clock step.
+    """
+    data_available = TimeEvent()
+    start_time = vtime_manager.time_ms()
+
+    provider = VirtualTimeWorker(target=lambda: _event_provider(data_available, 0.002))
+    consumer = VirtualTimeWorker(target=lambda: _event_consumer(data_available, 10))
+
+    provider.start()
+    consumer.start()
+    provider.join()
+    consumer.join()
+
+    assert vtime_manager.time_ms() == start_time + 2
+
+
+def test_workers_manager_idle_detection() -> None:
+    """
+    Test that idle observer is notified only when all registered workers are idle.
+    """
+    manager = WorkersManager()
+    notifications = []
+    manager.register_idle_observer(lambda: notifications.append(True))
+
+    manager.register_worker(1)
+    manager.register_worker(2)
+    assert manager.get_num_of_active_workers() == 2
+
+    manager.go_idle(1)
+    manager.go_idle(1)  # Repeated idle notification is not counted twice
+    assert manager.get_num_of_active_workers() == 1
+    assert not notifications
+
+    manager.go_idle(2)
+    assert manager.get_num_of_active_workers() == 0
+    assert len(notifications) == 1
+
+    manager.go_active(1)
+    manager.go_active(1)  # Repeated active notification is not counted twice
+    manager.go_active(3)  # Unknown worker is ignored
+    assert manager.get_num_of_active_workers() == 1
+
+    manager.unregister_worker(1)
+    assert manager.get_num_of_workers() == 1
+    assert manager.get_num_of_active_workers() == 0
+    assert len(notifications) == 2
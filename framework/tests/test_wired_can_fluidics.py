@@ -1,3 +1,5 @@
+from typing import Callable
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -23,6 +25,7 @@ def simulator() -> FluidicsSimulator:
         sim.irq_manager = MagicMock()
         sim.hw_board = MagicMock()
         sim.async_interface = MagicMock()
+        sim.timer_engine = None
 
         return sim
 
@@ -36,7 +39,7 @@ def fluidics(simulator: FluidicsSimulator) -> Fluidics:
 
 
 def test_barcode_reader_scan_reply(
-    simulator: FluidicsSimulator, fluidics: Fluidics
+    simulator: FluidicsSimulator, fluidics: Fluidics, run_in_worker: Callable
 ) -> None:
     """
     Test Barcode Reader Scan Reply.
@@ -47,6 +50,6 @@ def test_barcode_reader_scan_reply(
     msg = CanMessage(arbitration_id=0x1C1E0806, data=status_data)
     simulator.can_node.recv.return_value = msg  # type: ignore
 
-    status = fluidics.wired_conn.get_barcode_reader_scan_reply()
+    status = run_in_worker(fluidics.wired_conn.get_barcode_reader_scan_reply)
     assert isinstance(status, BarcodeReaderScanReply)
     assert status.scan_result == BarcodeReaderScanReply.unpack(status_data).scan_result
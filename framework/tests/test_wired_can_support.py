@@ -1,18 +1,24 @@
+import threading
+from typing import Callable, Iterator
+
 import pytest
 from unittest.mock import MagicMock, patch
 from framework.communications.uvcs_footswitch.msg_types.configuration_msg import (
     ConfigurationMsg310,
+    ConfigurationMsg311,
 )
 from framework.communications.uvcs_footswitch.msg_types.real_time_status_msgs import (
     StatusMsg210,
     StatusMsg211,
     StatusMsg212,
 )
+from framework.communications.uvcs_footswitch.msg_types.fault_msgs import Fault010
 from framework.apps.footswitch import FootSwitch
 from framework.simulators.footswitch_simulator import FootSwitchSimulator
 from framework.hardware_interfaces.drivers.common.definitions.interfaces import (
     CanMessage,
 )
+from framework.support.vtime import TimeEvent, vtime_manager
 
 
 @pytest.fixture
@@ -37,15 +43,18 @@ def simulator() -> FootSwitchSimulator:
         sim.led_driver_adp8866 = MagicMock()
         sim.accelerometer_adxl346 = MagicMock()
         sim.async_interface = MagicMock()
+        sim.timer_engine = None
         return sim
 
 
 @pytest.fixture
-def footswitch(simulator: FootSwitchSimulator) -> FootSwitch:
+def footswitch(simulator: FootSwitchSimulator) -> Iterator[FootSwitch]:
     """
     Create a footswitch.
     """
-    return FootSwitch.create_from_sim(simulator)
+    footswitch = FootSwitch.create_from_sim(simulator)
+    yield footswitch
+    footswitch.wired_conn.close()
 
 
 def test_send_config(footswitch: FootSwitch) -> None:
@@ -68,7 +77,9 @@ def test_send_config(footswitch: FootSwitch) -> None:
     assert sent_message.data == config.pack()
 
 
-def test_get_status_210(simulator: FootSwitchSimulator, footswitch: FootSwitch) -> None:
+def test_get_status_210(
+    simulator: FootSwitchSimulator, footswitch: FootSwitch, run_in_worker: Callable
+) -> None:
     """
     Test get status 210.
     """
@@ -76,12 +87,14 @@ def test_get_status_210(simulator: FootSwitchSimulator, footswitch: FootSwitch)
     msg = CanMessage(arbitration_id=0x210, data=status_data)
     simulator.can_node.recv.return_value = msg  # type: ignore
 
-    status = footswitch.wired_conn.get_status_210()
+    status = run_in_worker(footswitch.wired_conn.get_status_210)
     assert isinstance(status, StatusMsg210)
     assert status.foot_switch_type == StatusMsg210.unpack(status_data).foot_switch_type
 
 
-def test_get_status_211(simulator: FootSwitchSimulator, footswitch: FootSwitch) -> None:
+def test_get_status_211(
+    simulator: FootSwitchSimulator, footswitch: FootSwitch, run_in_worker: Callable
+) -> None:
     """
     Test get status 211.
     """
@@ -89,12 +102,14 @@ def test_get_status_211(simulator: FootSwitchSimulator, footswitch: FootSwitch)
     msg = CanMessage(arbitration_id=0x211, data=status_data)
     simulator.can_node.recv.return_value = msg  # type: ignore
 
-    status = footswitch.wired_conn.get_status_211()
+    status = run_in_worker(footswitch.wired_conn.get_status_211)
     assert isinstance(status, StatusMsg211)
     assert status.aux_type == StatusMsg211.unpack(status_data).aux_type
 
 
-def test_get_status_212(simulator: FootSwitchSimulator, footswitch: FootSwitch) -> None:
+def test_get_status_212(
+    simulator: FootSwitchSimulator, footswitch: FootSwitch, run_in_worker: Callable
+) -> None:
     """
     Test get status 212.
     """
@@ -102,9 +117,175 @@ def test_get_status_212(simulator: FootSwitchSimulator, footswitch: FootSwitch)
     msg = CanMessage(arbitration_id=0x212, data=status_data)
     simulator.can_node.recv.return_value = msg  # type: ignore
 
-    status = footswitch.wired_conn.get_status_212()
+    status = run_in_worker(footswitch.wired_conn.get_status_212)
     assert isinstance(status, StatusMsg212)
     assert (
         status.newest_supported_proto_version
         == StatusMsg212.unpack(status_data).newest_supported_proto_version
     )
+
+
+def test_demultiplexed_receive(
+    simulator: FootSwitchSimulator, footswitch: FootSwitch, run_in_worker: Callable
+) -> None:
+    """
+    Test frames received while awaiting another message type are kept for their own stream.
+    """
+    fault_msg = CanMessage(arbitration_id=0x010, data=bytes(8))
+    status_msg = CanMessage(
+        arbitration_id=0x210, data=b"\x01\x02\x03\x04\x05\x06\x07\x08"
+    )
+    frames = [fault_msg, status_msg]
+
+    def _recv(timeout: float) -> CanMessage:
+        if frames:
+            return frames.pop(0)
+        vtime_manager.sleep(timeout)
+        raise TimeoutError
+
+    simulator.can_node.recv.side_effect = _recv  # type: ignore
+    received: list[StatusMsg210] = []
+    subscription = footswitch.wired_conn.subscribe(StatusMsg210, received.append)
+
+    status = run_in_worker(footswitch.wired_conn.get_status_210)
+    assert isinstance(footswitch.wired_conn.get_fault_msg010(), Fault010)
+    footswitch.wired_conn.unsubscribe(StatusMsg210, subscription)
+    # The frame is decoded once by the demultiplexer for the subscriber and the waiter
+    assert received == [status]
+    assert received[0] is status
+
+
+def test_invalid_frame_skipped(
+    simulator: FootSwitchSimulator, footswitch: FootSwitch, run_in_worker: Callable
+) -> None:
+    """
+    Test that a frame with invalid field values is skipped while awaiting the message.
+    """
+    invalid_msg = CanMessage(
+        arbitration_id=0x210, data=bytes([99, 0, 0, 0, 0, 5, 0, 0])
+    )
+    status_msg = CanMessage(
+        arbitration_id=0x210, data=b"\x01\x02\x03\x04\x05\x06\x07\x08"
+    )
+    frames = [invalid_msg, status_msg]
+
+    def _recv(timeout: float) -> CanMessage:
+        if frames:
+            return frames.pop(0)
+        vtime_manager.sleep(timeout)
+        raise TimeoutError
+
+    simulator.can_node.recv.side_effect = _recv  # type: ignore
+    status = run_in_worker(footswitch.wired_conn.get_status_210)
+    assert (
+        status.foot_switch_type == StatusMsg210.unpack(status_msg.data).foot_switch_type
+    )
+
+
+def test_beacon_sets(simulator: FootSwitchSimulator, footswitch: FootSwitch) -> None:
+    """
+    Test beacon sets are transmitted with their own period and phase, beacons are replaced in place.
+    """
+    sent: list[tuple[int, bytes]] = []
+    done = threading.Event()
+    beacon_310 = ConfigurationMsg310(channel_number=1)
+    beacon_311 = ConfigurationMsg311()
+    updated_310 = ConfigurationMsg310(channel_number=2)
+    scheduler = footswitch.wired_conn.beacons
+
+    def _send(msg: CanMessage) -> None:
+        sent.append((vtime_manager.time_us() - start_time, msg.data))
+        if len(sent) == 3:
+            scheduler.update(fast_set, [updated_310])
+        if len(sent) == 6:
+            done.set()
+
+    simulator.can_node.send.side_effect = _send  # type: ignore
+    start_time = vtime_manager.time_us()
+    fast_set = scheduler.add(0.1, [beacon_310])
+    scheduler.add(0.25, [beacon_311], phase=0.05)
+    assert done.wait(timeout=5)
+    scheduler.clear()
+
+    assert sent[:4] == [
+        (0, beacon_310.pack()),
+        (50_000, beacon_311.pack()),
+        (100_000, beacon_310.pack()),
+        (200_000, updated_310.pack()),
+    ]
+    assert sorted(sent[4:6]) == sorted(
+        [(300_000, updated_310.pack()), (300_000, beacon_311.pack())]
+    )
+    assert scheduler.get_num_of_sets() == 0
+
+
+def test_remove_beacons_from_worker(
+    simulator: FootSwitchSimulator, footswitch: FootSwitch, run_in_worker: Callable
+) -> None:
+    """
+    Test removing a beacon set from a virtual time worker while its transmission waits in virtual time.
+    """
+    sending = TimeEvent()
+    scheduler = footswitch.wired_conn.beacons
+
+    def _send(msg: CanMessage) -> None:
+        sending.set()
+        vtime_manager.sleep(0.01)
+
+    def _scenario() -> None:
+        set_id = scheduler.add(0.1, [ConfigurationMsg310()])
+        assert sending.wait(1)
+        scheduler.remove(set_id)
+
+    simulator.can_node.send.side_effect = _send  # type: ignore
+    run_in_worker(_scenario)
+    assert scheduler.get_num_of_sets() == 0
+
+
+def test_remove_beacons_waits_for_transmission(
+    simulator: FootSwitchSimulator, footswitch: FootSwitch, run_in_worker: Callable
+) -> None:
+    """
+    Test removing a beacon set returns only after its transmission in progress has finished.
+    """
+    sending = TimeEvent()
+    sent: list[int] = []
+    scheduler = footswitch.wired_conn.beacons
+
+    def _send(msg: CanMessage) -> None:
+        sending.set()
+        vtime_manager.sleep(0.01)
+        sent.append(msg.arbitration_id)
+
+    def _scenario() -> list[int]:
+        set_id = scheduler.add(0.1, [ConfigurationMsg310(), ConfigurationMsg311()])
+        assert sending.wait(1)
+        scheduler.remove(set_id)
+        return list(sent)
+
+    simulator.can_node.send.side_effect = _send  # type: ignore
+    assert run_in_worker(_scenario) == [0x310, 0x311]
+    assert sent == [0x310, 0x311]
+
+
+def test_close_stops_beacon_engine(
+    simulator: FootSwitchSimulator, footswitch: FootSwitch
+) -> None:
+    """
+    Test closing the connection stops the worker of the beacon engine.
+    """
+    sending = threading.Event()
+    senders: list[threading.Thread] = []
+
+    def _send(msg: CanMessage) -> None:
+        senders.append(threading.current_thread())
+        sending.set()
+
+    simulator.can_node.send.side_effect = _send  # type: ignore
+    footswitch.wired_conn.enable_beacons(0.1, [ConfigurationMsg310()])
+    assert sending.wait(timeout=5)
+
+    footswitch.wired_conn.close()
+
+    assert footswitch.wired_conn.beacons.get_num_of_sets() == 0
+    assert not senders[0].is_alive()
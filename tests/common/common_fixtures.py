@@ -1,16 +1,25 @@
 from datetime import datetime
 import os
+import tempfile
 import threading
-from typing import Iterator, Type, TypeVar
+from typing import Iterator, List, Type, TypeVar
 import _pytest.fixtures
 
 from framework.support.reports import logger, log
 from framework.simulators.base_simulator import BaseSimulator
+from framework.simulators.grpc_server import GrpcServerConfig
+from framework.support.can_log import CanRecorder
 from framework.support.vtime import vtime_manager
 from framework.support.vtime import get_worker_manager, VirtualTimeWorker
 from framework.support.py_emulator.sut_control import SutControl
 
 TCP_PORT_ARG_NAME = "--rpc-port"
+TIMER_ENGINE_ARG_NAME = "--timer-engine"
+FAST_FORWARD_ARG_NAME = "--vtime-fast-forward"
+CAN_RECORD_ARG_NAME = "--can-record"
+PIPELINED_CAN_TX_ARG_NAME = "--pipelined-can-tx"
+RPC_WORKERS_ARG_NAME = "--rpc-workers"
+RPC_TRANSPORT_ARG_NAME = "--rpc-transport"
 
 T = TypeVar("T", bound=BaseSimulator)
 
@@ -31,6 +40,41 @@ def get_rpc_port(request: _pytest.fixtures.FixtureRequest) -> int:
     return int(request.config.getoption(TCP_PORT_ARG_NAME))
 
 
+def get_unix_socket_path(request: _pytest.fixtures.FixtureRequest) -> str | None:
+    """
+    Get the Unix domain socket path if selected as RPC transport in the command line arguments.
+
+    The path is unique per process, so distributed test execution does not share sockets.
+    """
+    if request.config.getoption(RPC_TRANSPORT_ARG_NAME) != "uds":
+        return None
+    return os.path.join(tempfile.gettempdir(), f"atf_rpc_{os.getpid()}.sock")
+
+
+def attach_can_recorders(
+    request: _pytest.fixtures.FixtureRequest, simulator: BaseSimulator
+) -> List[CanRecorder]:
+    """
+    Attach CAN recorders to CAN drivers of the simulator if requested in the command line arguments.
+
+    Each driver records to `<dir>/<test name>_<driver attribute>.canlog`, logs of a previous run are overwritten.
+    """
+    record_dir = request.config.getoption(CAN_RECORD_ARG_NAME)
+    if record_dir is None:
+        return []
+    os.makedirs(record_dir, exist_ok=True)
+    recorders = []
+    for attribute in ("can_node", "mcan_node"):
+        driver = getattr(simulator, attribute, None)
+        if driver is None:
+            continue
+        driver.recorder = CanRecorder(
+            os.path.join(record_dir, f"{request.node.name}_{attribute}.canlog")
+        )
+        recorders.append(driver.recorder)
+    return recorders
+
+
 def create_simulator(
     request: _pytest.fixtures.FixtureRequest,
     simulator_cls: Type[T],
@@ -40,11 +84,23 @@ def create_simulator(
     """
     log.register_virtual_time_func(vtime_manager.time_ms)
     get_worker_manager().register_worker(VirtualTimeWorker.current_worker())
-    sim = simulator_cls(get_rpc_port(request))
+    sim = simulator_cls(
+        get_rpc_port(request),
+        use_timer_engine=bool(request.config.getoption(TIMER_ENGINE_ARG_NAME)),
+        server_config=GrpcServerConfig(
+            max_workers=int(request.config.getoption(RPC_WORKERS_ARG_NAME)),
+            unix_socket_path=get_unix_socket_path(request),
+        ),
+        fast_forward_timers=bool(request.config.getoption(FAST_FORWARD_ARG_NAME)),
+        pipelined_can_tx=bool(request.config.getoption(PIPELINED_CAN_TX_ARG_NAME)),
+    )
+    recorders = attach_can_recorders(request, sim)
     sim.run()
     yield sim
     get_worker_manager().unregister_worker(VirtualTimeWorker.current_worker())
     sim.stop()
+    for recorder in recorders:
+        recorder.close()
 
 
 def create_emulator(
@@ -77,6 +133,7 @@ def create_emulator(
         emu_close_req_cb=emu_close_request_cb,
         log_file_pathname=emu_log_file_pathname if cmd is not None else "",
         emu_rpc_port=int(simulator.port),
+        emu_rpc_address=simulator.rpc_address,
     )
     if cmd is not None:
         emulator.start()
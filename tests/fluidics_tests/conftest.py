@@ -60,6 +60,7 @@ def fluidics(simulator: FluidicsSimulator) -> Iterator[Fluidics]:
     fluidics.vtime.sleep(0.370)
     logger.info("Emulator initialization is expected to be done")
     yield fluidics
+    fluidics.wired_conn.close()
 
 
 @pytest.fixture(scope="function", autouse=True)
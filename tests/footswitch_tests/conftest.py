@@ -31,7 +31,7 @@ def foot_switch(simulator: FootSwitchSimulator) -> Iterator[FootSwitch]:
     foot_switch.vtime.sleep(0.370)
     logger.info("Emulator initialization is expected to be done")
     yield foot_switch
-    foot_switch.wired_conn.disable_beacons()
+    foot_switch.wired_conn.close()
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -1,12 +1,22 @@
-from typing import Tuple, Iterator
+from typing import Any, Tuple, Iterator
 import re
 import _pytest.config
 import pytest
 
+from framework.support.reports import rpc_stats, set_rpc_log_sampling
 from framework.support.reports.report import TestReport
-
+from framework.support.vtime import vtime_manager
 
 TCP_PORT_ARG_NAME = "--rpc-port"
+TIMER_ENGINE_ARG_NAME = "--timer-engine"
+FAST_FORWARD_ARG_NAME = "--vtime-fast-forward"
+CAN_RECORD_ARG_NAME = "--can-record"
+PIPELINED_CAN_TX_ARG_NAME = "--pipelined-can-tx"
+RPC_WORKERS_ARG_NAME = "--rpc-workers"
+RPC_TRANSPORT_ARG_NAME = "--rpc-transport"
+RPC_LOG_SAMPLING_ARG_NAME = "--rpc-log-sampling"
+RPC_STATS_ARG_NAME = "--rpc-stats"
+RPC_STATS_TOP_ARG_NAME = "--rpc-stats-top"
 
 
 def pytest_addoption(parser: _pytest.config.argparsing.Parser) -> None:
@@ -25,6 +35,71 @@ def pytest_addoption(parser: _pytest.config.argparsing.Parser) -> None:
         help="TCP port used for RPC communication between test framework and emulator",
     )
 
+    parser.addoption(
+        RPC_TRANSPORT_ARG_NAME,
+        action="store",
+        default="tcp",
+        choices=["tcp", "uds"],
+        help="Transport used for RPC communication: TCP port (see --rpc-port) or Unix domain socket",
+    )
+
+    parser.addoption(
+        RPC_WORKERS_ARG_NAME,
+        action="store",
+        default=1,
+        help="Number of threads handling RPC calls from emulator",
+    )
+
+    parser.addoption(
+        RPC_LOG_SAMPLING_ARG_NAME,
+        action="append",
+        default=[],
+        help="Log only every N-th call of RPC method, e.g. PINS_DRV_QuickReadPin=100 (0 disables the method's log)",
+    )
+
+    parser.addoption(
+        RPC_STATS_ARG_NAME,
+        action="store",
+        default=None,
+        help="Record per-RPC call counts and latency histograms and dump them to given JSON file",
+    )
+
+    parser.addoption(
+        RPC_STATS_TOP_ARG_NAME,
+        action="store",
+        default=0,
+        type=int,
+        help="Print table of N RPCs with the highest total duration at the end of the session",
+    )
+
+    parser.addoption(
+        TIMER_ENGINE_ARG_NAME,
+        action="store_true",
+        default=False,
+        help="Run all periodic HW timers on a single shared timer engine worker",
+    )
+
+    parser.addoption(
+        FAST_FORWARD_ARG_NAME,
+        action="store_true",
+        default=False,
+        help="Step through HW timer timeouts waking up no other worker without idling (implies --timer-engine)",
+    )
+
+    parser.addoption(
+        PIPELINED_CAN_TX_ARG_NAME,
+        action="store_true",
+        default=False,
+        help="Queue CAN frames sent to the firmware instead of waiting until the firmware takes each frame",
+    )
+
+    parser.addoption(
+        CAN_RECORD_ARG_NAME,
+        action="store",
+        default=None,
+        help="Directory where CAN traffic of each test is recorded (binary log per CAN driver)",
+    )
+
     parser.addoption(
         "--report-docx",
         action="store",
@@ -33,6 +108,15 @@ def pytest_addoption(parser: _pytest.config.argparsing.Parser) -> None:
     )
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Apply RPC logging configuration from the commandline."""
+    for sampling in config.getoption(RPC_LOG_SAMPLING_ARG_NAME):
+        method_name, _, every_n = sampling.partition("=")
+        set_rpc_log_sampling(method_name.strip(), int(every_n))
+    if config.getoption(RPC_STATS_ARG_NAME) or config.getoption(RPC_STATS_TOP_ARG_NAME):
+        rpc_stats.enable(vtime_manager.time_us)
+
+
 # Pytest hooks for reporting
 
 
@@ -84,3 +168,15 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
         report_path = session.config.getoption("--report-docx")
         if report_path:
             TestReport.generate_report(report_path)
+        stats_path = session.config.getoption(RPC_STATS_ARG_NAME)
+        if stats_path:
+            rpc_stats.dump_json(stats_path)
+
+
+def pytest_terminal_summary(terminalreporter: Any, exitstatus: int) -> None:
+    """Print RPCs with the highest total duration if requested."""
+    top_n = terminalreporter.config.getoption(RPC_STATS_TOP_ARG_NAME)
+    if top_n > 0:
+        terminalreporter.section("RPC statistics")
+        for line in rpc_stats.format_table(top_n):
+            terminalreporter.write_line(line)